@@ -2,16 +2,10 @@
 """CoinMarketCap site data scrapper as Pandas dataframes."""
 import pathlib
 
-from pcmc.core import CoinMarketCap
-
 _CWD = pathlib.Path(__file__).parent  # type: pathlib.Path
 
 PATH_ROOT = _CWD.parent  # type: pathlib.Path
 
-__long_description__ = PATH_ROOT.joinpath('README.md')
-__long_description__.touch(exist_ok=True)
-__long_description__ = __long_description__.read_text(encoding='utf-8')
-
 __project__ = 'pcmc'
 __package__ = 'pcmc'
 __version__ = '0.1.8'
@@ -22,5 +16,19 @@ __description__ = __doc__
 __email__ = 'umpierrez@pm.me'
 __keywords__ = 'api-wrapper coinmarketcap crypto-currencies altcoins altcoin bitcoin exchange data stock finance'
 
+
+def __getattr__(name):
+    # heavy modules (pandas, lxml, ...) are only loaded when "CoinMarketCap" is first accessed
+    if name == 'CoinMarketCap':
+        from pcmc.core import CoinMarketCap
+        return CoinMarketCap
+    # README.md is only read when long description is first accessed (e.g. by setup.py)
+    if name == '__long_description__':
+        readme = PATH_ROOT.joinpath('README.md')
+        globals()[name] = readme.read_text(encoding='utf-8') if readme.is_file() else str()
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 __all__ = ['CoinMarketCap', '__package__', '__description__', '__version__', '__license__', '__author__', '__site__',
            '__project__', '__email__', '__keywords__']
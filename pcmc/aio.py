@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Asyncio client module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pcmc.static as st
+from pcmc.core import CoinMarketCap
+
+
+class AsyncCoinMarketCap:
+    """CoinMarketCap asyncio counterpart.
+
+    Cache, transport, rate limiter, in flight downloads, parsed snapshots and parsing code are shared with
+    CoinMarketCap class. Blocking work (socket I/O, retries backoff and HTML parsing) runs on a bounded executor so
+    the event loop is never blocked and a semaphore limits the amount of concurrent requests.
+    """
+
+    def __init__(self, max_concurrency=8, retries=5, wait_secs=10, verbose=True, executor=None):
+        """AsyncCoinMarketCap constructor.
+
+        :param int max_concurrency: max amount of concurrent requests.
+        :param int retries: max fetch attempts per URL.
+        :param float wait_secs: secs waited between fetch attempts when rate limiting is disabled (otherwise
+                                shared rate limiter backoff delay is used).
+        :param bool verbose: if True fetch errors will be reported to stderr.
+        :param concurrent.futures.Executor executor: executor used for blocking work (a bounded one is created if None).
+        """
+        self.retries = retries
+        self.wait_secs = wait_secs
+        self.verbose = verbose
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._owned = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='pcmc')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Shutdown owned executor."""
+        if self._owned:
+            self._executor.shutdown(wait=False)
+
+    async def _run(self, func, *args):
+        """Run blocking "func(*args)" on executor."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _fetch_url(self, url):
+        """Fetch "url" (non blocking) then return its content after save it on shared cache.
+
+        Downloads go through CoinMarketCap blocking fetch path (on executor), so concurrent requests for the same URL
+        are coalesced with blocking client ones and both share the same rate limiter and retry policy.
+
+        :param str url: URL to fetch.
+        :return str: raw URL content as str (empty str on error).
+        """
+        entry = CoinMarketCap._cache.fresh(url)
+        if entry is not None:
+            return entry['data']
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async with self._semaphore:
+            return await self._run(CoinMarketCap._fetch_url, url, self.retries, None, self.wait_secs, self.verbose)
+
+    async def get_price(self, currency):
+        """Extract USD to "currency" rate from gainers and losers page.
+
+        :param str currency: 3 chars length fiat (or "BTC") currency name.
+        :return float: usd to "currency" exchange rate as float.
+        """
+        return CoinMarketCap._parse_price(await self._fetch_url(st.URL_GAINERS_LOSERS), currency)
+
+    async def get_prices(self, currencies=None):
+        """Extract USD to many currencies rates at once from gainers and losers page.
+
+        :param tp.Iterable[str] currencies: fiat (or "BTC") currency names (all page rates are returned if None).
+        :return dict: upper cased currency name to usd to currency exchange rate dict (NaN for not found ones).
+        """
+        raw = await self._fetch_url(st.URL_GAINERS_LOSERS)
+        return await self._run(CoinMarketCap._parse_prices, raw, currencies)
+
+    async def get_gainers_losers_snapshot(self):
+        """Return gainers and losers page parsed snapshot (page is parsed once per fetched content version).
+
+        :return GainersLosersSnapshot: gainers and losers page snapshot.
+        """
+        raw = await self._fetch_url(st.URL_GAINERS_LOSERS)
+        return await self._run(CoinMarketCap._parse_gainers_losers_snapshot, raw)
+
+    async def gainers_and_losers(self):
+        """Return gainers and losers data as dict with "gainers" and "losers" keys.
+
+        :return tp.Dict: dict with gainers and losers keys containing its respective 1h, 24h and 7d data.
+        """
+        snapshot = await self.get_gainers_losers_snapshot()
+        return dict(gainers=snapshot.gainers, losers=snapshot.losers)
+
+    async def gainers(self, timeframe=None):
+        """Return gainers data as dict with 1h, 24h and 7d keys (or just "timeframe" DataFrame if supplied).
+
+        :param str timeframe: 1h, 24h or 7d.
+        :return: gainers data.
+        """
+        snapshot = await self.get_gainers_losers_snapshot()
+        return snapshot.get('gainers', timeframe) if timeframe else snapshot.gainers
+
+    async def losers(self, timeframe=None):
+        """Return losers data as dict with 1h, 24h and 7d keys (or just "timeframe" DataFrame if supplied).
+
+        :param str timeframe: 1h, 24h or 7d.
+        :return: losers data.
+        """
+        snapshot = await self.get_gainers_losers_snapshot()
+        return snapshot.get('losers', timeframe) if timeframe else snapshot.losers
+
+    async def get_exchange_markets(self, exchange):
+        """Get exchange markets index (built once per fetched exchange page version).
+
+        :param str exchange: exchange name used on request.
+        :return MarketIndex: exchange pairs index.
+        """
+        url = st.URL_EXCHANGES.format(str(exchange).lower())
+        return await self._run(CoinMarketCap._parse_exchange_markets, await self._fetch_url(url), url)
+
+    async def get_exchange_symbols(self, exchange, quote_currency=None):
+        """Get symbol supported by a given exchange (optionally filtered by a base market)
+
+        :param str exchange: exchange name used on request.
+        :param str quote_currency: only symbols matching "quote_currency" value will be returned.
+        :return list: exchange supported symbols as list
+        """
+        return (await self.get_exchange_markets(exchange)).symbols(quote_currency)
+
+    async def get_exchange_currencies(self, exchange):
+        """Get supported currencies by exchange.
+
+        :param str exchange: exchange name used on request.
+        :return list: exchange supported currencies as list.
+        """
+        return (await self.get_exchange_markets(exchange)).currencies
+
+    async def get_markets_by(self, exchange):
+        """Get exchange supported markets as list.
+
+        :param str exchange: exchange name used on request.
+        :return list: exchange supported markets as list.
+        """
+        return (await self.get_exchange_markets(exchange)).markets
+
+    async def iter_exchange_currencies(self, exchanges):
+        """Asynchronously iterate over many exchanges supported currencies as soon as each one is available.
+
+        >>> async def main(cmc):
+        ...     async for exchange, currencies, error in cmc.iter_exchange_currencies(['binance', 'kraken']):
+        ...         print(exchange, error or len(currencies))
+
+        :param tp.Iterable[str] exchanges: exchange names used on requests.
+        :return tp.AsyncIterator[tp.Tuple[str, list, Exception]]: (exchange, currencies, error) tuples where "error"
+                is None on success and "currencies" is None on failure.
+        """
+
+        async def worker(exchange):
+            try:
+                return exchange, await self.get_exchange_currencies(exchange), None
+            except Exception as err:
+                return exchange, None, err
+
+        for future in asyncio.as_completed([worker(ex) for ex in dict.fromkeys(exchanges)]):
+            yield await future
+
+    async def get_exchanges(self, lower_case=False):
+        """Get all exchanges listed on CoinMarketCap.
+
+        :param bool lower_case: if True, exchange names will be lower cased before return.
+        :return list: exchanges listed on CoinMarketCap as list.
+        """
+        raw = await self._fetch_url(st.URL_EXCHANGES.format(''))
+        return await self._run(CoinMarketCap._parse_exchanges, raw, lower_case)
+
+    async def get_all(self):
+        """Get "all currencies" page data as DataFrame indexed by symbol.
+
+        :return pd.DataFrame: all listed currencies data.
+        """
+        if not len(CoinMarketCap._all_currencies):
+            raw, rates = await asyncio.gather(self._fetch_url(st.URL_ALL), self.get_prices(CoinMarketCap._quotes))
+            df = await self._run(CoinMarketCap._parse_all_page, raw, rates)
+            CoinMarketCap._all_currencies = df
+            CoinMarketCap._record('all', df)
+        return CoinMarketCap._all_currencies
+
+    async def get_currency_exchanges(self, currency):
+        """Get exchanges where the supplied currency is currently supported.
+
+        :param str currency: desired currency used for data request.
+        :return list: exchange list where currency is supported as list.
+        """
+        await self.get_all()
+        long_name = CoinMarketCap._currency_names()[str(currency).upper()]
+        raw = await self._fetch_url(st.URL_CURRENCIES.format(long_name.lower()))
+        return await self._run(CoinMarketCap._parse_currency_exchanges, raw)
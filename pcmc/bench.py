@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""Offline benchmarks module.
+
+Run as "python -m pcmc.bench" to time (best of N runs) and measure peak memory (tracemalloc) of the scraping,
+parsing and rendering hot paths over synthetically scaled pages or over a recorded archive ("pcmc --record").
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import argparse
+import contextlib
+import io
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import pcmc.static as st
+from pcmc.core import CoinMarketCap, _parsed_stats
+from pcmc.store import TimeSeriesStore
+from pcmc.utils import clean_numeric, data2num
+
+
+def _gainers_losers_page(rows, rnd):
+    html = ['<html><body><div class="rates" data-usd="1" data-btc="6500.12" data-eth="210.5" data-eur="0.87"></div>']
+    for kind in ['G', 'L']:
+        for timeframe in st.TIMEFRAMES:
+            html.append('<table><thead><tr><th>#</th><th>Name</th><th>Symbol</th><th>Volume (24h)</th><th>Price</th>'
+                        f'<th>% {timeframe}</th></tr></thead><tbody>')
+            for n in range(rows):
+                change = rnd.uniform(1, 50) * (1 if kind == 'G' else -1)
+                html.append(f'<tr><td>{n + 1}</td><td>Coin {kind}{n}</td><td>C{kind}{n}</td>'
+                            f'<td>${rnd.randint(10 ** 3, 10 ** 7):,}</td><td>${rnd.uniform(0.001, 100):.4f}</td>'
+                            f'<td>{change:.2f}%</td></tr>')
+            html.append('</tbody></table>')
+    return ''.join(html + ['</body></html>'])
+
+
+def _all_page(rows, rnd):
+    html = ['<html><body><table id="currencies-all"><thead><tr><th>#</th><th>Name</th><th>Symbol</th>'
+            '<th>Market Cap</th><th>Price</th><th>Circulating Supply</th><th>Volume (24h)</th><th>% 1h</th>'
+            '<th>% 24h</th><th>% 7d</th></tr></thead><tbody>']
+    for n in range(rows):
+        slug, symbol = f'coin-{n}', f'C{"G" if n % 2 else "L"}{n // 2}'
+        mcap, price, volume = rnd.randint(10 ** 5, 10 ** 10), rnd.uniform(0.01, 1000), rnd.randint(0, 10 ** 8)
+        changes = ''.join(f'<td class="percent-change" data-timespan="{tf}" '
+                          f'data-percentusd="{rnd.uniform(-20, 20):.2f}"></td>' for tf in st.TIMEFRAMES)
+        html.append(f'<tr id="id-{slug}"><td>{n + 1}</td><td class="currency-name" data-sort="Coin {n}">'
+                    f'<a class="link-secondary" href="/currencies/{slug}/">Coin {n}</a></td><td>{symbol}</td>'
+                    f'<td class="market-cap" data-sort="{mcap}">${mcap:,}</td>'
+                    f'<td data-sort="{price}"><a class="price" data-usd="{price}">${price:.2f}</a></td>'
+                    f'<td class="circulating-supply" data-sort="{mcap / price}">{mcap / price:,.0f}</td>'
+                    f'<td data-sort="{volume}"><a class="volume" data-usd="{volume}">${volume:,}</a></td>'
+                    f'{changes}</tr>')
+    return ''.join(html + ['</tbody></table></body></html>'])
+
+
+def _exchange_page(rows, rnd):
+    html = ['<html><body><table><thead><tr><th>#</th><th>Currency</th><th>Pair</th><th>Volume (24h)</th>'
+            '<th>Price</th><th>Volume (%)</th></tr></thead><tbody>']
+    for n in range(rows):
+        base, quote = f'C{rnd.choice("GL")}{rnd.randrange(rows)}', rnd.choice(['BTC', 'ETH', 'USDT'])
+        html.append(f'<tr><td>{n + 1}</td><td>{base}</td><td>{base}/{quote}</td><td>$1,000</td><td>$1.0</td>'
+                    f'<td>0.1%</td></tr>')
+    return ''.join(html + ['</tbody></table></body></html>'])
+
+
+def synthetic_pages(scale=1, exchanges=('binance', 'kraken', 'hitbtc'), seed=0):
+    """Return deterministic synthetic site pages as URL to bodies list dict (usable by CoinMarketCap.replay).
+
+    :param int scale: pages rows multiplier (100 rows per gainers / losers table and 2000 currencies at scale 1).
+    :param tp.Iterable[str] exchanges: exchange pages to generate.
+    :param int seed: random generator seed.
+    :return dict: URL to bodies list dict.
+    """
+    rnd = random.Random(seed)
+    exchanges_page = ('<html><body><table><thead><tr><th>#</th><th>Name</th></tr></thead><tbody>' +
+                      ''.join(f'<tr><td>{n}</td><td>{ex.title()}</td></tr>' for n, ex in enumerate(exchanges)) +
+                      '</tbody></table></body></html>')
+    pages = {st.URL_GAINERS_LOSERS: [_gainers_losers_page(100 * scale, rnd)],
+             st.URL_ALL: [_all_page(2000 * scale, rnd)],
+             st.URL_EXCHANGES.format(''): [exchanges_page]}
+    for exchange in exchanges:
+        pages[st.URL_EXCHANGES.format(exchange)] = [_exchange_page(500 * scale, rnd)]
+    return pages
+
+
+def import_time(statement='import pcmc.cli'):
+    """Run "statement" on a new interpreter with "-X importtime" and return its imported modules cumulative times.
+
+    :param str statement: python statement to run.
+    :return dict: imported module name to cumulative import time (secs) dict, in import order.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True,
+                            check=True)
+    times = dict()
+    # "import time: self [us] | cumulative | imported package" lines
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if line.startswith('import time:') and len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1]) / 10 ** 6
+    return times
+
+
+def _parses():
+    """Return amount of page parses done so far by every CoinMarketCap parsed results cache."""
+    return sum(v for k, v in _parsed_stats().items() if k.endswith('_parses'))
+
+
+def _measure(func, repeat, warm=False):
+    """Return (best wall time in secs, peak traced memory in bytes, page parses per call) of "func" calls.
+
+    Every call is a cold one (cached pages and parsed results are discarded before it) unless "warm" is True, in
+    which case caches are filled by an untimed call first and kept between calls.
+    """
+    def prepare():
+        if not warm:
+            CoinMarketCap.reset()
+
+    if warm:
+        func()
+    best = float('inf')
+    for _ in range(repeat):
+        prepare()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    prepare()
+    parses = _parses()
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak, _parses() - parses
+
+
+def numeric_table(rows=10000, seed=0):
+    """Return a synthetic scraped-like text table having one column per static.FIELD_DTYPES field.
+
+    Cells mimic scraped ones ("$1,234.56", "-3.21%", "?", "Low Vol", " 1,234 *") so "clean_numeric" and "data2num"
+    paths can be compared over the same input.
+
+    :param int rows: rows amount.
+    :param int seed: random generator seed.
+    :return pd.DataFrame: object dtype table.
+    """
+    rnd = random.Random(seed)
+    cells = [lambda: f'${rnd.uniform(0, 10 ** 6):,.2f}', lambda: f'{rnd.uniform(-50, 50):.2f}%',
+             lambda: f' {rnd.randint(0, 10 ** 9):,} *', lambda: '?', lambda: 'Low Vol']
+    weights = [40, 40, 15, 3, 2]
+    return pd.DataFrame({f: [rnd.choices(cells, weights)[0]() for _ in range(rows)] for f in st.FIELD_DTYPES})
+
+
+def store_snapshots(days=5, symbols=500, every=15, seed=0):
+    """Return synthetic "all currencies" snapshots as (timestamp, DataFrame) list spanning "days" UTC days.
+
+    :param int days: UTC days amount.
+    :param int symbols: rows per snapshot.
+    :param int every: minutes between snapshots.
+    :param int seed: random generator seed.
+    :return list: (timestamp, symbol indexed DataFrame) tuples list.
+    """
+    rnd = np.random.default_rng(seed)
+    index = pd.Index([f'C{n}' for n in range(symbols)], name='symbol')
+    start = pd.Timestamp('2026-01-01', tz='UTC')
+    snapshots = list()
+    for n in range(days * 24 * 60 // every):
+        data = pd.DataFrame({'usd': rnd.uniform(0.01, 1000, symbols),
+                             'volume24h': rnd.integers(0, 10 ** 8, symbols),
+                             '24h': rnd.uniform(-20, 20, symbols)}, index=index)
+        snapshots.append((start + pd.Timedelta(minutes=every * n), data))
+    return snapshots
+
+
+# benchmarks measuring cache hits (every other one is measured with empty caches)
+_WARM = ['_scrapper (unchanged)']
+
+
+def _cases(exchanges, workdir):
+    """Return benchmark name to (required URLs, callable, processed rows) dict."""
+    from argparse import Namespace
+
+    from pcmc import cli
+
+    cmc = CoinMarketCap
+    numeric = numeric_table()
+    snapshots = store_snapshots()
+    stored = sum(len(data) for _, data in snapshots)
+    ingested = iter(range(10 ** 6))
+    queried = TimeSeriesStore(f'{workdir}/query')
+    queried.append('all', pd.concat([data.assign(timestamp=ts) for ts, data in snapshots]))
+    queried.flush()
+    exchange_urls = [st.URL_EXCHANGES.format(ex) for ex in exchanges]
+
+    def scrapper():
+        cmc._scraps.clear()
+        cmc._scrapper(st.URL_GAINERS_LOSERS)
+
+    def data_handler():
+        rates = cmc.get_prices(cmc._quotes)
+        for table in pd.read_html(cmc._fetch_url(st.URL_GAINERS_LOSERS), match=r'.+'):
+            cmc._data_handler(table, rates)
+
+    def get_all():
+        cmc._all_currencies = pd.DataFrame()
+        cmc._all_pages.clear()
+        cmc.get_all()
+
+    def accessors(reparse=False):
+        # one loop iteration reading every gainers / losers table (page was parsed on every access before snapshots)
+        cmc._snapshots.clear()
+        client = cmc()
+        for kind in ['gainers', 'losers']:
+            for timeframe in st.TIMEFRAMES:
+                if reparse:
+                    cmc._snapshots.clear()
+                getattr(client, f'{kind}_{timeframe}')
+
+    def ingest():
+        # every run writes to a new store (same day partitions would otherwise grow run after run)
+        store = TimeSeriesStore(f'{workdir}/ingest-{next(ingested)}')
+        for ts, data in snapshots:
+            store.append('all', data, ts)
+        store.close()
+
+    def query():
+        # two symbols along one day out of every stored day
+        queried.query('all', ['C1', 'C2'], '2026-01-02', '2026-01-02 23:59:59')
+
+    def render():
+        cmc._snapshots.clear()
+        args = Namespace(timeframe='1h', filter_by=True, exchanges=list(exchanges), loop=0, minvol=0.0, diff=False,
+                         store=None, record=None, replay=None, profile=False, metrics=None, metrics_format='json',
+                         quotes=[], attach=None, screen=None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli.main(args)
+
+    return {
+        '_scrapper': ([st.URL_GAINERS_LOSERS], scrapper, None),
+        '_scrapper (unchanged)': ([st.URL_GAINERS_LOSERS], lambda: cmc._scrapper(st.URL_GAINERS_LOSERS), None),
+        'read_html+_data_handler': ([st.URL_GAINERS_LOSERS], data_handler, None),
+        'get_all': ([st.URL_GAINERS_LOSERS, st.URL_ALL], get_all, None),
+        'get_exchange_symbols': (exchange_urls, lambda: [cmc.get_exchange_symbols(ex) for ex in exchanges], None),
+        'gainers/losers accessors': ([st.URL_GAINERS_LOSERS], accessors, None),
+        'gainers/losers accessors (reparse)': ([st.URL_GAINERS_LOSERS], lambda: accessors(True), None),
+        'cli.main': ([st.URL_GAINERS_LOSERS, st.URL_EXCHANGES.format('')] + exchange_urls, render, None),
+        'clean_numeric': ([], lambda: clean_numeric(numeric), len(numeric)),
+        'data2num': ([], lambda: numeric.apply(lambda col: col.map(data2num)), len(numeric)),
+        'import pcmc.cli': ([], lambda: import_time('import pcmc.cli'), None),
+        'store.append': ([], ingest, stored),
+        'store.query': ([], query, None),
+    }
+
+
+def run(archive=None, scale=1, repeat=3, only=None):
+    """Run benchmarks returning a report DataFrame.
+
+    Benchmarks whose pages are not found in "archive" are skipped.
+
+    :param str archive: recorded zip archive path (synthetic pages are used if None).
+    :param int scale: synthetic pages rows multiplier.
+    :param int repeat: timed runs per benchmark (best one is reported).
+    :param tp.List[str] only: benchmark names subset.
+    :return pd.DataFrame: "secs", "peak_mib", "parses" (page parses per run) and "rows_per_sec" (row processing
+        benchmarks) columns indexed by benchmark name.
+    """
+    replayer = CoinMarketCap.replay(archive if archive else synthetic_pages(scale))
+    recorded = set(replayer.urls)
+    prefix = st.URL_EXCHANGES.format('')
+    exchanges = [u[len(prefix):] for u in recorded if u.startswith(prefix) and len(u) > len(prefix)]
+
+    report = dict()
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, (urls, func, rows) in _cases(sorted(exchanges), workdir).items():
+            if (only and name not in only) or not recorded.issuperset(urls):
+                continue
+            secs, peak, parses = _measure(func, repeat, warm=name in _WARM)
+            report[name] = {'secs': round(secs, 4), 'peak_mib': round(peak / 2 ** 20, 2), 'parses': parses,
+                            'rows_per_sec': round(rows / secs) if rows else float('nan')}
+    report = pd.DataFrame.from_dict(report, orient='index')
+    # integer dtype so rates are not shown through float display format
+    return report.astype({'rows_per_sec': 'Int64'}) if len(report) else report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pcmc offline benchmarks.')
+    parser.add_argument('-a', '--archive', help='Recorded pages zip archive (see "pcmc --record").')
+    parser.add_argument('-s', '--scale', type=int, default=1, help='Synthetic pages rows multiplier.')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Timed runs per benchmark.')
+    parser.add_argument('-o', '--only', nargs='*', help='Benchmark names to run.')
+    args = parser.parse_args(argv)
+    print(run(args.archive, args.scale, args.repeat, args.only))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
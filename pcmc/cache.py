@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""Cache module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import fnmatch
+import hashlib
+import pathlib
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import pcmc.static as st
+
+_REGIONS_RE = re.compile(st.FINGERPRINT_REGIONS, re.IGNORECASE | re.DOTALL)
+
+
+def fingerprint(raw):
+    """Return a hex digest of "raw" page regions parsed data depends on (see static.FINGERPRINT_REGIONS).
+
+    Whole content digest is returned for pages lacking any of these regions.
+
+    >>> table = '<table><tr><td>1</td></tr></table>'
+    >>> fingerprint(f'<p>ad 1</p>{table}') == fingerprint(f'<p>ad 2</p>{table}')
+    True
+
+    :param str raw: page content.
+    :return str: "raw" regions blake2b hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    found = False
+    for match in _REGIONS_RE.finditer(raw or str()):
+        digest.update(match.group().encode('utf-8'))
+        found = True
+    if not found:
+        digest.update((raw or str()).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class MemoryBackend:
+    """In memory LRU cache backend bounded by total stored bytes."""
+
+    def __init__(self, max_bytes=st.CACHE_MAX_BYTES):
+        """MemoryBackend constructor.
+
+        :param int max_bytes: max amount of bytes stored before least recently used entries start to be evicted.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, url):
+        """Return "url" cache entry (None if missing).
+
+        :param str url: cached URL.
+        :return dict: cache entry as dict with "data" and "updated" keys.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url, entry):
+        """Save "entry" as "url" cache entry evicting least recently used entries when size limit is exceeded.
+
+        :param str url: cached URL.
+        :param dict entry: cache entry as dict with "data" and "updated" keys.
+        """
+        with self._lock:
+            self._pop(url)
+            self._entries[url] = entry
+            self.size += sys.getsizeof(entry['data'])
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _pop(self, url):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.size -= sys.getsizeof(entry['data'])
+
+    def clear(self):
+        """Remove every cache entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SqliteBackend:
+    """On disk sqlite cache backend (zlib compressed bodies) shared among processes."""
+
+    def __init__(self, path, max_bytes=st.CACHE_MAX_BYTES * 4):
+        """SqliteBackend constructor.
+
+        :param str path: sqlite database file path (a "pcmc.sqlite" file is used when path is a directory).
+        :param int max_bytes: max amount of compressed bytes stored before oldest entries start to be evicted.
+        """
+        path = pathlib.Path(path).expanduser()
+        if path.is_dir() or not path.suffix:
+            path.mkdir(parents=True, exist_ok=True)
+            path = path.joinpath('pcmc.sqlite')
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        with self._connect() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS pages '
+                         '(url TEXT PRIMARY KEY, updated REAL, size INTEGER, data BLOB)')
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, url):
+        """Return "url" cache entry (None if missing).
+
+        :param str url: cached URL.
+        :return dict: cache entry as dict with "data" and "updated" keys.
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT data, updated FROM pages WHERE url = ?', (url,)).fetchone()
+        if row:
+            return {'data': zlib.decompress(row[0]).decode('utf-8'), 'updated': row[1]}
+
+    def set(self, url, entry):
+        """Save "entry" as "url" cache entry evicting oldest entries when size limit is exceeded.
+
+        :param str url: cached URL.
+        :param dict entry: cache entry as dict with "data" and "updated" keys.
+        """
+        data = zlib.compress(entry['data'].encode('utf-8'))
+        with self._connect() as conn:
+            conn.execute('INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)', (url, entry['updated'], len(data), data))
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM pages').fetchone()[0]
+            while total > self.max_bytes:
+                url, size = conn.execute('SELECT url, size FROM pages ORDER BY updated LIMIT 1').fetchone()
+                conn.execute('DELETE FROM pages WHERE url = ?', (url,))
+                total -= size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every cache entry."""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM pages')
+
+
+class Cache:
+    """URL content cache with per URL class TTLs, hit / miss / eviction counters and optional on disk backend.
+
+    Entries are looked up first on memory and then on disk (if enabled) being promoted to memory when found there.
+    """
+
+    def __init__(self, ttl=None, default_ttl=st.CACHE_DEFAULT_TTL, max_bytes=st.CACHE_MAX_BYTES, path=None):
+        """Cache constructor.
+
+        :param dict ttl: URL (glob pattern) to TTL in secs dict (default: static.CACHE_TTL).
+        :param float default_ttl: TTL in secs for URLs not matching any "ttl" pattern.
+        :param int max_bytes: max amount of bytes stored in memory.
+        :param str path: on disk cache path (disabled if None).
+        """
+        self.ttl = dict(st.CACHE_TTL if ttl is None else ttl)
+        self.default_ttl = default_ttl
+        self.memory = MemoryBackend(max_bytes)
+        self.disk = SqliteBackend(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.unchanged = 0
+        self.changed = 0
+
+    def ttl_for(self, url):
+        """Return TTL in secs for "url" (first matching pattern in "ttl" dict).
+
+        :param str url: URL to get TTL for.
+        :return float: "url" TTL in secs.
+        """
+        for pattern, ttl in self.ttl.items():
+            if fnmatch.fnmatchcase(url, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url):
+        """Return "url" cache entry whatever its age (None if missing).
+
+        :param str url: cached URL.
+        :return dict: cache entry as dict with "data" and "updated" keys.
+        """
+        entry = self.memory.get(url)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(url)
+            if entry is not None:
+                self.memory.set(url, entry)
+        return entry
+
+    def is_fresh(self, url, entry):
+        """Return True if "entry" is younger than "url" TTL.
+
+        :param str url: cached URL.
+        :param dict entry: "url" cache entry.
+        :return bool: True if "entry" is still fresh.
+        """
+        return entry is not None and time.time() - entry.get('updated', 0.0) <= self.ttl_for(url)
+
+    def fresh(self, url):
+        """Return "url" cache entry if it is fresh, otherwise None (hits and misses are counted here).
+
+        :param str url: cached URL.
+        :return dict: fresh cache entry as dict with "data" and "updated" keys or None.
+        """
+        entry = self.get(url)
+        if self.is_fresh(url, entry):
+            self.hits += 1
+            return entry
+        self.misses += 1
+
+    def set(self, url, data):
+        """Save "data" as "url" content and return the new cache entry.
+
+        :param str url: cached URL.
+        :param str data: "url" content.
+        :return dict: cache entry as dict with "data" and "updated" keys.
+        """
+        entry = {'data': data, 'updated': time.time()}
+        previous = self.memory.get(url)
+        if previous is not None and 'fingerprint' in previous:
+            # URL content is parsed by someone, so refetched versions are fingerprinted right away to track changes
+            entry['fingerprint'] = fingerprint(data)
+            if entry['fingerprint'] == previous['fingerprint']:
+                self.unchanged += 1
+            else:
+                self.changed += 1
+        self.memory.set(url, entry)
+        if self.disk is not None:
+            self.disk.set(url, entry)
+        return entry
+
+    def fingerprint(self, url, raw):
+        """Return "url" content "raw" fingerprint (see fingerprint), computed once per cached body.
+
+        :param str url: cached URL.
+        :param str raw: "url" content (as returned by "get" or "set").
+        :return str: "raw" fingerprint.
+        """
+        entry = self.memory.get(url) if url else None
+        if entry is None or entry['data'] is not raw:
+            # not cached (or already replaced) content
+            return fingerprint(raw)
+        if 'fingerprint' not in entry:
+            entry['fingerprint'] = fingerprint(raw)
+        return entry['fingerprint']
+
+    def clear(self):
+        """Remove every cache entry (memory and disk)."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    @property
+    def stats(self):
+        """Cache counters as dict (hits, misses, evictions, entries memory size in bytes, ...)."""
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.memory.evictions + (self.disk.evictions if self.disk else 0),
+                'unchanged': self.unchanged,
+                'changed': self.changed,
+                'entries': len(self.memory),
+                'bytes': self.memory.size}
+
+
+class _Call:
+    """In flight call state shared by its leader and waiting callers."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread safe calls coalescing: concurrent calls sharing a key wait for (and share) a single in flight call.
+
+    When a "stale" value is supplied callers arriving while a call for the same key is in flight get it right away
+    instead of waiting (stale while revalidate).
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self.stale = 0
+        self._calls = dict()
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, stale=None):
+        """Call "func(*args)" unless a call for "key" is already in flight, in that case wait for its result.
+
+        :param key: call identifier (e.g. an URL).
+        :param tp.Callable func: callable to run.
+        :param stale: value returned (without waiting) when a call for "key" is already in flight (ignored if None).
+        :return: "func(*args)" result (or "stale" value).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            elif stale is not None:
+                self.stale += 1
+                return stale
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    @property
+    def stats(self):
+        """Counters as dict (calls actually done, coalesced ones and stale values served)."""
+        return {'calls': self.calls, 'coalesced': self.coalesced, 'stale': self.stale}
@@ -6,25 +6,24 @@
  - GitHub:      https://github.com/havocesp/pcmc
 """
 import argparse
-import collections
+import math
 import sys
 import time
 import warnings
 from datetime import datetime as dt
 
-import pandas as pd
-import term
-
 import pcmc.static as st
-from pcmc import CoinMarketCap
-from pcmc.utils import rg, epoch
 
 warnings.filterwarnings('ignore')
 
 
 def run():
-    cmc = CoinMarketCap()
-    exchanges_list = cmc.get_exchanges(True)
+    # no network I/O nor heavy imports here so "--help" and arguments errors are shown right away (supplied exchanges
+    # are validated later by "main" against exchanges list, which is cached)
+    if sys.argv[1:2] == ['daemon']:
+        return run_daemon(sys.argv[2:])
+    if sys.argv[1:2] == ['serve']:
+        return run_serve(sys.argv[2:])
 
     parser = argparse.ArgumentParser(description='Coinmarketcap.com from CLI.')
 
@@ -39,14 +38,13 @@ def run():
                             action='store_false',
                             help='Show losers related data.')
     parser.add_argument('exchanges',
-                        choices=exchanges_list,
                         metavar='EX',
                         nargs='+',
                         help='Show only currencies supported by supplied exchanges.')
     parser.add_argument('-t', '--timeframe',
                         default='1h',
                         nargs='?',
-                        choices=[],
+                        choices=st.TIMEFRAMES,
                         help='CoinMarketCap valid timeframes are: 1h, 24h, 7d.')
     parser.add_argument('-f', '--filter_by',
                         choices=['gainers', 'losers'],
@@ -65,6 +63,47 @@ def run():
                         default=0.0,
                         nargs='?',
                         const=0.0)
+    parser.add_argument('-s', '--store',
+                        metavar='PATH',
+                        help='Append every refresh scraped data to the local time series store at PATH.')
+    parser.add_argument('--record',
+                        metavar='ARCHIVE',
+                        help='Record every fetched page into ARCHIVE zip file (for later offline replay).')
+    parser.add_argument('--replay',
+                        metavar='ARCHIVE',
+                        help='Replay pages recorded on ARCHIVE zip file instead of fetching coinmarketcap.com.')
+    parser.add_argument('-q', '--quotes',
+                        metavar='QUOTE',
+                        nargs='+',
+                        default=[],
+                        help='Show prices converted to supplied quote currencies too (e.g. "EUR ETH"; BTC is always '
+                             'shown). Set it after exchanges list.')
+    parser.add_argument('-S', '--screen',
+                        metavar='SPEC',
+                        nargs='+',
+                        help='Show "all currencies" rows matching screen specs instead of gainers or losers: '
+                             '"FIELD>=MIN", "FIELD<=MAX", "FIELD=MIN:MAX" (fields: rank, market_cap, volume24h, usd, '
+                             '1h, 24h, 7d, ...), "top=N" and "by=[-]FIELD" (e.g. "market_cap>=1e8 24h=5:50 top=20 '
+                             'by=24h"). Set it after exchanges list.')
+    parser.add_argument('-d', '--diff',
+                        action='store_true',
+                        help='Show price, volume and percent change deltas since previous refresh (loop mode).')
+    parser.add_argument('-a', '--attach',
+                        metavar='BOARD',
+                        nargs='?',
+                        const='',
+                        help='Show snapshots published by "pcmc daemon" on BOARD directory (default board if not '
+                             'supplied) instead of scraping gainers and losers page.')
+    parser.add_argument('-p', '--profile',
+                        action='store_true',
+                        help='Print per stage (fetch, parse, clean, convert, render, ...) time breakdown per refresh.')
+    parser.add_argument('--metrics',
+                        metavar='PATH',
+                        help='Export metrics to PATH file after every refresh.')
+    parser.add_argument('--metrics-format',
+                        choices=['json', 'prometheus'],
+                        default='json',
+                        help='Metrics file format: JSON lines (appended) or Prometheus text (replaced).')
 
     filter_grp.set_defaults(filter_by=True)
     args = parser.parse_args(sys.argv[1:])
@@ -72,11 +111,132 @@ def run():
     main(args)
 
 
+def run_daemon(argv):
+    parser = argparse.ArgumentParser(prog='pcmc daemon',
+                                     description='Refresh coinmarketcap.com pages in background publishing parsed '
+                                                 'snapshots for "pcmc --attach" viewers and local scripts.')
+    parser.add_argument('-b', '--board',
+                        metavar='DIR',
+                        help=f'Snapshots board directory (default: "{st.DAEMON_ENV}" environment var or a /dev/shm '
+                             f'directory).')
+    parser.add_argument('-g', '--gainers-period',
+                        type=float,
+                        default=st.DAEMON_PERIODS['gainers_losers'],
+                        help='Gainers and losers page refresh period in secs.')
+    parser.add_argument('-A', '--all-period',
+                        type=float,
+                        default=st.DAEMON_PERIODS['all'],
+                        help='All currencies page refresh period in secs (0 to disable).')
+    parser.add_argument('-q', '--quotes',
+                        metavar='QUOTE',
+                        nargs='+',
+                        default=[],
+                        help='Publish prices converted to supplied quote currencies too (BTC is always included).')
+    parser.add_argument('-x', '--exchanges',
+                        metavar='EX',
+                        nargs='+',
+                        default=[],
+                        help='Publish supplied exchanges supported currencies too (so "pcmc --attach" viewers of them '
+                             'do not scrape exchange pages).')
+    parser.add_argument('-E', '--exchanges-period',
+                        type=float,
+                        default=st.DAEMON_EXCHANGES_PERIOD,
+                        help='Exchanges list and exchange pages refresh period in secs.')
+    parser.add_argument('-s', '--store',
+                        metavar='PATH',
+                        help='Append every refresh scraped data to the local time series store at PATH.')
+    args = parser.parse_args(argv)
+
+    from pcmc.daemon import Daemon
+
+    periods = {'gainers_losers': args.gainers_period, 'all': args.all_period, 'exchanges': args.exchanges_period}
+    daemon = Daemon(args.board, periods, args.quotes, args.exchanges)
+    if args.store:
+        daemon.cmc.set_store(args.store)
+    print(f' - Publishing snapshots on {daemon.board.path} (Ctrl-C to exit)', file=sys.stderr)
+    try:
+        daemon.run()
+    finally:
+        # flush buffered rows (store may have been set by "--store" or by environment var)
+        daemon.cmc.set_store(None)
+
+
+def run_serve(argv):
+    parser = argparse.ArgumentParser(prog='pcmc serve',
+                                     description='Serve coinmarketcap.com data as JSON (or Arrow IPC) over a local '
+                                                 'HTTP API shared by any amount of clients.')
+    parser.add_argument('-H', '--host',
+                        default=st.SERVE_HOST,
+                        help='Listening address.')
+    parser.add_argument('-P', '--port',
+                        type=int,
+                        default=st.SERVE_PORT,
+                        help='Listening port.')
+    parser.add_argument('-g', '--gainers-period',
+                        type=float,
+                        default=st.DAEMON_PERIODS['gainers_losers'],
+                        help='Gainers and losers page refresh period in secs.')
+    parser.add_argument('-A', '--all-period',
+                        type=float,
+                        default=st.DAEMON_PERIODS['all'],
+                        help='All currencies page refresh period in secs (0 to refresh it on first request only).')
+    parser.add_argument('-q', '--quotes',
+                        metavar='QUOTE',
+                        nargs='+',
+                        default=[],
+                        help='Serve prices converted to supplied quote currencies too (BTC is always included).')
+    parser.add_argument('--replay',
+                        metavar='ARCHIVE',
+                        help='Replay pages recorded on ARCHIVE zip file instead of fetching coinmarketcap.com.')
+    parser.add_argument('-v', '--verbose',
+                        action='store_true',
+                        help='Log every request to stderr.')
+    args = parser.parse_args(argv)
+
+    from pcmc.server import Api, serve
+
+    api = Api({'gainers_losers': args.gainers_period, 'all': args.all_period}, args.quotes)
+    if args.replay:
+        api.cmc.replay(args.replay)
+    serve(args.host, args.port, api, args.verbose)
+
+
 # noinspection PyUnusedFunction
 def main(args):
+    from pcmc import CoinMarketCap
+    from pcmc.metrics import REGISTRY, breakdown
+    from pcmc.render import Column, Screen, TableRenderer
+
     timeframe = args.timeframe if args.timeframe in st.TIMEFRAMES else '1h'
-    filter_by = args.filter_by if args.filter_by in ['losers', 'gainers'] else 'gainers'
-    columns = ['symbol', 'volume24h', 'usd', 'btc', timeframe]
+    filter_by = 'losers' if args.filter_by in [False, 'losers'] else 'gainers'
+    quotes = [q.lower() for q in dict.fromkeys(['BTC'] + [str(q).upper() for q in args.quotes])]
+    screener = None
+
+    if args.screen:
+        from pcmc.screen import Screener
+        from pcmc.utils import quote_column
+
+        # "all currencies" numeric columns (quote converted ones included)
+        fields = list(st.FIELD_DTYPES) + [quote_column(f, q) for f in st.QUOTE_FIELDS for q in quotes]
+        try:
+            screener = Screener.parse(args.screen, fields).on(args.exchanges)
+        except ValueError as err:
+            sys.exit(f'pcmc: error: argument -S/--screen: {str(err)}')
+        # min volume is exclusive (as on gainers / losers tables) while screen ranges are inclusive (volume is integer)
+        screener = screener.where('volume24h', lower=math.floor(args.minvol * 1000.0) + 1)
+        # change column shown (and diffed) is the ranked one
+        timeframe = screener.by if screener.by in st.TIMEFRAMES else timeframe
+
+    columns = ['symbol', 'volume24h', 'usd'] + quotes + [timeframe]
+
+    if screener is not None:
+        columns.insert(1, 'market_cap')
+        if screener.by and screener.by not in columns:
+            # rows are ranked by a field not shown by default (e.g. "rank" or "circulating")
+            columns.insert(1, screener.by)
+
+    if args.diff:
+        columns.extend(['usd_diff', 'volume24h_diff', f'{timeframe}_diff', 'status'])
 
     if len(args.exchanges) > 1:
         columns.append('exchanges')
@@ -84,61 +244,174 @@ def main(args):
     rename = dict.fromkeys(columns)
 
     for col in columns:
-        rename[col] = f'% {col.upper()}' if col in st.TIMEFRAMES else col.title()
+        name = col[:-5] if col.endswith('_diff') else col
+        name = f'% {name.upper()}' if name in st.TIMEFRAMES else name.replace('_', ' ').title()
+        rename[col] = f'Δ {name}' if col.endswith('_diff') else name
 
+    # column to (format spec, style) dict (see render.Column)
+    specs = {'rank': ('{:>5.0f}', None),
+             'circulating': ('{:>17,.0f}', None),
+             'market_cap': ('{:>17,.0f} $', None),
+             'volume24h': ('{:>13,.0f} $', None),
+             'usd': ('{:>9,.3f} $', 'bold'),
+             **{q: ('{:>12.8g}', None) for q in quotes},
+             'btc': ('{:>12.8f}', None),
+             timeframe: ('{:>+7.2f} %', 'sign'),
+             'usd_diff': ('{:>+12,.3f}', 'sign'),
+             'volume24h_diff': ('{:>+12,.3f}', 'sign'),
+             f'{timeframe}_diff': ('{:>+7.2f} %', 'sign'),
+             'status': ('{:>7}', None),
+             'exchanges': (f'{{:>{len(",".join(args.exchanges))}}}', None)}
+    # any other numeric field (e.g. screened by a quote converted volume) gets a generic format
+    table = TableRenderer([Column(col, rename[col], *specs.get(col, ('{:>14,.6g}', None))) for col in columns[1:]])
+    screen = Screen()
+    REGISTRY.collect('render', lambda: dict(formatted=table.formatted, reused=table.reused, redrawn=screen.redrawn,
+                                            skipped=skipped))
+
+    # last rendered data version and its table lines (refreshes whose data version did not change are not rendered)
+    rendered, skipped = (None, []), 0
     cmd_data = None
     user_exit = False
-
-    snapshots = collections.OrderedDict()
+    # first refresh breakdown includes exchanges list and index setup
+    spans, started = REGISTRY.spans(), time.perf_counter()
 
     cmc = CoinMarketCap()
 
-    # per exchange currencies supported
-    exchange_currencies = {ex: cmc.get_exchange_currencies(ex) for ex in args.exchanges}
-    # sorted and unique list of currencies
-    all_currencies = list(sorted(set(sum(list(exchange_currencies.values()), []))))
+    if args.replay:
+        cmc.replay(args.replay)
+    elif args.record:
+        cmc.record(args.record)
 
-    while args.loop or cmd_data is None:
-        try:
-            data = cmc.gainers if filter_by is True else cmc.losers
-            if data:
-                data = data.get(timeframe)
-                data = data.set_index('symbol')  # type: pd.DataFrame
-                data.index.name = 'Symbol'
-            else:
-                continue
-
-            snapshots.update({epoch(True): data.copy(True)})
-            print(data.head())
-            data = data.query(f'volume24h > {args.minvol * 1000.0}')
-            print(data.head())
-            data['btc'] = data['btc'].apply(lambda x: '{: >12.8f}'.format(x))
-
-            data[timeframe] = data[timeframe].apply(lambda x: rg(float(x), '{: >+7.2f} %'))
-            data['usd'] = data['usd'].apply(lambda x: term.format('{: >9,.3f}'.format(float(x)) + ' $', term.bold))
-            data['volume24h'] = data['volume24h'].apply(lambda x: str(format(float(x), ' >12,.0f') + ' $').rjust(15))
-
-            final = data[[c in all_currencies for c in data.index]]
-
-            exchanges_fmt = lambda s: [e.upper() for e in args.exchanges if s in exchange_currencies[e]]
-            final['exchanges'] = [','.join(exchanges_fmt(s)) for s in final.index]
-            final = final[columns[1:]].rename(rename, axis=1)
-
-            print(final)
-            hour = f'{dt.now():%H:%M:%S}'
-            print(f'  {str("=" * 38)} {hour} {str("=" * 38)}  ')
-        except IndexError as err:
-            user_exit = True
-            raise err
-        except KeyboardInterrupt:
-            user_exit = True
-        except Exception as err:
-            user_exit = True
-            raise err
-
-        finally:
-            if not user_exit:
-                if args.loop > 0:
-                    time.sleep(args.loop)
+    board = ring = None
+    if args.attach is not None:
+        from pcmc.daemon import SnapshotBoard, read_exchanges
+
+        board = SnapshotBoard(args.attach or None)
+
+    # exchanges list published by "pcmc daemon" is used when attached (scraped if it was not published yet)
+    exchanges_list = read_exchanges(board) if board is not None else None
+    exchanges_list = cmc.get_exchanges(True) if exchanges_list is None else exchanges_list
+    invalid = [ex for ex in args.exchanges if exchanges_list and ex not in exchanges_list]
+    if invalid:
+        sys.exit(f'pcmc: error: argument EX: invalid choice: {", ".join(invalid)}')
+
+    if args.store:
+        cmc.set_store(args.store)
+
+    cmc.set_quotes(quotes)
+
+    if args.diff:
+        from pcmc.snapshot import SnapshotRing
+
+        # deltas are computed from rendered frames themselves (no extra page fetch nor parse)
+        ring = SnapshotRing()
+
+    # symbol to exchanges index (exchange pages are fetched concurrently)
+    if board is not None:
+        from pcmc.daemon import read_exchange_currencies
+        from pcmc.index import ExchangeIndex
+
+        # only exchanges not tracked by "pcmc daemon" are scraped
+        results, failures = read_exchange_currencies(board, args.exchanges)
+        missing = [ex for ex in dict.fromkeys(args.exchanges) if ex not in results and ex not in failures]
+        scraped, errors = cmc.get_exchange_currencies_many(missing) if missing else (dict(), dict())
+        results.update(scraped)
+        failures.update(errors)
+        index = ExchangeIndex({ex: results[ex] for ex in dict.fromkeys(args.exchanges) if ex in results}, failures)
+    else:
+        index = cmc.get_exchange_index(args.exchanges)
+    for ex, err in index.failures.items():
+        print(f' - {ex} currencies could not be retrieved: {str(err)}', file=sys.stderr)
+
+    deadline = time.monotonic()
+
+    try:
+        while args.loop or cmd_data is None:
+            started = started or time.perf_counter()
+            try:
+                if screener is not None:
+                    # exchanges membership, volume and ranges are screened before top N rows selection
+                    data = cmc.screen(screener, refresh=True, index=index)
+                    version = screener.evaluations
+                elif board is not None:
+                    shared = board.read(f'{filter_by}_{timeframe}')
+                    if shared is None:
+                        print(f' - Waiting for "pcmc daemon" snapshots on {board.path}', file=sys.stderr)
+                        continue
+                    version = shared.digest
                 else:
-                    break
+                    snapshot = cmc.get_gainers_losers_snapshot()
+                    version = snapshot.digest
+
+                with REGISTRY.span('render'):
+                    if version is not None and version == rendered[0]:
+                        # page tables did not change since last refresh so neither did table lines
+                        lines = list(rendered[1])
+                        skipped += 1
+                    else:
+                        if board is not None:
+                            data = shared.frame()
+                            data = data.assign(**{q: float('nan') for q in quotes if q not in data.columns})
+                        elif screener is None:
+                            data = snapshot.get(filter_by, timeframe)
+                            if data is None:
+                                continue
+                            data = data.set_index('symbol')
+
+                        if args.diff:
+                            delta = ring.push(data, version)
+                            data = data.join(delta.fillna({c: 0.0 for c in delta.columns if c.endswith('_diff')}))
+                            left = delta.index[delta['status'] == 'left']
+
+                        data = data[(data['volume24h'] > args.minvol * 1000.0).to_numpy(dtype=bool, na_value=False)]
+                        final = data[index.isin(data.index)]
+                        final = final.assign(exchanges=index.labels(final.index).to_numpy())
+
+                        # only new or changed rows are formatted and only changed terminal lines are redrawn
+                        lines = table.render(final)
+                        if args.diff and len(left):
+                            lines.append(f' - Left the list: {", ".join(left)}')
+                        rendered = (version, list(lines))
+
+                    if board is not None:
+                        lines.append(f' - Snapshot age: {shared.age:.0f} secs{" (stale)" if shared.stale else ""}')
+                    hour = f'{dt.now():%H:%M:%S}'
+                    lines.append(f'  {str("=" * 38)} {hour} {str("=" * 38)}  ')
+                    screen.draw(lines)
+
+                if args.profile:
+                    elapsed = time.perf_counter() - started
+                    stages = [f'{name} {secs:.3f}s ({calls})'
+                              for name, calls, secs in breakdown(spans, REGISTRY.spans())]
+                    screen.note(f' - Profile: {" | ".join(stages + [f"total {elapsed:.3f}s"])}')
+                if args.metrics:
+                    REGISTRY.export(args.metrics, args.metrics_format)
+                # next refresh wall time is measured from loop start (sleep time excluded)
+                spans, started = REGISTRY.spans(), None
+            except IndexError as err:
+                user_exit = True
+                raise err
+            except KeyboardInterrupt:
+                user_exit = True
+                break
+            except Exception as err:
+                user_exit = True
+                raise err
+
+            finally:
+                if not user_exit:
+                    if args.loop > 0:
+                        # fixed rate refresh (fetch, parse and render time does not add to refresh period)
+                        deadline = max(deadline + args.loop, time.monotonic())
+                        try:
+                            time.sleep(max(0.0, deadline - time.monotonic()))
+                        except KeyboardInterrupt:
+                            # Ctrl-C while waiting for next refresh
+                            user_exit = True
+                            break
+                    else:
+                        break
+    finally:
+        # flush buffered rows (also when leaving by Ctrl-C or an error and when store was set by environment var)
+        cmc.set_store(None)
+
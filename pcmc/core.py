@@ -5,20 +5,47 @@
  - Created:     05-10-2018
  - GitHub:      https://github.com/havocesp/pcmc
 """
+import atexit
+import math
+import os
 import re
 import typing as tp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-import bs4
 import pandas as pd
 
 import pcmc.static as st
-from pcmc.utils import data2num, epoch, get_url, pandas_settings, str_subs
+from pcmc import metrics
+from pcmc.cache import Cache, SingleFlight
+from pcmc.index import ExchangeIndex, MarketIndex
+from pcmc.parsers import parse_currency_markets, read_all_chunks
+from pcmc.ratelimit import RateLimiter
+from pcmc.replay import Recorder, Replayer
+from pcmc.schema import compact
+from pcmc.snapshot import GainersLosersSnapshot, ParsedCache, SnapshotRing
+from pcmc.store import TimeSeriesStore
+from pcmc.transport import Transport
+from pcmc.utils import clean_numeric, convert_quotes, get_url, pandas_settings
 
 pandas_settings()
 
-_STRIP = '@12345677890'
-_PATTERN = r'data-{}.+"[0-9]+([\.][0-9])*["]'
-_REPLACE = ('\n\n', '@'), ('\n',), ('?', '0'), (',',), ('$',), ('*',)
+
+def _rates_key(rates):
+    """Return "rates" dict as hashable items usable as parsed results cache key.
+
+    Unknown currencies NaN rates become None (NaN never equals itself, so keys holding it would never match).
+
+    >>> _rates_key({'BTC': 6500.0, 'XYZ': float('nan')}) == _rates_key({'BTC': 6500.0, 'XYZ': float('nan')})
+    True
+
+    :param dict rates: quote currency to USD rate dict.
+    :return tp.Tuple[tp.Tuple[str, float]]: (currency, rate or None) items.
+    """
+    return tuple((c, r if math.isfinite(r) else None) for c, r in rates.items())
+
+
+# every "data-<currency>" numeric attribute (first occurrence of each currency holds its USD rate)
+_RATES_RE = re.compile(r'data-([a-z]+)="([0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?)"')
 
 
 # noinspection PyUnusedFunction,PySameParameterValue
@@ -34,23 +61,129 @@ class CoinMarketCap:
     False
     """
     _all_currencies = pd.DataFrame()
-    _cache = dict()
+    _cache = Cache(path=os.environ.get(st.CACHE_ENV))
+    _transport = Transport()
+    _flight = SingleFlight()
+    _limiter = RateLimiter()
+    _snapshots = ParsedCache()
+    _rates = ParsedCache()
+    _markets = ParsedCache(maxsize=64)
+    _all_pages = ParsedCache(maxsize=2)
+    _scraps = ParsedCache(maxsize=16)
+    _quotes = list(st.QUOTES)
+    _history = dict()
+    _store = TimeSeriesStore(os.environ[st.STORE_ENV]) if os.environ.get(st.STORE_ENV) else None
 
     @classmethod
-    def _fetch_url(cls, url, retries=5):
+    def _fetch_url(cls, url, retries=5, timeout=None, wait_secs=10, verbose=True):
         """Fetch url then return its content (after save it on cache).
 
+        Concurrent cache misses for the same URL share a single download, and while it is in flight any other caller
+        gets the previously cached content (if any) right away.
+
         :param str url: URL to fetch.
+        :param int retries: max fetch attempts.
+        :param float timeout: socket timeout in secs.
+        :param float wait_secs: sleep time in secs between fetch attempts when rate limiting is disabled.
+        :param bool verbose: if True fetch errors will be reported to stderr.
         :return str: raw URL content as str.
         """
-        if url not in cls._cache or epoch() - cls._cache.get(url).get('updated', 0.0) > 3:
-            cls._cache.update({
-                url: {
-                    'data': get_url(url, retries, 10),
-                    'updated': epoch()
-                }
-            })
-        return cls._cache[url]['data']
+        entry = cls._cache.fresh(url)
+        if entry is None:
+            stale = cls._cache.get(url)
+            return cls._flight.do(url, cls._download, url, retries, timeout, wait_secs, verbose,
+                                  stale=stale and stale['data'])
+        return entry['data']
+
+    @classmethod
+    def _download(cls, url, retries=5, timeout=None, wait_secs=10, verbose=True):
+        """Download url content and save it on cache (unless a fresh copy has just been saved by another caller).
+
+        :param str url: URL to fetch.
+        :param int retries: max fetch attempts.
+        :param float timeout: socket timeout in secs.
+        :param float wait_secs: sleep time in secs between fetch attempts when rate limiting is disabled.
+        :param bool verbose: if True fetch errors will be reported to stderr.
+        :return str: raw URL content as str (empty str on failure).
+        """
+        entry = cls._cache.get(url)
+        if cls._cache.is_fresh(url, entry):
+            return entry['data']
+        with metrics.span('fetch'):
+            data = get_url(url, retries, wait_secs, verbose, transport=cls._transport, timeout=timeout,
+                           limiter=cls._limiter)
+        # only actual page bodies are cached (failed fetches are retried on next call)
+        return cls._cache.set(url, data)['data'] if data else str()
+
+    @classmethod
+    def set_store(cls, store):
+        """Set time series store where every newly parsed page data will be appended (disabled if None).
+
+        Previously set store (if any) is closed, so its buffered rows are flushed to disk.
+
+        :param store: TimeSeriesStore instance or store root directory path.
+        """
+        if cls._store is not None and cls._store is not store:
+            cls._store.close()
+        if store is not None and not isinstance(store, TimeSeriesStore):
+            store = TimeSeriesStore(store)
+        cls._store = store
+
+    @classmethod
+    def set_quotes(cls, quotes):
+        """Set quote currencies whose converted price and volume columns are added to scraped data.
+
+        :param tp.Iterable[str] quotes: quote currency names (BTC is always included).
+        """
+        cls._quotes = list(dict.fromkeys(['BTC'] + [str(q).upper() for q in quotes or []]))
+        # "all currencies" data is parsed once, so it must be parsed again for new quotes
+        cls._all_currencies = pd.DataFrame()
+
+    @classmethod
+    def record(cls, path):
+        """Record every page fetched from now on into "path" zip archive (see replay.Recorder).
+
+        :param str path: zip archive path.
+        :return Recorder: recording transport.
+        """
+        cls._transport = Recorder(path, cls._transport)
+        return cls._transport
+
+    @classmethod
+    def replay(cls, source):
+        """Serve pages from a recorded archive (or from an URL to bodies dict) instead of fetching them.
+
+        Rate limiting is disabled and every parsed data is discarded, so replay sessions are deterministic. Replayed
+        pages are cached on a private in memory cache, so configured cache (which may be an on disk one shared with
+        other processes) is neither cleared nor filled with recorded pages.
+
+        :param source: zip archive path (as saved by "record") or URL to recorded bodies list dict.
+        :return Replayer: replaying transport.
+        """
+        cls._transport = source if isinstance(source, Replayer) else (
+            Replayer(source) if isinstance(source, dict) else Replayer.load(source))
+        cls._limiter = None
+        cls._cache = Cache()
+        cls.reset()
+        return cls._transport
+
+    @classmethod
+    def reset(cls):
+        """Discard every cached page, parsed snapshot, "all currencies" data and diff history."""
+        cls._cache.clear()
+        cls._snapshots.clear()
+        cls._rates.clear()
+        cls._markets.clear()
+        cls._all_pages.clear()
+        cls._scraps.clear()
+        cls._history.clear()
+        cls._all_currencies = pd.DataFrame()
+
+    @classmethod
+    def _record(cls, dataset, data):
+        """Append "data" to time series store "dataset" (if a store has been set)."""
+        if cls._store is not None and data is not None and len(data):
+            cls._store.append(dataset, data)
 
     @classmethod
     def _scrapper(cls, url, match=None):
@@ -61,35 +194,118 @@ class CoinMarketCap:
         :param tp.AnyStr url: CoinMarketCap URL (including endpoint)
         :return tp.List[pd.DataFrame]: list of pandas DatFrame instances (one per table tag found in "url")
         """
-        # cache data is considered as expired when its older than 3 secs
+        # cache data is considered as expired when its older than URL TTL (see static.CACHE_TTL)
         raw = cls._fetch_url(url)
-        df_list = pd.read_html(raw, match=match or r'.+')  # type: pd.DataFrame
+        rates = _rates_key(cls.get_prices(cls._quotes))
+        # refetched pages whose tables did not change are not parsed again (copies are returned as callers may modify)
+        result = cls._scraps.get(raw, cls._scrap, match or r'.+', rates, digest=cls._cache.fingerprint(url, raw))
+        return [df.copy() for df in result] if isinstance(result, list) else result.copy()
+
+    @classmethod
+    def _scrap(cls, raw, digest, match, rates):
+        """Parse and process every "raw" page table matching "match" (see _scrapper).
+
+        :param str raw: page raw content.
+        :param str digest: "raw" content fingerprint (unused, see snapshot.ParsedCache).
+        :param str match: tables matching regex.
+        :param tp.Tuple[tp.Tuple[str, float]] rates: quote currency to USD rate items.
+        :return: processed DataFrame (or DataFrames list if many tables were found).
+        """
+        with metrics.span('parse'):
+            df_list = pd.read_html(raw, match=match)  # type: pd.DataFrame
 
         if len(df_list) > 1:
-            return [cls._data_handler(tbl) for idx, tbl in enumerate(df_list)]
+            return [cls._data_handler(tbl, dict(rates)) for idx, tbl in enumerate(df_list)]
         elif len(df_list):
-            return cls._data_handler(df_list[0])
+            return cls._data_handler(df_list[0], dict(rates))
         else:
             return list()
 
     @classmethod
-    def _data_handler(cls, data):
+    def _data_handler(cls, data, rates=None):
         """Do some data processing with columns (formatting, currency conversion, remove unnecessary data, ...)
 
         :param pd.DataFrame data: DataFrame to be processed.
+        :param dict rates: quote currency to USD rate dict (current quotes rates are fetched from site if None).
         :return pd.DataFrame: resulting data.
         """
 
         # infer 1h, 24h or 7d timeframe from column name ending in "h" or "d" and then remove "%" char
         timeframe = [c[2:] for c in data.columns if c[-1] in ['h', 'd']]
 
-        data = data.drop('#', axis=1)
-        data = data.rename(index=str, columns=st.NEW_NAMES)
-        data = data.applymap(data2num)
-        # USD price to BTC conversion
-        data['btc'] = data['usd'] / cls.get_price('BTC')
+        rates = rates or cls.get_prices(cls._quotes)
+
+        with metrics.span('clean'):
+            data = data.drop('#', axis=1)
+            data = data.rename(index=str, columns=st.NEW_NAMES)
+            data = clean_numeric(data)
 
-        return data[st.GAINERS_LOSERS_FIELDS + timeframe]
+        with metrics.span('convert'):
+            # USD price and volume to every quote currency conversion
+            data = data[[f for f in st.GAINERS_LOSERS_FIELDS if f in data.columns] + timeframe]
+            return compact(convert_quotes(data, rates))
+
+    @classmethod
+    def _parse_gainers_losers(cls, raw, digest, quotes=tuple(st.QUOTES)):
+        """Parse gainers and losers page "raw" content into an immutable snapshot.
+
+        :param str raw: gainers and losers page raw content.
+        :param str digest: "raw" content fingerprint.
+        :param tp.Tuple[str] quotes: quote currencies whose converted columns are added.
+        :return GainersLosersSnapshot: parsed snapshot.
+        """
+        # quote rates are extracted once per page version and shared by every table
+        rates = cls._parse_prices(raw, quotes)
+        with metrics.span('parse'):
+            tables = pd.read_html(raw, match=r'.+')
+        snapshot = GainersLosersSnapshot(digest, [cls._data_handler(tbl, rates) for tbl in tables])
+
+        if cls._store is not None:
+            for kind in ['gainers', 'losers']:
+                for timeframe in st.TIMEFRAMES:
+                    cls._record(f'{kind}_{timeframe}', snapshot.get(kind, timeframe))
+            cls._record('rates', pd.DataFrame({'symbol': list(rates), 'usd': list(rates.values())}))
+
+        return snapshot
+
+    @classmethod
+    def get_gainers_losers_snapshot(cls):
+        """Return gainers and losers page parsed snapshot (page is parsed once per fetched content version).
+
+        :return GainersLosersSnapshot: gainers and losers page snapshot.
+        """
+        return cls._parse_gainers_losers_snapshot(cls._fetch_url(st.URL_GAINERS_LOSERS))
+
+    @classmethod
+    def _parse_gainers_losers_snapshot(cls, raw):
+        """Return gainers and losers page "raw" content snapshot (page is only parsed when its tables change).
+
+        :param str raw: gainers and losers page raw content.
+        :return GainersLosersSnapshot: gainers and losers page snapshot.
+        """
+        digest = cls._cache.fingerprint(st.URL_GAINERS_LOSERS, raw)
+        return cls._snapshots.get(raw, cls._parse_gainers_losers, tuple(cls._quotes), digest=digest)
+
+    @classmethod
+    def get_diff(cls, kind='gainers', timeframe='1h'):
+        """Return per symbol deltas of "kind" data for "timeframe" between current and previous fetched page version.
+
+        Every call tracks current page version on a bounded snapshots ring (one per "kind" and "timeframe") so deltas
+        are computed incrementally (repeated calls over the same page version return the same deltas).
+
+        :param str kind: "gainers" or "losers".
+        :param str timeframe: 1h, 24h or 7d.
+        :return pd.DataFrame: symbol indexed "<column>_diff" deltas plus "status" column ("entered", "left" or "").
+        """
+        snapshot = cls.get_gainers_losers_snapshot()
+        data = snapshot.get(kind, timeframe)
+        data = pd.DataFrame(columns=st.GAINERS_LOSERS_FIELDS) if data is None else data
+        ring = cls._history.setdefault((kind, timeframe), SnapshotRing())
+        return ring.push(data.set_index('symbol'), snapshot.digest)
+
+    def _snapshot_frame(self, kind, timeframe):
+        data = self.get_gainers_losers_snapshot().get(kind, timeframe)
+        return pd.DataFrame() if data is None else data
 
     @property
     def gainers_and_losers(self):
@@ -97,10 +313,8 @@ class CoinMarketCap:
 
         :return tp.Dict: dict with gainers and losers keys containing its respective data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS)
-        gainers = {'1h': data[0], '24h': data[1], '7d': data[2]}
-        losers = {'1h': data[3], '24h': data[4], '7d': data[5]}
-        return dict(gainers=gainers, losers=losers)
+        snapshot = self.get_gainers_losers_snapshot()
+        return dict(gainers=snapshot.gainers, losers=snapshot.losers)
 
     @property
     def gainers(self):
@@ -108,7 +322,7 @@ class CoinMarketCap:
 
         :return dict: gainers data as dict with 1h, 24h and 7d keys with respective data as DataFrames.
         """
-        return self.gainers_and_losers['gainers']
+        return self.get_gainers_losers_snapshot().gainers
 
     @property
     def losers(self):
@@ -116,7 +330,7 @@ class CoinMarketCap:
 
         :return dict: losers data as dict with 1h, 24h and 7d keys with respective data as DataFrames.
         """
-        return self.gainers_and_losers['losers']
+        return self.get_gainers_losers_snapshot().losers
 
     @property
     def gainers_1h(self):
@@ -127,8 +341,7 @@ class CoinMarketCap:
 
         :return pd.DataFrame: a DataFrame instance with last hour (1h) gainers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 1h')
-        return data[0] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('gainers', '1h')
 
     @property
     def gainers_24h(self):
@@ -136,8 +349,7 @@ class CoinMarketCap:
 
         :return pd.DataFrame: a DataFrame instance with last day (24h) gainers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 24h')
-        return data[0] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('gainers', '24h')
 
     @property
     def gainers_7d(self):
@@ -145,8 +357,7 @@ class CoinMarketCap:
 
         :return pd.DataFrame: a DataFrame instance with last week (7d) gainers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 7d')
-        return data[0] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('gainers', '7d')
 
     @property
     def losers_1h(self):
@@ -154,18 +365,15 @@ class CoinMarketCap:
 
         :return pd.DataFrame: a DataFrame instance with last hour (1h) losers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 1h')
-        return data[-1] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('losers', '1h')
 
-    #
     @property
     def losers_24h(self):
         """Returns a DataFrame instance with last day losers data.
 
         :return pd.DataFrame: a DataFrame instance with last day (24h) losers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 24h')
-        return data[-1] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('losers', '24h')
 
     @property
     def losers_7d(self):
@@ -174,8 +382,7 @@ class CoinMarketCap:
 
         :return pd.DataFrame: a DataFrame instance with last week (7d) losers data.
         """
-        data = self._scrapper(st.URL_GAINERS_LOSERS, match=r'% 7d')
-        return data[-1] if data and len(data) else pd.DataFrame()
+        return self._snapshot_frame('losers', '7d')
 
     @classmethod
     def get_price(cls, currency):
@@ -188,15 +395,83 @@ class CoinMarketCap:
         :param str currency: 3 chars length fiat (or "BTC") currency name.
         :return float: usd to "currency" exchange rate as float.
         """
-        currency = str(currency).lower()
-        data = cls._fetch_url(st.URL_GAINERS_LOSERS)
-        result = re.search(_PATTERN.format(currency), data)
-        if result and hasattr(result, 'span'):
-            result = str(result.group())
-            result = result.split('"')
-            result = result[1] if len(result) else result
-            return float(result.strip(' "'))
-        return result or 1.0
+        return cls._parse_price(cls._fetch_url(st.URL_GAINERS_LOSERS), currency)
+
+    @classmethod
+    def get_prices(cls, currencies=None):
+        """Extract USD to many currencies rates at once (page rates are scanned once per fetched page version).
+
+        >>> rates = CoinMarketCap.get_prices(['BTC', 'EUR'])
+        >>> sorted(rates)
+        ['BTC', 'EUR']
+
+        :param tp.Iterable[str] currencies: fiat (or "BTC") currency names (all page rates are returned if None).
+        :return dict: upper cased currency name to usd to currency exchange rate dict (NaN for not found ones).
+        """
+        return cls._parse_prices(cls._fetch_url(st.URL_GAINERS_LOSERS), currencies)
+
+    @classmethod
+    def _parse_price(cls, raw, currency):
+        """Extract USD to "currency" rate from gainers and losers page "raw" content.
+
+        :param str raw: gainers and losers page raw content.
+        :param str currency: 3 chars length fiat (or "BTC") currency name.
+        :return float: usd to "currency" exchange rate as float (NaN if not found).
+        """
+        return cls._parse_prices(raw, [currency])[str(currency).upper()]
+
+    @classmethod
+    def _parse_prices(cls, raw, currencies=None):
+        """Extract USD to "currencies" rates from gainers and losers page "raw" content.
+
+        :param str raw: gainers and losers page raw content.
+        :param tp.Iterable[str] currencies: fiat (or "BTC") currency names (all page rates are returned if None).
+        :return dict: upper cased currency name to usd to currency exchange rate dict (NaN for not found ones).
+        """
+        raw = raw or str()
+        rates = cls._rates.get(raw, cls._parse_rates, digest=cls._cache.fingerprint(st.URL_GAINERS_LOSERS, raw))
+        if currencies is None:
+            return dict(rates)
+        # unknown currencies get NaN rates, so their converted values are missing instead of USD ones
+        return {c: rates.get(c, float('nan')) for c in map(str.upper, map(str, currencies))}
+
+    @staticmethod
+    def _parse_rates(raw, digest=None):
+        """Scan "raw" page content once returning every "data-<currency>" rate found.
+
+        :param str raw: gainers and losers page raw content.
+        :param str digest: "raw" content digest (unused, see snapshot.ParsedCache).
+        :return dict: upper cased currency name to usd to currency exchange rate dict.
+        """
+        rates = dict()
+        with metrics.span('price'):
+            for match in _RATES_RE.finditer(raw):
+                rates.setdefault(match.group(1).upper(), float(match.group(2)))
+        return rates
+
+    @classmethod
+    def get_exchange_markets(cls, exchange):
+        """Get exchange markets index (built once per fetched exchange page version).
+
+        :param str exchange: exchange name used on request.
+        :return MarketIndex: exchange pairs index.
+        """
+        return cls._fetch_exchange_markets(exchange)
+
+    @classmethod
+    def _fetch_exchange_markets(cls, exchange, timeout=None):
+        """Fetch exchange page (once) and return its markets index.
+
+        :param str exchange: exchange name used on request.
+        :param float timeout: socket timeout in secs.
+        :return MarketIndex: exchange pairs index.
+        """
+        url = st.URL_EXCHANGES.format(str(exchange).lower())
+        raw = cls._fetch_url(url, timeout=timeout)
+        if not raw:
+            # a failed fetch is not an exchange without currencies
+            raise IOError(f'{url} could not be fetched')
+        return cls._parse_exchange_markets(raw, url)
 
     @classmethod
     def get_exchange_symbols(cls, exchange, quote_currency=None):
@@ -206,22 +481,32 @@ class CoinMarketCap:
         :param str quote_currency: only symbols matching "quote_currency" value will be returned.
         :return list: exchange supported symbols as list
         """
-        exchange = str(exchange).lower()
-        data = cls._fetch_url(st.URL_EXCHANGES.format(exchange))
+        return cls.get_exchange_markets(exchange).symbols(quote_currency)
 
-        if data and isinstance(data, str) and len(data):
-            data = pd.read_html(data)
-            data = data.pop(0)
-            symbols = data['Pair']  # type: pd.Series
+    @classmethod
+    def _parse_exchange_markets(cls, raw, url=None):
+        """Return exchange page "raw" content markets index (page is only parsed the first time its table is seen).
 
-            if quote_currency:
-                quote_currency = str(quote_currency).upper()
-                markets = {s.split('/')[1] for s in cls.get_exchange_symbols(exchange)}
+        :param str raw: exchange page raw content.
+        :param str url: exchange page URL ("raw" fingerprint is computed once per cached body when supplied).
+        :return MarketIndex: exchange pairs index.
+        """
+        raw = raw or str()
+        return cls._markets.get(raw, cls._build_exchange_markets, digest=cls._cache.fingerprint(url, raw))
 
-                if quote_currency in markets:
-                    symbols = symbols.select(lambda s: symbols[s].split('/')[1] in quote_currency)
+    @staticmethod
+    def _build_exchange_markets(raw, digest=None):
+        """Parse exchange page "raw" content into a markets index.
 
-            return symbols.sort_values().tolist()
+        :param str raw: exchange page raw content.
+        :param str digest: "raw" content digest (unused, see snapshot.ParsedCache).
+        :return MarketIndex: exchange pairs index.
+        """
+        if not raw:
+            return MarketIndex([])
+        with metrics.span('parse'):
+            data = pd.read_html(raw)
+        return MarketIndex(data.pop(0)['Pair'])
 
     @classmethod
     def get_exchange_currencies(cls, exchange):
@@ -231,78 +516,147 @@ class CoinMarketCap:
         :param str exchange: exchange name used on request.
         :return list: exchange supported currencies as list.
         """
-        currencies = {s.split('/')[0] for s in cls.get_exchange_symbols(exchange)}
-        return sorted(currencies)
+        return cls.get_exchange_markets(exchange).currencies
 
     @classmethod
-    def get_markets_by(cls, exchange):
-        """Get exchange supported markets as list.
-
-        :param str exchange: exchange name used on request.
-        :return list: exchange supported markets as list.
+    def iter_exchange_currencies(cls, exchanges, max_workers=8, timeout=30):
+        """Concurrently fetch and parse supported currencies of many exchanges yielding results as they complete.
+
+        :param tp.Iterable[str] exchanges: exchange names used on requests.
+        :param int max_workers: max amount of pages fetched (and parsed) at the same time.
+        :param float timeout: per request socket timeout in secs.
+        :return tp.Iterator[tp.Tuple[str, list, Exception]]: (exchange, currencies, error) tuples where "error" is
+                None on success and "currencies" is None on failure.
         """
-        markets = {s.split('/')[1] for s in cls.get_exchange_symbols(exchange)}
-        return sorted(markets)
+
+        def worker(exchange):
+            # page is fetched once (with per request timeout) and parsed right away
+            return cls._fetch_exchange_markets(exchange, timeout).currencies
+
+        exchanges = list(dict.fromkeys(exchanges))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(exchanges)))) as executor:
+            futures = {executor.submit(worker, ex): ex for ex in exchanges}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as err:
+                    yield futures[future], None, err
 
     @classmethod
-    def get_all(cls):
-        if not len(cls._all_currencies):
-            names = dict()
-            final = list()
+    def get_exchange_currencies_many(cls, exchanges, max_workers=8, timeout=30):
+        """Get supported currencies for many exchanges at once (pages are fetched and parsed concurrently).
 
-            data = cls._fetch_url(st.URL_ALL)
-            scrapper = bs4.BeautifulSoup(data, features='lxml')
-            table = scrapper.find('table', attrs={'id': 'currencies-all'})
-            names_tags = scrapper.find_all('a', attrs={'class': 'link-secondary'})
+        :param tp.Iterable[str] exchanges: exchange names used on requests.
+        :param int max_workers: max amount of pages fetched (and parsed) at the same time.
+        :param float timeout: per request socket timeout in secs.
+        :return tp.Tuple[dict, dict]: exchange to supported currencies dict and exchange to raised error dict.
+        """
+        results, failures = dict(), dict()
 
-            num = len(names_tags) // 2
+        for exchange, currencies, error in cls.iter_exchange_currencies(exchanges, max_workers, timeout):
+            if error is None:
+                results[exchange] = currencies
+            else:
+                failures[exchange] = error
 
-            for i in range(0, num, 2):
-                long_name = names_tags[i + 1]['href'].split('/')[2]
-                short_name = names_tags[i].text
-                names.update(**{short_name: long_name})
+        return results, failures
 
-            rows = table.find_all('tr')
-            data = [str_subs(r.text, *_REPLACE).lstrip(_STRIP).split('@')[1:8] for r in rows]
+    @classmethod
+    def get_exchange_index(cls, exchanges, max_workers=8, timeout=30):
+        """Build a symbol to exchanges inverted index from supplied exchanges supported currencies.
 
-            for row in data:
+        :param tp.Iterable[str] exchanges: exchange names used on requests.
+        :param int max_workers: max amount of pages fetched (and parsed) at the same time.
+        :param float timeout: per request socket timeout in secs.
+        :return ExchangeIndex: inverted index (exchanges that could not be retrieved are reported on its "failures").
+        """
+        exchanges = list(dict.fromkeys(exchanges))
+        results, failures = cls.get_exchange_currencies_many(exchanges, max_workers, timeout)
+        # keep supplied exchanges order (results are collected as they complete)
+        return ExchangeIndex({ex: results[ex] for ex in exchanges if ex in results}, failures)
 
-                if len(row) > 5:
-                    row = [data2num(f) for f in row]
+    @classmethod
+    def get_markets_by(cls, exchange):
+        """Get exchange supported markets as list.
 
-                    if isinstance(row[-1] or 0, str) and '%' in row[-1] and '?' not in row[-1]:
-                        tmp = row[-1].split('%')[:3]
-                        row[-1] = float(tmp.pop(0))
-                        row.extend([float(t) for t in tmp])
+        :param str exchange: exchange name used on request.
+        :return list: exchange supported markets as list.
+        """
+        return cls.get_exchange_markets(exchange).markets
 
-                        if row[0] == row[1]:
-                            k = row[1].upper()
-                            row[0] = names[k].upper() if k in names else str()
-                        else:
-                            row[0] = str(row[0]).upper() if row[0] else row[1]
+    @classmethod
+    def get_all(cls, refresh=False):
+        """Get "all currencies" page data as DataFrame indexed by symbol.
 
-                        final.append(row)
+        Page table is parsed in streaming mode (see parsers.iter_all_rows) so whole page tree is never built.
 
-            df = pd.DataFrame(final, columns=st.ALL_FIELDS)
+        :param bool refresh: check for a newer page version (fetched once cached copy expires), which is only parsed
+                             if its table or quote rates changed (otherwise the very same DataFrame is returned).
+        :return pd.DataFrame: all listed currencies data.
+        """
+        if refresh or not len(cls._all_currencies):
+            df = cls._parse_all_page(cls._fetch_url(st.URL_ALL), cls.get_prices(cls._quotes))
+            if df is not cls._all_currencies:
+                cls._all_currencies = df
+                cls._record('all', df)
 
-            df = df[[True if isinstance(data2num(v), float) else False for v in df['volume24h']]]
+        return cls._all_currencies
 
-            df['usd'] = df['usd'].apply(data2num)
-            df['btc'] = df['usd'] / cls.get_price('BTC')
+    @classmethod
+    def _parse_all_page(cls, raw, rates):
+        """Return "all currencies" page "raw" content data (page is only parsed when its table or "rates" change).
 
-            df = df.round({'usr': 2, 'btc': 8})
+        :param str raw: "all currencies" page raw content.
+        :param dict rates: quote currency to USD rate dict.
+        :return pd.DataFrame: all listed currencies data indexed by symbol.
+        """
+        raw = raw or str()
+        digest = cls._cache.fingerprint(st.URL_ALL, raw)
+        return cls._all_pages.get(raw, lambda r, d, items: cls._parse_all(r, dict(items)), _rates_key(rates),
+                                  digest=digest)
 
-            btc = df.pop('btc')
-            df.insert(2, column='btc', value=btc)
+    @classmethod
+    def screen(cls, screener, refresh=False, index=None):
+        """Return "all currencies" rows matching "screener" (see screen.Screener).
 
-            df['market_cap'] = df['market_cap'].apply(data2num).apply(int)
-            df = df.apply(data2num).round({'1h': 2, '24h': 2, '7d': 2})
-            df['volume24h'] = df['volume24h'].apply(data2num).apply(int)
+        >>> from pcmc.screen import Screener
+        >>> top = CoinMarketCap.screen(Screener.parse(['volume24h>=1e6', '24h=5:50', 'top=10', 'by=24h']))
+        >>> len(top) <= 10
+        True
+
+        :param Screener screener: currencies screen.
+        :param bool refresh: check for a newer "all currencies" page version first (see get_all).
+        :param ExchangeIndex index: exchanges index (built from "screener" exchanges if None).
+        :return pd.DataFrame: matching currencies data indexed by symbol.
+        """
+        if index is None and screener.exchanges:
+            index = cls.get_exchange_index(screener.exchanges)
+        return screener.apply(cls.get_all(refresh), index)
 
-            df = df.set_index('symbol')
-            cls._all_currencies = df.copy(True)
+    @staticmethod
+    def _parse_all(raw, rates):
+        """Parse "all currencies" page "raw" content.
 
-        return cls._all_currencies
+        :param str raw: "all currencies" page raw content.
+        :param dict rates: quote currency to USD rate dict.
+        :return pd.DataFrame: all listed currencies data indexed by symbol (page "rank" included).
+        """
+        with metrics.span('parse'):
+            chunks = list(read_all_chunks(raw))
+            df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=st.ALL_FIELDS)
+
+        with metrics.span('clean'):
+            # page rows are sorted by market cap, so rank is row position (kept before discarding any row)
+            df.insert(0, 'rank', range(1, len(df) + 1))
+            # rows lacking a numeric 24h volume are discarded
+            df = df[df['volume24h'].notna()]
+            df = clean_numeric(df)
+
+        with metrics.span('convert'):
+            df = convert_quotes(df, rates)
+            df = df.round({'btc': 8, '1h': 2, '24h': 2, '7d': 2})
+            return compact(df.set_index('symbol'))
 
     @classmethod
     def get_currency_exchanges(cls, currency):
@@ -315,10 +669,91 @@ class CoinMarketCap:
         :param str currency: desired currency used for data request.
         :return list: exchange list where currency is supported as list.
         """
-        ac = cls.get_all()
-        long_name = ac.T[str(currency).upper()]['name']
+        long_name = cls._currency_names()[str(currency).upper()]
         data = cls._fetch_url(st.URL_CURRENCIES.format(long_name.lower()))
-        data = pd.read_html(data)
+        return cls._parse_currency_exchanges(data)
+
+    @classmethod
+    def _currency_names(cls):
+        """Return symbol to currency long name (as used on currency page URLs) dict from "all currencies" data."""
+        names = cls.get_all()['name']
+        return names[~names.index.duplicated()].to_dict()
+
+    @classmethod
+    def get_currencies_exchanges(cls, currencies, max_workers=8, processes=None, timeout=30, progress=None,
+                                 done=None):
+        """Get exchanges and pairs where every supplied currency is supported.
+
+        Currency pages are fetched concurrently over a bounded thread pool and parsed on a process pool (so parsing
+        is not serialized by the GIL). Supplying a previous (partial) result as "done" resumes the crawl skipping
+        already retrieved currencies.
+
+        :param tp.Iterable[str] currencies: currency symbols.
+        :param int max_workers: max amount of pages fetched at the same time.
+        :param int processes: parser processes amount (default: CPUs amount, 0 means parse on fetching threads).
+        :param float timeout: per request socket timeout in secs.
+        :param tp.Callable progress: called as "progress(completed, total, symbol, error)" once per currency.
+        :param pd.DataFrame done: previous result whose currencies will not be requested again.
+        :return tp.Tuple[pd.DataFrame, dict]: "symbol", "exchange" and "pair" columns DataFrame and symbol to raised
+                error dict.
+        """
+        names = cls._currency_names()
+        frames, failures = list(), dict()
+
+        if done is not None and len(done):
+            frames.append(done[['symbol', 'exchange', 'pair']])
+        skip = set(done['symbol']) if done is not None and len(done) else set()
+        pending = [s for s in dict.fromkeys(str(c).upper() for c in currencies) if s not in skip]
+
+        def fetch(symbol):
+            if symbol not in names:
+                raise KeyError(f'{symbol} currency not found')
+            return cls._fetch_url(st.URL_CURRENCIES.format(str(names[symbol]).lower()), timeout=timeout)
+
+        def report(symbol, error=None):
+            if error is not None:
+                failures[symbol] = error
+            if progress is not None:
+                progress(len(results) + len(failures), len(pending), symbol, error)
+
+        results = dict()
+        parser_pool = ThreadPoolExecutor(max_workers) if processes == 0 else ProcessPoolExecutor(processes)
+
+        with ThreadPoolExecutor(max(1, min(max_workers, len(pending) or 1))) as fetchers, parser_pool as parsers:
+            fetches = {fetchers.submit(fetch, s): s for s in pending}
+            parses = dict()
+
+            for future in as_completed(fetches):
+                symbol = fetches[future]
+                try:
+                    parses[parsers.submit(parse_currency_markets, future.result())] = symbol
+                except Exception as err:
+                    report(symbol, err)
+
+            for future in as_completed(parses):
+                symbol = parses[future]
+                try:
+                    results[symbol] = future.result()
+                    report(symbol)
+                except Exception as err:
+                    report(symbol, err)
+
+        for symbol, markets in results.items():
+            frames.append(pd.DataFrame([(symbol, ex, pair) for ex, pair in markets],
+                                       columns=['symbol', 'exchange', 'pair']))
+
+        data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['symbol', 'exchange', 'pair'])
+        return data, failures
+
+    @staticmethod
+    def _parse_currency_exchanges(raw):
+        """Parse currency page "raw" content returning exchanges where currency is supported.
+
+        :param str raw: currency page raw content.
+        :return list: exchange list where currency is supported as list.
+        """
+        with metrics.span('parse'):
+            data = pd.read_html(raw)
         df = data.pop(0)  # type: pd.DataFrame
         symbols = df['Source'].sort_values()
         return symbols.tolist()
@@ -330,8 +765,22 @@ class CoinMarketCap:
         :param bool lower_case: if True, exchange names will be lower cased before return.
         :return list: exchanges listed on CoinMarketCap as list.
         """
-        data = cls._fetch_url(st.URL_EXCHANGES.format(''))
-        data = pd.read_html(data)
+        return cls._parse_exchanges(cls._fetch_url(st.URL_EXCHANGES.format('')), lower_case)
+
+    @staticmethod
+    def _parse_exchanges(raw, lower_case=False):
+        """Parse exchanges page "raw" content returning listed exchanges.
+
+        :param str raw: exchanges page raw content.
+        :param bool lower_case: if True, exchange names will be lower cased before return.
+        :return list: exchanges listed on CoinMarketCap as list (empty if page could not be fetched).
+        """
+        if not raw:
+            # e.g. offline (callers skip exchanges validation on empty lists)
+            return list()
+
+        with metrics.span('parse'):
+            data = pd.read_html(raw)
 
         df = data.pop(0)  # type: pd.DataFrame
 
@@ -343,6 +792,25 @@ class CoinMarketCap:
         return exchanges.tolist()
 
 
+def _parsed_stats():
+    """Parsed results caches counters (parses done and parses skipped because page did not change) as dict."""
+    caches = {'snapshots': CoinMarketCap._snapshots, 'rates': CoinMarketCap._rates, 'markets': CoinMarketCap._markets,
+              'all': CoinMarketCap._all_pages, 'scraps': CoinMarketCap._scraps}
+    return {f'{name}_{key}': value for name, cache in caches.items() for key, value in cache.stats.items()}
+
+
+metrics.REGISTRY.collect('cache', lambda: CoinMarketCap._cache.stats)
+metrics.REGISTRY.collect('parsed', _parsed_stats)
+metrics.REGISTRY.collect('flight', lambda: CoinMarketCap._flight.stats)
+metrics.REGISTRY.collect('limiter', lambda: CoinMarketCap._limiter.stats if CoinMarketCap._limiter else dict())
+
+
+@atexit.register
+def _close_store():
+    """Flush time series store buffered rows at exit (whether it was set by "set_store" or by environment var)."""
+    CoinMarketCap.set_store(None)
+
+
 if __name__ == '__main__':
     info = CoinMarketCap().get_all()
     print(info.head())
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""Daemon mode module.
+
+A background scheduler refreshes every page type on its own fixed rate cadence and publishes parsed snapshots on a
+shared memory board, so many local consumers read the latest snapshots (memory mapped, zero-copy) without scraping.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import heapq
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:
+    pa = ipc = None
+
+import pcmc.static as st
+
+_META_KEY = b'pcmc'
+
+
+def default_board_path():
+    """Return snapshots board default directory ("PCMC_DAEMON" environment var, else a /dev/shm or temp one)."""
+    if os.environ.get(st.DAEMON_ENV):
+        return os.environ[st.DAEMON_ENV]
+    root = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(root, f'pcmc-{os.getuid()}' if hasattr(os, 'getuid') else 'pcmc')
+
+
+class SharedSnapshot:
+    """Published snapshot as read by a consumer.
+
+    Its table columns are memory mapped views of the published file, which stays readable (even after being replaced
+    by a newer version) as long as this object is alive.
+    """
+
+    __slots__ = ('name', 'table', 'meta', '_source')
+
+    def __init__(self, name, table, meta, source):
+        self.name = name
+        self.table = table
+        self.meta = meta
+        self._source = source
+
+    def frame(self):
+        """Return snapshot as DataFrame (symbol indexed when a "symbol" column is present).
+
+        :return pd.DataFrame: snapshot data.
+        """
+        data = self.table.to_pandas()
+        return data.set_index('symbol') if 'symbol' in data.columns else data
+
+    @property
+    def digest(self):
+        """Source page content digest."""
+        return self.meta.get('digest')
+
+    @property
+    def fetched(self):
+        """Source page fetch unix time."""
+        return self.meta.get('fetched', 0.0)
+
+    @property
+    def age(self):
+        """Secs since source page was fetched."""
+        return time.time() - self.fetched
+
+    @property
+    def stale(self):
+        """True if snapshot missed its refresh (older than twice its refresh period)."""
+        return self.age > 2 * self.meta.get('period', float('inf'))
+
+
+class SnapshotBoard:
+    """Directory of memory mapped Arrow IPC snapshots (one file per snapshot name).
+
+    Every publish writes a new file and atomically renames it over the previous version, so readers never see partial
+    writes and no locking is needed: readers keep using the version they mapped until they read again.
+    """
+
+    def __init__(self, path=None):
+        """SnapshotBoard constructor.
+
+        :param str path: board directory (default: default_board_path()).
+        """
+        if pa is None:
+            raise ImportError('pyarrow package is required by SnapshotBoard (pip install pyarrow)')
+        self.path = pathlib.Path(path or default_board_path()).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, name):
+        return self.path.joinpath(f'{name}.arrow')
+
+    def publish(self, name, data, **meta):
+        """Publish "data" as "name" snapshot along with "meta" (JSON serializable) metadata.
+
+        :param str name: snapshot name.
+        :param pd.DataFrame data: snapshot data (index is saved as a column when it is named).
+        :param meta: snapshot metadata (e.g. "fetched", "digest" and "period").
+        """
+        table = pa.Table.from_pandas(data.reset_index() if data.index.name else data, preserve_index=False)
+        meta = dict(meta, name=name, published=time.time())
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _META_KEY: json.dumps(meta)})
+
+        target = self._file(name)
+        tmp = target.with_name(f'.{target.name}.{os.getpid()}.{threading.get_ident()}')
+        # uncompressed IPC file format so readers can map columns without copying them
+        with pa.OSFile(str(tmp), 'wb') as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, target)
+
+    def read(self, name):
+        """Return "name" latest published snapshot (None if never published).
+
+        :param str name: snapshot name.
+        :return SharedSnapshot: memory mapped snapshot.
+        """
+        try:
+            source = pa.memory_map(str(self._file(name)), 'r')
+        except FileNotFoundError:
+            return None
+        table = ipc.open_file(source).read_all()
+        meta = json.loads((table.schema.metadata or {}).get(_META_KEY, b'{}'))
+        return SharedSnapshot(name, table, meta, source)
+
+    def names(self):
+        """Sorted list of published snapshot names."""
+        return sorted(p.stem for p in self.path.glob('*.arrow'))
+
+
+class Scheduler:
+    """Fixed rate jobs scheduler.
+
+    Every job runs at its own period measured from scheduler start (not from previous run end) so cadence does not
+    drift with job duration. Runs are done on a thread pool; a run still in progress when next one is due skips it.
+    """
+
+    def __init__(self, max_workers=4, clock=time.monotonic):
+        """Scheduler constructor.
+
+        :param int max_workers: max amount of jobs running at the same time.
+        :param tp.Callable clock: monotonic clock function.
+        """
+        self.clock = clock
+        self.runs = dict()
+        self.skipped = dict()
+        self.errors = dict()
+        self._jobs = dict()
+        self._running = set()
+        self._heap = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pcmc-daemon')
+
+    def add(self, name, period, func):
+        """Schedule "func" to be called every "period" secs (first call is done right away).
+
+        :param str name: job name.
+        :param float period: secs between calls.
+        :param tp.Callable func: job callable (no arguments).
+        """
+        self._jobs[name] = (float(period), func)
+        self.runs[name] = self.skipped[name] = 0
+        heapq.heappush(self._heap, (self.clock(), name))
+
+    def _run(self, name, func):
+        try:
+            func()
+            self.errors.pop(name, None)
+        except Exception as err:
+            self.errors[name] = err
+            print(f' - {name} refresh failed: {str(err)}', file=sys.stderr)
+        finally:
+            with self._lock:
+                self._running.discard(name)
+                self.runs[name] += 1
+
+    def run(self):
+        """Run scheduled jobs until "stop" is called."""
+        while not self._stop.is_set() and self._heap:
+            due, name = self._heap[0]
+            delay = due - self.clock()
+            if delay > 0:
+                self._stop.wait(delay)
+                continue
+            heapq.heappop(self._heap)
+            period, func = self._jobs[name]
+
+            with self._lock:
+                busy = name in self._running
+                self._running.add(name)
+            if busy:
+                self.skipped[name] += 1
+            else:
+                self._executor.submit(self._run, name, func)
+
+            # next due time is a multiple of period since first run, skipping missed ticks
+            due += period * max(1, int((self.clock() - due) // period) + 1)
+            heapq.heappush(self._heap, (due, name))
+
+    def stop(self):
+        """Stop scheduling (running jobs are waited for)."""
+        self._stop.set()
+        self._executor.shutdown(wait=True)
+
+
+def read_exchanges(board):
+    """Return exchanges list published on "board" by a daemon (None if never published).
+
+    :param SnapshotBoard board: snapshots board.
+    :return list: lower cased listed exchanges.
+    """
+    shared = board.read('exchanges')
+    return None if shared is None else [str(ex) for ex in shared.table.column('exchange').to_pylist()]
+
+
+def read_exchange_currencies(board, exchanges):
+    """Return "exchanges" supported currencies published on "board" by a daemon.
+
+    Exchanges not tracked by the daemon are neither on returned results nor on failures.
+
+    :param SnapshotBoard board: snapshots board.
+    :param tp.Iterable[str] exchanges: exchange names.
+    :return tp.Tuple[dict, dict]: exchange name to supported currencies dict and exchange name to error dict
+            (same as CoinMarketCap.get_exchange_currencies_many).
+    """
+    shared = board.read('markets')
+    if shared is None:
+        return dict(), dict()
+    published = shared.meta.get('exchanges', [])
+    failed = shared.meta.get('failures', {})
+    markets = shared.table.to_pandas()
+    results = {ex: markets.loc[markets['exchange'] == ex, 'symbol'].tolist() for ex in exchanges if ex in published}
+    failures = {ex: IOError(failed[ex]) for ex in exchanges if ex in failed}
+    return results, failures
+
+
+class Daemon:
+    """Background refresher publishing CoinMarketCap parsed pages on a snapshots board.
+
+    Published snapshots: "<kind>_<timeframe>" gainers and losers tables, "rates", "all" currencies, listed
+    "exchanges" and tracked exchanges supported currencies ("markets" with "exchange" and "symbol" columns).
+    """
+
+    def __init__(self, board=None, periods=None, quotes=None, exchanges=None):
+        """Daemon constructor.
+
+        :param board: SnapshotBoard instance or board directory path.
+        :param dict periods: page type ("gainers_losers", "all" or "exchanges") to refresh period in secs dict
+                             (default: static.DAEMON_PERIODS and static.DAEMON_EXCHANGES_PERIOD).
+        :param tp.Iterable[str] quotes: quote currencies whose converted columns are published.
+        :param tp.Iterable[str] exchanges: exchanges whose supported currencies are published.
+        """
+        from pcmc.core import CoinMarketCap
+
+        self.cmc = CoinMarketCap
+        self.board = board if isinstance(board, SnapshotBoard) else SnapshotBoard(board)
+        self.periods = {**st.DAEMON_PERIODS, 'exchanges': st.DAEMON_EXCHANGES_PERIOD, **(periods or {})}
+        self.exchanges = [str(ex).lower() for ex in dict.fromkeys(exchanges or [])]
+        self.scheduler = Scheduler()
+        self.cmc.set_quotes(quotes)
+
+    def _fetched(self, url):
+        entry = self.cmc._cache.get(url)
+        return entry['updated'] if entry else time.time()
+
+    def refresh_gainers_losers(self):
+        """Fetch, parse and publish gainers and losers page snapshots."""
+        snapshot = self.cmc.get_gainers_losers_snapshot()
+        meta = dict(fetched=self._fetched(st.URL_GAINERS_LOSERS), digest=snapshot.digest,
+                    period=self.periods['gainers_losers'])
+        for kind in ['gainers', 'losers']:
+            for timeframe in st.TIMEFRAMES:
+                data = snapshot.get(kind, timeframe)
+                if data is not None:
+                    self.board.publish(f'{kind}_{timeframe}', data, **meta)
+        rates = self.cmc.get_prices(self.cmc._quotes)
+        self.board.publish('rates', pd.DataFrame({'symbol': list(rates), 'usd': list(rates.values())}), **meta)
+
+    def refresh_all(self):
+        """Fetch, parse and publish "all currencies" page snapshot."""
+        # page is only parsed again when its table (or quote rates) changed
+        data = self.cmc.get_all(refresh=True)
+        self.board.publish('all', data, fetched=self._fetched(st.URL_ALL), period=self.periods['all'])
+
+    def refresh_exchanges(self):
+        """Fetch and publish listed exchanges and tracked exchanges supported currencies snapshots."""
+        url, period = st.URL_EXCHANGES.format(''), self.periods['exchanges']
+        listed = self.cmc.get_exchanges(True)
+        self.board.publish('exchanges', pd.DataFrame({'exchange': pd.Series(listed, dtype=object)}),
+                           fetched=self._fetched(url), period=period)
+        if self.exchanges:
+            results, failures = self.cmc.get_exchange_currencies_many(self.exchanges)
+            published = [ex for ex in self.exchanges if ex in results]
+            data = pd.DataFrame([(ex, symbol) for ex in published for symbol in results[ex]],
+                                columns=['exchange', 'symbol'])
+            self.board.publish('markets', data, fetched=time.time(), period=period, exchanges=published,
+                               failures={ex: str(err) for ex, err in failures.items()})
+
+    def run(self):
+        """Refresh and publish snapshots until interrupted (Ctrl-C)."""
+        jobs = {'gainers_losers': self.refresh_gainers_losers, 'all': self.refresh_all,
+                'exchanges': self.refresh_exchanges}
+        for name, period in self.periods.items():
+            if name in jobs and period and period > 0:
+                self.scheduler.add(name, period, jobs[name])
+        try:
+            self.scheduler.run()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.scheduler.stop()
+
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Inverted indexes module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pandas as pd
+
+
+class ExchangeIndex:
+    """Symbol to exchanges inverted index.
+
+    Exchange membership is stored as a per symbol bitmask (bit "n" set means symbol is supported by n-th exchange) and
+    comma separated exchanges labels are precomputed at build time, so filtering and labeling any amount of rows is a
+    vectorized lookup whatever the amount of indexed exchanges is.
+
+    >>> index = ExchangeIndex({'binance': ['BTC', 'ETH'], 'kraken': ['BTC']})
+    >>> index.isin(['BTC', 'XRP', 'ETH']).tolist()
+    [True, False, True]
+    >>> index.labels(['ETH', 'BTC']).tolist()
+    ['BINANCE', 'BINANCE,KRAKEN']
+    """
+
+    def __init__(self, exchange_currencies, failures=None):
+        """ExchangeIndex constructor.
+
+        :param dict exchange_currencies: exchange name to supported currencies dict.
+        :param dict failures: exchange name to error dict of exchanges that could not be indexed.
+        """
+        self.exchanges = list(exchange_currencies)
+        self.failures = dict(failures or {})
+        masks = dict()
+
+        for bit, exchange in enumerate(self.exchanges):
+            for symbol in exchange_currencies[exchange]:
+                masks[symbol] = masks.get(symbol, 0) | 1 << bit
+
+        # python int objects are used as bitmask when exchanges amount exceeds int64 capacity
+        dtype = 'int64' if len(self.exchanges) < 63 else object
+        self.masks = pd.Series(masks, dtype=dtype).sort_index()
+        self._labels = pd.Series({s: ','.join(self.exchanges_of(s)).upper() for s in self.masks.index}, dtype=object)
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __contains__(self, symbol):
+        return symbol in self.masks.index
+
+    def exchanges_of(self, symbol):
+        """Return exchanges supporting "symbol".
+
+        :param str symbol: currency symbol.
+        :return list: exchanges supporting "symbol" as list.
+        """
+        mask = self.masks.get(symbol, 0)
+        return [ex for bit, ex in enumerate(self.exchanges) if mask >> bit & 1]
+
+    def isin(self, symbols, exchanges=None):
+        """Return a boolean array flagging "symbols" supported by at least one of "exchanges".
+
+        :param symbols: symbols sequence (e.g. a DataFrame index).
+        :param tp.Iterable[str] exchanges: exchanges subset (all indexed exchanges if None).
+        :return np.ndarray: boolean array with same length as "symbols".
+        """
+        symbols = pd.Index(symbols)
+        if exchanges is None:
+            return symbols.isin(self.masks.index)
+        bits = 0
+        for exchange in exchanges:
+            bits |= 1 << self.exchanges.index(exchange) if exchange in self.exchanges else 0
+        masks = self.masks.reindex(symbols, fill_value=0)
+        return ((masks & bits) != 0).to_numpy(dtype=bool)
+
+    def labels(self, symbols):
+        """Return comma separated upper cased exchanges names supporting every symbol in "symbols".
+
+        :param symbols: symbols sequence (e.g. a DataFrame index).
+        :return pd.Series: "symbols" indexed exchanges labels (empty str for not indexed symbols).
+        """
+        return self._labels.reindex(pd.Index(symbols), fill_value='')
+
+    @property
+    def symbols(self):
+        """Sorted list of every indexed symbol."""
+        return self.masks.index.tolist()
+
+
+class MarketIndex:
+    """Exchange markets index.
+
+    Exchange pairs are split into base and quote currencies once (vectorized) and base to pairs and quote to pairs
+    maps are precomputed, so symbols, currencies and markets lookups never parse pairs again.
+
+    >>> index = MarketIndex(['ETH/BTC', 'XRP/BTC', 'ETH/USDT'])
+    >>> index.symbols('BTC')
+    ['ETH/BTC', 'XRP/BTC']
+    >>> index.currencies, index.markets
+    (['ETH', 'XRP'], ['BTC', 'USDT'])
+    >>> index.pairs_of('ETH')
+    ['ETH/BTC', 'ETH/USDT']
+    """
+
+    def __init__(self, pairs):
+        """MarketIndex constructor.
+
+        :param tp.Iterable[str] pairs: exchange pairs as "BASE/QUOTE" str.
+        """
+        pairs = pd.Series(list(pairs), dtype=object).dropna().astype(str).drop_duplicates().sort_values()
+        split = pairs.str.split('/', n=1, expand=True).reindex(columns=[0, 1]).fillna('')
+        self.frame = pd.DataFrame({'pair': pairs.to_numpy(), 'base': split[0].to_numpy(), 'quote': split[1].to_numpy()})
+        self.pairs = self.frame['pair'].tolist()
+        self._by_base = {b: g.tolist() for b, g in self.frame.groupby('base', sort=True)['pair'] if b}
+        self._by_quote = {q: g.tolist() for q, g in self.frame.groupby('quote', sort=True)['pair'] if q}
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def symbols(self, quote_currency=None):
+        """Return sorted pairs (only "quote_currency" ones if supplied and found on exchange, otherwise all of them).
+
+        :param str quote_currency: quote currency filter.
+        :return list: sorted pairs.
+        """
+        if quote_currency:
+            return list(self._by_quote.get(str(quote_currency).upper(), self.pairs))
+        return list(self.pairs)
+
+    def pairs_of(self, base_currency):
+        """Return sorted "base_currency" pairs.
+
+        :param str base_currency: base currency.
+        :return list: sorted pairs (empty if not found).
+        """
+        return list(self._by_base.get(str(base_currency).upper(), []))
+
+    @property
+    def currencies(self):
+        """Sorted list of base currencies."""
+        return list(self._by_base)
+
+    @property
+    def markets(self):
+        """Sorted list of quote currencies."""
+        return list(self._by_quote)
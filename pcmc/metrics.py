@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""In-process metrics module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+
+class Registry:
+    """Thread safe metrics registry holding counters, timed spans and collectors.
+
+    Spans track call count plus inclusive ("total") and exclusive ("self") elapsed time, so nested spans (e.g. a
+    "fetch" triggered while parsing) are not accounted twice on stage breakdowns. Collectors are callables returning
+    a name to number dict, evaluated on every snapshot (useful to expose counters already kept by other objects).
+
+    >>> registry = Registry()
+    >>> with registry.span('parse'):
+    ...     registry.incr('rows', 10)
+    >>> registry.snapshot()['counters']
+    {'rows': 10}
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """Registry constructor.
+
+        :param tp.Callable clock: monotonic high resolution clock function.
+        """
+        self.clock = clock
+        self._counters = dict()
+        self._spans = dict()
+        self._collectors = dict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def incr(self, name, value=1):
+        """Increment "name" counter by "value".
+
+        :param str name: counter name.
+        :param float value: increment.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    @contextlib.contextmanager
+    def span(self, name):
+        """Context manager timing enclosed code as "name" span.
+
+        :param str name: span (stage) name.
+        """
+        stack = self._local.__dict__.setdefault('stack', [])
+        # every stack item holds its children elapsed time so far
+        stack.append(0.0)
+        started = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                count, total, own, peak = self._spans.get(name, (0, 0.0, 0.0, 0.0))
+                self._spans[name] = (count + 1, total + elapsed, own + elapsed - children, max(peak, elapsed))
+
+    def collect(self, name, func):
+        """Register "func" collector whose returned dict items are exposed as "<name>_<key>" gauges.
+
+        :param str name: collector name (used as gauges prefix).
+        :param tp.Callable func: callable returning a name to number dict.
+        """
+        with self._lock:
+            self._collectors[name] = func
+
+    def spans(self):
+        """Return spans as name to (count, total secs, self secs, max secs) tuple dict copy."""
+        with self._lock:
+            return dict(self._spans)
+
+    def snapshot(self):
+        """Return every metric current value as a JSON serializable dict.
+
+        :return dict: "timestamp", "counters", "spans" and "gauges" keys dict.
+        """
+        with self._lock:
+            counters, spans, collectors = dict(self._counters), dict(self._spans), dict(self._collectors)
+
+        gauges = dict()
+        for prefix, func in collectors.items():
+            for key, value in (func() or dict()).items():
+                if isinstance(value, (int, float)):
+                    gauges[f'{prefix}_{key}'] = value
+
+        spans = {name: dict(count=c, total=round(t, 6), self=round(s, 6), max=round(m, 6))
+                 for name, (c, t, s, m) in spans.items()}
+        return dict(timestamp=time.time(), counters=counters, spans=spans, gauges=gauges)
+
+    def reset(self):
+        """Reset every counter and span (collectors are kept)."""
+        with self._lock:
+            self._counters.clear()
+            self._spans.clear()
+
+    def to_prometheus(self, namespace='pcmc'):
+        """Return every metric current value using Prometheus text exposition format.
+
+        :param str namespace: metric names prefix.
+        :return str: Prometheus text format metrics.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, value in sorted(snapshot['counters'].items()):
+            lines += [f'# TYPE {namespace}_{name}_total counter', f'{namespace}_{name}_total {value}']
+
+        for name, value in sorted(snapshot['gauges'].items()):
+            lines += [f'# TYPE {namespace}_{name} gauge', f'{namespace}_{name} {value}']
+
+        if snapshot['spans']:
+            lines += [f'# TYPE {namespace}_stage_seconds summary']
+            for name, span in sorted(snapshot['spans'].items()):
+                lines += [f'{namespace}_stage_seconds_sum{{stage="{name}"}} {span["total"]}',
+                          f'{namespace}_stage_seconds_count{{stage="{name}"}} {span["count"]}']
+            lines += [f'# TYPE {namespace}_stage_self_seconds counter']
+            lines += [f'{namespace}_stage_self_seconds{{stage="{name}"}} {span["self"]}'
+                      for name, span in sorted(snapshot['spans'].items())]
+
+        return '\n'.join(lines + [''])
+
+    def export(self, path, fmt='json'):
+        """Export every metric current value to "path" file.
+
+        JSON snapshots are appended as a new line on every call (JSON lines), while Prometheus text format file is
+        atomically replaced (as expected by node exporter textfile collector).
+
+        :param str path: destination file path.
+        :param str fmt: "json" or "prometheus".
+        """
+        path = str(path)
+        if fmt == 'prometheus':
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'w', encoding='utf-8') as fp:
+                fp.write(self.to_prometheus())
+            os.replace(tmp, path)
+        elif fmt == 'json':
+            with open(path, 'a', encoding='utf-8') as fp:
+                fp.write(json.dumps(self.snapshot()) + '\n')
+        else:
+            raise ValueError(f'Invalid metrics export format: {fmt}')
+
+
+def breakdown(before, after):
+    """Return per stage self time spent between "before" and "after" spans (see Registry.spans).
+
+    :param dict before: older spans.
+    :param dict after: newer spans.
+    :return tp.List[tp.Tuple[str, int, float]]: (stage, calls, self secs) tuples sorted by self time.
+    """
+    stages = []
+    for name, (count, _, own, _) in after.items():
+        prev_count, _, prev_own, _ = before.get(name, (0, 0.0, 0.0, 0.0))
+        if count > prev_count:
+            stages.append((name, count - prev_count, own - prev_own))
+    return sorted(stages, key=lambda s: s[2], reverse=True)
+
+
+REGISTRY = Registry()
+incr = REGISTRY.incr
+span = REGISTRY.span
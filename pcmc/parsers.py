@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Streaming HTML parsers module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import io
+import typing as tp
+
+import pandas as pd
+from lxml import etree
+
+import pcmc.static as st
+
+# "all currencies" table default column positions (used when table header is missing)
+_ALL_POSITIONS = {1: 'name', 2: 'symbol', 3: 'market_cap', 4: 'usd', 5: 'circulating', 6: 'volume24h', 7: '1h',
+                  8: '24h', 9: '7d'}
+
+
+def _to_float(value):
+    """Return "value" as float (NaN when not parseable)."""
+    try:
+        return float(str(value).strip(' $%*\n').replace(',', ''))
+    except ValueError:
+        return float('nan')
+
+
+def _text(elem):
+    """Return "elem" text content (including its children text) stripped."""
+    return ''.join(elem.itertext()).strip()
+
+
+def _cell_value(td, field):
+    """Extract "field" value from "td" cell preferring data attributes over cell text."""
+    if field == 'name':
+        link = td.find('.//a[@href]')
+        href = link.get('href', '') if link is not None else ''
+        slug = [p for p in href.split('/') if p]
+        # currency long name is taken from its URL slug (used later to build currency page URLs)
+        return slug[1].upper() if len(slug) > 1 else str(td.get('data-sort') or _text(td)).upper()
+    elif field == 'symbol':
+        return _text(td)
+
+    value = td.get('data-percentusd') if field in st.TIMEFRAMES else None
+    if value is None:
+        value = td.get('data-sort')
+    if value is None:
+        tagged = td.find('.//*[@data-usd]')
+        value = tagged.get('data-usd') if tagged is not None else _text(td)
+    return _to_float(value)
+
+
+def iter_all_rows(raw, table_id='currencies-all'):
+    """Stream "all currencies" page HTML table rows as typed records without building the whole page tree.
+
+    Table header (if any) is used to map cell positions to static.ALL_FIELDS names and every parsed element is
+    released as soon as it is processed so memory usage stays bounded to a single table row.
+
+    :param raw: "all currencies" page content (str or bytes).
+    :param str table_id: HTML table "id" attribute value.
+    :return tp.Iterator[dict]: one dict per table row with static.ALL_FIELDS keys.
+    """
+    raw = raw.encode('utf-8') if isinstance(raw, str) else raw
+    positions, inside = dict(_ALL_POSITIONS), False
+
+    for event, elem in etree.iterparse(io.BytesIO(raw), events=('start', 'end'), html=True, encoding='utf-8'):
+        if event == 'start':
+            if elem.tag == 'table' and elem.get('id') == table_id:
+                inside = True
+            continue
+
+        if not inside:
+            elem.clear()
+        elif elem.tag == 'table':
+            inside = False
+            elem.clear()
+        elif elem.tag == 'tr':
+            headers = elem.findall('th')
+            if headers:
+                names = [st.NEW_NAMES.get(_text(th)) for th in headers]
+                positions = {n: name for n, name in enumerate(names) if name}
+            else:
+                cells = elem.findall('td')
+                if len(cells) > max(positions):
+                    yield {field: _cell_value(cells[pos], field) for pos, field in positions.items()}
+            elem.clear()
+            # drop already processed rows references from parent
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def read_all_chunks(raw, chunksize=1000):
+    """Stream "all currencies" page table as DataFrames of "chunksize" rows at most.
+
+    :param raw: "all currencies" page content (str or bytes).
+    :param int chunksize: max rows per DataFrame.
+    :return tp.Iterator[pd.DataFrame]: DataFrames with static.ALL_FIELDS columns.
+    """
+    chunk = list()  # type: tp.List[dict]
+
+    for row in iter_all_rows(raw):
+        chunk.append(row)
+        if len(chunk) >= chunksize:
+            yield pd.DataFrame(chunk, columns=st.ALL_FIELDS)
+            chunk = list()
+
+    if chunk:
+        yield pd.DataFrame(chunk, columns=st.ALL_FIELDS)
+
+
+def parse_currency_markets(raw):
+    """Parse currency page "raw" content returning its markets as (exchange, pair) tuples.
+
+    Module level function so it can be run on a process pool.
+
+    :param str raw: currency page raw content.
+    :return tp.List[tp.Tuple[str, str]]: (exchange, pair) tuples list.
+    """
+    df = pd.read_html(raw).pop(0)  # type: pd.DataFrame
+    pairs = df['Pair'] if 'Pair' in df.columns else pd.Series([''] * len(df))
+    return list(zip(df['Source'].astype(str), pairs.astype(str)))
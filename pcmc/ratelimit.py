@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""Client side rate limiting module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import email.utils
+import fnmatch
+import heapq
+import itertools
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pcmc.static as st
+
+
+def priority_for(url):
+    """Return "url" requests priority (lower values are served first) according to static.PRIORITIES patterns.
+
+    >>> priority_for(st.URL_GAINERS_LOSERS) < priority_for(st.URL_EXCHANGES.format('binance'))
+    True
+
+    :param str url: requested URL.
+    :return int: "url" priority.
+    """
+    for pattern, priority in st.PRIORITIES.items():
+        if fnmatch.fnmatchcase(url, pattern):
+            return priority
+    return st.PRIORITY_BULK
+
+
+def parse_retry_after(value, now=None):
+    """Return "Retry-After" header value as secs to wait (None if missing or invalid).
+
+    >>> parse_retry_after('120')
+    120.0
+    >>> parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT', now=1445412470.0)
+    10.0
+
+    :param str value: "Retry-After" header value (delay in secs or HTTP date).
+    :param float now: current unix time (default: time.time()).
+    :return float: secs to wait.
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Token bucket refilled at "rate" tokens per second up to "capacity" tokens."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        """TokenBucket constructor.
+
+        :param float rate: tokens added per second.
+        :param float capacity: max amount of tokens (burst size).
+        :param tp.Callable clock: monotonic clock function.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.blocked_until = 0.0
+        self._updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    def wait_time(self):
+        """Return secs until a token will be available (0 if available right now)."""
+        now = self._refill()
+        blocked = max(0.0, self.blocked_until - now)
+        missing = max(0.0, 1.0 - self.tokens)
+        return max(blocked, missing / self.rate if self.rate > 0 else float('inf'))
+
+    def consume(self):
+        """Take a token (caller must check "wait_time" returns 0 first)."""
+        self._refill()
+        self.tokens -= 1.0
+
+
+class RateLimiter:
+    """Per host token bucket rate limiter with a priority queue of waiting requests and adaptive backoff.
+
+    Requests to the same host are granted in priority order (FIFO among equal priorities), so hot pages refreshes are
+    never starved by bulk crawls. Failed requests ("failed" method) block their host for an exponential (full jitter)
+    backoff delay or for the delay requested by server "Retry-After" header.
+
+    Clock, sleep and random functions are injectable so behaviour can be tested deterministically.
+    """
+
+    def __init__(self, rate=st.RATE_LIMIT, burst=st.RATE_BURST, hosts=None, backoff_base=1.0, backoff_cap=60.0,
+                 clock=time.monotonic, sleep=time.sleep, rand=random.random):
+        """RateLimiter constructor.
+
+        :param float rate: default requests per second per host.
+        :param int burst: default max requests burst per host.
+        :param dict hosts: host to (rate, burst) tuple dict overriding defaults.
+        :param float backoff_base: first retry max backoff delay in secs.
+        :param float backoff_cap: max backoff delay in secs.
+        :param tp.Callable clock: monotonic clock function.
+        :param tp.Callable sleep: sleep function.
+        :param tp.Callable rand: random number generator returning floats in [0, 1) range.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.hosts = dict(st.RATE_LIMITS if hosts is None else hosts)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.clock = clock
+        self.sleep = sleep
+        self.rand = rand
+        self.granted = 0
+        self.throttled = 0
+        self._buckets = dict()
+        self._queues = dict()
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+
+    def bucket(self, host):
+        """Return "host" token bucket (created on first use).
+
+        :param str host: host name (or URL).
+        :return TokenBucket: "host" token bucket.
+        """
+        host = urlsplit(host).hostname or host
+        if host not in self._buckets:
+            rate, burst = self.hosts.get(host, (self.rate, self.burst))
+            self._buckets[host] = TokenBucket(rate, burst, self.clock)
+        return self._buckets[host]
+
+    def acquire(self, url, priority=None):
+        """Block until a request to "url" host is allowed (higher priority waiters are served first).
+
+        :param str url: requested URL.
+        :param int priority: request priority, lower values are served first (default: priority_for(url)).
+        """
+        host = urlsplit(url).hostname or url
+        priority = priority_for(url) if priority is None else priority
+        ticket = (priority, next(self._counter))
+
+        with self._cond:
+            queue = self._queues.setdefault(host, [])
+            heapq.heappush(queue, ticket)
+            bucket = self.bucket(host)
+            waited = False
+
+            while True:
+                if queue[0] == ticket:
+                    wait = bucket.wait_time()
+                    if wait <= 0:
+                        heapq.heappop(queue)
+                        bucket.consume()
+                        self.granted += 1
+                        self.throttled += waited
+                        self._cond.notify_all()
+                        return
+                    waited = True
+                    # release lock while sleeping so other hosts requests (and new waiters) are not blocked
+                    self._cond.release()
+                    try:
+                        self.sleep(wait)
+                    finally:
+                        self._cond.acquire()
+                else:
+                    waited = True
+                    self._cond.wait()
+
+    def backoff(self, attempt):
+        """Return full jitter exponential backoff delay in secs for "attempt" (zero based) retry.
+
+        :param int attempt: zero based retry number.
+        :return float: delay in secs.
+        """
+        return self.rand() * min(self.backoff_cap, self.backoff_base * 2 ** attempt)
+
+    def failed(self, url, attempt, error=None):
+        """Report a failed request to "url" host, blocking further requests to it for a backoff delay.
+
+        :param str url: requested URL.
+        :param int attempt: zero based retry number.
+        :param Exception error: raised error ("Retry-After" header is honoured when error has headers).
+        :return float: delay in secs until next request to "url" host will be allowed.
+        """
+        headers = getattr(error, 'headers', None)
+        delay = parse_retry_after(headers.get('Retry-After') if headers is not None else None)
+        delay = self.backoff(attempt) if delay is None else delay
+
+        with self._cond:
+            bucket = self.bucket(url)
+            bucket.blocked_until = max(bucket.blocked_until, self.clock() + delay)
+            self._cond.notify_all()
+        return delay
+
+    @property
+    def stats(self):
+        """Counters as dict (granted requests and how many of them had to wait)."""
+        return {'granted': self.granted, 'throttled': self.throttled}
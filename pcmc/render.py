@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Terminal rendering module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+import term
+
+Column = collections.namedtuple('Column', ['field', 'header', 'spec', 'style'])
+Column.__doc__ = """Table column: source "field", "header" text, str.format "spec" (including its width) and "style"
+(None, "bold" or "sign" for red / green coloring by value sign)."""
+
+_SIGN_STYLES = (term.green, term.red, term.white + term.dim)
+
+
+def format_column(values, spec, style=None):
+    """Format "values" in bulk (one str.format call per value, no per row Python lambdas) applying "style".
+
+    >>> format_column(pd.Series([1.5, -2.0]), '{:>+6.2f}', 'sign').tolist()
+    ['\\x1b[32m +1.50\\x1b[0m\\x1b[27m', '\\x1b[31m -2.00\\x1b[0m\\x1b[27m']
+
+    :param pd.Series values: values to format (numeric unless "style" is None).
+    :param str spec: str.format spec (including width).
+    :param str style: None, "bold" or "sign" (green positive, red negative and dim white zero / NaN values).
+    :return np.ndarray: formatted values as object array.
+    """
+    if style is None and not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(object).where(values.notna(), '').astype(str)
+        return np.array(list(map(spec.format, values.tolist())), dtype=object)
+
+    numbers = values.to_numpy(dtype='float64', na_value=np.nan)
+    texts = np.array(list(map(spec.format, numbers.tolist())), dtype=object)
+
+    if style == 'sign':
+        green, red, white = _SIGN_STYLES
+        prefixes = np.where(numbers > 0, green, np.where(numbers < 0, red, white)).astype(object)
+        texts = prefixes + texts + term.off
+    elif style == 'bold':
+        texts = term.bold + texts + term.off
+    return texts
+
+
+class TableRenderer:
+    """Fixed width table renderer caching formatted rows between refreshes.
+
+    Rows are keyed by a hash of their symbol and raw values, so only new or changed rows are formatted on every
+    refresh (formatting is done column wise and in bulk for all of them at once).
+    """
+
+    def __init__(self, columns, index_header='Symbol', index_width=10, separator='  '):
+        """TableRenderer constructor.
+
+        :param tp.List[Column] columns: rendered columns.
+        :param str index_header: index (symbol) column header.
+        :param int index_width: index column width.
+        :param str separator: text between columns.
+        """
+        self.columns = list(columns)
+        self.index_spec = f'{{:<{max(index_width, len(index_header))}}}'
+        self.separator = separator
+        self.formatted = 0
+        self.reused = 0
+        self._rows = dict()
+
+        headers = [self.index_spec.format(index_header)]
+        for col in self.columns:
+            width = len(col.spec.format(0.0))
+            headers.append(col.header.rjust(width))
+        self.header = separator.join(headers)
+
+    def _format(self, data):
+        lines = np.array(list(map(self.index_spec.format, data.index.astype(str))), dtype=object)
+        for col in self.columns:
+            lines = lines + self.separator + format_column(data[col.field], col.spec, col.style)
+        return lines
+
+    def render(self, data):
+        """Return "data" table lines (header first).
+
+        :param pd.DataFrame data: symbol indexed data containing every column "field" (raw values).
+        :return tp.List[str]: table lines.
+        """
+        fields = [col.field for col in self.columns]
+        keys = pd.util.hash_pandas_object(data[fields], index=True).tolist() if len(data) else []
+        lines = [self._rows.get(k) for k in keys]
+        missing = np.array([line is None for line in lines], dtype=bool)
+
+        if missing.any():
+            for position, line in zip(np.flatnonzero(missing), self._format(data[missing])):
+                lines[position] = line
+
+        self.formatted += int(missing.sum())
+        self.reused += len(lines) - int(missing.sum())
+        # only current rows are kept so cache size is bounded by table size
+        self._rows = dict(zip(keys, lines))
+        return [self.header] + lines
+
+
+class Screen:
+    """Terminal output redrawing only changed lines of consecutive frames.
+
+    When output stream is not a terminal frames are just appended to output. Frames taller than the terminal are cut
+    to its height (head rows plus last line), so only their visible window is diffed and redrawn.
+    """
+
+    def __init__(self, stream=None, inplace=None):
+        """Screen constructor.
+
+        :param stream: output text stream (default: sys.stdout).
+        :param bool inplace: redraw frames in place (default: True if "stream" is a terminal).
+        """
+        self.stream = stream or sys.stdout
+        self.inplace = bool(getattr(self.stream, 'isatty', lambda: False)()) if inplace is None else inplace
+        self.redrawn = 0
+        self._lines = []
+
+    def draw(self, lines):
+        """Show "lines" frame replacing previous one.
+
+        :param tp.List[str] lines: frame lines.
+        :return int: amount of lines written.
+        """
+        lines = list(lines)
+
+        if not self.inplace:
+            self.stream.write('\n'.join(lines + ['']))
+            self.stream.flush()
+            return len(lines)
+
+        # last terminal row is kept for the cursor, so the frame never scrolls the screen
+        height = shutil.get_terminal_size().lines - 1
+        if len(lines) > height:
+            # frame head and its last (status) line are the visible window
+            lines = lines[:max(0, height - 1)] + lines[-1:]
+
+        # move cursor to previous frame first line, then rewrite changed lines only (skipping unchanged ones)
+        out = [f'\x1b[{len(self._lines)}F'] if self._lines else []
+        written = 0
+        for n, line in enumerate(lines):
+            if n < len(self._lines) and self._lines[n] == line:
+                out.append('\x1b[1E')
+            else:
+                out.append(f'\x1b[2K{line}\n')
+                written += 1
+        if len(lines) < len(self._lines):
+            # clear previous frame remaining lines
+            out.append('\x1b[J')
+
+        self.stream.write(''.join(out))
+        self.stream.flush()
+        self._lines = lines
+        self.redrawn += written
+        return written
+
+    def note(self, line):
+        """Show "line" below current frame (redrawn or cleared along with next frame) or on stderr if not in place.
+
+        :param str line: text line.
+        """
+        if self.inplace:
+            self.draw(self._lines + [line])
+        else:
+            print(line, file=sys.stderr)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Record and replay module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import json
+import threading
+import time
+import zipfile
+from urllib.error import HTTPError
+
+
+class Recorder:
+    """Transport wrapper saving every fetched page raw body (and its URL and timestamp) into a zip archive.
+
+    Every page is appended as soon as it is fetched (LZMA compressed member whose comment holds URL and timestamp as
+    JSON) so archives recorded by interrupted sessions remain usable.
+    """
+
+    def __init__(self, path, transport):
+        """Recorder constructor.
+
+        :param str path: zip archive path (created or appended to).
+        :param transport: wrapped transport (any object with a "get(url, timeout=None)" method returning bytes).
+        """
+        self.path = str(path)
+        self.transport = transport
+        self._lock = threading.Lock()
+        with zipfile.ZipFile(self.path, 'a') as archive:
+            self._count = len(archive.infolist())
+
+    def get(self, url, timeout=None):
+        """Fetch "url" through wrapped transport recording its content.
+
+        :param str url: URL to fetch.
+        :param float timeout: socket timeout in secs.
+        :return bytes: raw URL content.
+        """
+        body = self.transport.get(url, timeout=timeout)
+        with self._lock, zipfile.ZipFile(self.path, 'a', compression=zipfile.ZIP_LZMA) as archive:
+            self._count += 1
+            info = zipfile.ZipInfo(f'{self._count:06d}.html', time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_LZMA
+            info.comment = json.dumps({'url': url, 'timestamp': time.time()}).encode('utf-8')
+            archive.writestr(info, body)
+        return body
+
+    def close(self):
+        """Close wrapped transport."""
+        if hasattr(self.transport, 'close'):
+            self.transport.close()
+
+
+class Replayer:
+    """Transport replaying recorded pages deterministically.
+
+    Every URL recorded bodies are returned in recording order, last one being repeated once exhausted. Not recorded
+    URLs raise a 404 HTTPError.
+    """
+
+    def __init__(self, pages):
+        """Replayer constructor.
+
+        :param dict pages: URL to recorded bodies (bytes or str) list dict.
+        """
+        self._pages = {url: [b.encode('utf-8') if isinstance(b, str) else b for b in bodies]
+                       for url, bodies in pages.items()}
+        self._positions = collections.Counter()
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @classmethod
+    def load(cls, path):
+        """Return a Replayer instance for "path" zip archive (as saved by Recorder).
+
+        :param str path: zip archive path.
+        :return Replayer: archive replayer.
+        """
+        pages = collections.defaultdict(list)
+        with zipfile.ZipFile(str(path)) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                meta = json.loads(info.comment.decode('utf-8'))
+                pages[meta['url']].append(archive.read(info))
+        return cls(pages)
+
+    @property
+    def urls(self):
+        """Recorded URLs list."""
+        return list(self._pages)
+
+    def get(self, url, timeout=None):
+        """Return next recorded body for "url".
+
+        :param str url: URL to fetch.
+        :param float timeout: ignored.
+        :return bytes: recorded raw URL content.
+        """
+        with self._lock:
+            self.requests += 1
+            bodies = self._pages.get(url)
+            if not bodies:
+                raise HTTPError(url, 404, 'Not recorded', None, None)
+            position = min(self._positions[url], len(bodies) - 1)
+            self._positions[url] += 1
+            return bodies[position]
+
+    def rewind(self):
+        """Restart replay from first recorded body of every URL."""
+        with self._lock:
+            self._positions.clear()
+
+    def close(self):
+        pass
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Compact typed DataFrame schemas module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pandas as pd
+
+import pcmc.static as st
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow backed strings take a fraction of python str objects memory (categoricals only pay off on repeated values)
+    TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    # symbols and names are (almost) unique, so categoricals would only add codes on top of every str object
+    TEXT_DTYPE = 'object'
+
+
+def dtype_for(field):
+    """Return "field" compact dtype according to static.SCHEMA ("text" fields get TEXT_DTYPE).
+
+    :param str field: column name.
+    :return str: dtype name (None for fields not in schema).
+    """
+    dtype = st.SCHEMA.get(field)
+    return TEXT_DTYPE if dtype == 'text' else dtype
+
+
+def compact(data):
+    """Return "data" with static.SCHEMA compact dtypes and stable column order.
+
+    Text columns become Arrow backed strings (python str objects when pyarrow is missing), percent changes float32 and
+    market cap / volume nullable integers. Prices keep float64 precision. Columns not in schema are kept (after schema
+    ones) untouched.
+
+    :param pd.DataFrame data: scraped data (symbol may be a column or the index).
+    :return pd.DataFrame: compact typed copy of "data".
+    """
+    data = data.copy()
+
+    for col in data.columns:
+        dtype = dtype_for(col)
+        if dtype is not None and str(data[col].dtype) != dtype:
+            data[col] = data[col].astype(dtype)
+
+    if data.index.name in st.SCHEMA:
+        data.index = data.index.astype(dtype_for(data.index.name))
+
+    order = [c for c in st.SCHEMA if c in data.columns]
+    return data[order + [c for c in data.columns if c not in order]]
+
+
+def memory_report(data):
+    """Return "data" per column memory usage report (index included) sorted by size.
+
+    :param pd.DataFrame data: DataFrame to report.
+    :return pd.DataFrame: "dtype", "bytes" and "ratio" (over total) columns indexed by column name.
+    """
+    usage = data.memory_usage(deep=True)
+    dtypes = [str(data.index.dtype) if c == 'Index' else str(data[c].dtype) for c in usage.index]
+    report = pd.DataFrame({'dtype': dtypes, 'bytes': usage.to_numpy()}, index=usage.index)
+    report['ratio'] = (report['bytes'] / max(1, report['bytes'].sum())).round(4)
+    return report.sort_values('bytes', ascending=False)
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Currencies screening module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import re
+
+import numpy as np
+
+# "all currencies" page position (1 based) of every currency (rows position is used for tables lacking it)
+RANK = 'rank'
+
+_SPEC_RE = re.compile(r'^\s*([a-z0-9_]+)\s*(>=|<=|=)\s*(\S*)\s*$', re.IGNORECASE)
+
+
+def _number(value):
+    return float(value.replace('_', '')) if value else None
+
+
+class Screener:
+    """Immutable currencies screen: inclusive field ranges, exchanges membership and top N rows by a field.
+
+    Range predicates are compiled once into lower and upper bounds arrays, so evaluating the screen over a table is a
+    single vectorized comparison of all screened columns at once (missing values never match), and top N rows are
+    selected by partial sorting (nlargest / nsmallest) of matching rows only. Last result is kept, so evaluating the
+    screen again over the same table (e.g. a refresh whose page did not change) returns it right away.
+
+    >>> import pandas as pd
+    >>> data = pd.DataFrame({'volume24h': [900, 50, 700], '24h': [1.5, 9.0, -2.0]}, index=['BTC', 'XRP', 'ETH'])
+    >>> Screener().where('volume24h', 100).top(1, '24h').apply(data).index.tolist()
+    ['BTC']
+    >>> Screener.parse(['rank>=2', 'top=1', 'by=-24h']).apply(data).index.tolist()
+    ['ETH']
+    >>> Screener.parse(['rank<=2']).apply(data.assign(rank=[1, 3, 2])).index.tolist()
+    ['BTC', 'ETH']
+    """
+
+    def __init__(self, ranges=None, exchanges=None, limit=None, by=None, ascending=False):
+        """Screener constructor.
+
+        :param dict ranges: field to (min, max) inclusive bounds dict (None bound means unbounded).
+        :param tp.Iterable[str] exchanges: only symbols supported by at least one of these exchanges match.
+        :param int limit: max amount of returned rows (all of them if None).
+        :param str by: field used to select top "limit" rows (rank order if None).
+        :param bool ascending: select "limit" rows having smallest "by" values instead of largest ones.
+        """
+        self.ranges = dict(ranges or {})
+        self.exchanges = list(exchanges) if exchanges else []
+        self.limit = int(limit) if limit is not None else None
+        self.by = by
+        self.ascending = bool(ascending)
+        self.evaluations = 0
+        self.reused = 0
+        self._fields = list(self.ranges)
+        self._lower = np.array([-np.inf if lo is None else lo for lo, _ in self.ranges.values()], dtype='float64')
+        self._upper = np.array([np.inf if hi is None else hi for _, hi in self.ranges.values()], dtype='float64')
+        self._last = (None, None, None)
+
+    def __repr__(self):
+        return (f'Screener(ranges={self.ranges!r}, exchanges={self.exchanges!r}, limit={self.limit!r}, '
+                f'by={self.by!r}, ascending={self.ascending!r})')
+
+    def _replace(self, **kwargs):
+        params = dict(ranges=self.ranges, exchanges=self.exchanges, limit=self.limit, by=self.by,
+                      ascending=self.ascending)
+        return Screener(**dict(params, **kwargs))
+
+    def where(self, field, lower=None, upper=None):
+        """Return a new screen also requiring "field" values to be within ["lower", "upper"].
+
+        :param str field: screened field (any numeric column or "rank").
+        :param float lower: min value (unbounded if None).
+        :param float upper: max value (unbounded if None).
+        :return Screener: new screen.
+        """
+        lo, hi = self.ranges.get(field, (None, None))
+        lo = lower if lo is None else lo if lower is None else max(lo, lower)
+        hi = upper if hi is None else hi if upper is None else min(hi, upper)
+        return self._replace(ranges=dict(self.ranges, **{field: (lo, hi)}))
+
+    def on(self, exchanges):
+        """Return a new screen also requiring symbols to be supported by at least one of "exchanges".
+
+        :param tp.Iterable[str] exchanges: exchange names.
+        :return Screener: new screen.
+        """
+        return self._replace(exchanges=list(dict.fromkeys(self.exchanges + [str(ex).lower() for ex in exchanges])))
+
+    def top(self, limit, by=None, ascending=False):
+        """Return a new screen keeping only "limit" matching rows with largest (or smallest) "by" values.
+
+        :param int limit: max amount of returned rows.
+        :param str by: field used to select rows (rank order if None).
+        :param bool ascending: select smallest "by" values instead of largest ones.
+        :return Screener: new screen.
+        """
+        return self._replace(limit=limit, by=by, ascending=ascending)
+
+    @classmethod
+    def parse(cls, specs, fields=None):
+        """Build a screen from "FIELD>=MIN", "FIELD<=MAX", "FIELD=MIN:MAX", "top=N" and "by=[-]FIELD" specs.
+
+        A "-" prefixed "by" field selects smallest values (e.g. "by=-24h" for top losers).
+
+        :param tp.Iterable[str] specs: screen specs.
+        :param tp.Iterable[str] fields: known screened fields ("rank" is always known), not checked if None.
+        :return Screener: parsed screen.
+        """
+        screen = cls()
+        limit, by, ascending = None, None, False
+        known = None if fields is None else {RANK, *fields}
+
+        for spec in specs:
+            match = _SPEC_RE.match(str(spec))
+            if match is None:
+                raise ValueError(f'invalid screen spec: {spec}')
+            field, op, value = match.group(1).lower(), match.group(2), match.group(3)
+            name = value.lstrip('-').lower() if field == 'by' else field
+            if known is not None and field != 'top' and name not in known:
+                raise ValueError(f'unknown screen field: {spec} (fields: {", ".join(sorted(known))})')
+            try:
+                if field == 'top' and op == '=':
+                    limit = int(value)
+                elif field == 'by' and op == '=':
+                    by, ascending = value.lstrip('-').lower(), value.startswith('-')
+                elif op == '>=':
+                    screen = screen.where(field, lower=_number(value))
+                elif op == '<=':
+                    screen = screen.where(field, upper=_number(value))
+                else:
+                    lower, sep, upper = value.partition(':')
+                    screen = screen.where(field, _number(lower), _number(upper) if sep else _number(lower))
+            except ValueError as err:
+                raise ValueError(f'invalid screen spec value: {spec}') from err
+
+        return screen.top(limit, by, ascending) if limit is not None or by else screen
+
+    def mask(self, data, index=None):
+        """Return a boolean array flagging "data" rows matching screen ranges and exchanges.
+
+        :param pd.DataFrame data: symbol indexed data sorted by rank.
+        :param ExchangeIndex index: exchanges index (required if screen has exchanges).
+        :return np.ndarray: boolean array with same length as "data".
+        """
+        unknown = [f for f in self._fields + ([self.by] if self.by else []) if f != RANK and f not in data.columns]
+        if unknown:
+            raise KeyError(f'Unknown screen fields: {", ".join(unknown)}')
+
+        mask = np.ones(len(data), dtype=bool)
+        if self._fields:
+            values = np.column_stack([np.arange(1, len(data) + 1, dtype='float64') if f not in data.columns else
+                                      data[f].to_numpy(dtype='float64', na_value=np.nan) for f in self._fields])
+            # NaN compares False so rows lacking any screened value never match
+            mask &= ((values >= self._lower) & (values <= self._upper)).all(axis=1)
+        if self.exchanges:
+            if index is None:
+                raise ValueError('an exchanges index is required to screen by exchanges')
+            mask &= index.isin(data.index, self.exchanges)
+        return mask
+
+    def apply(self, data, index=None):
+        """Return "data" rows matching screen (at most "limit" of them).
+
+        :param pd.DataFrame data: symbol indexed data sorted by rank (e.g. CoinMarketCap.get_all()).
+        :param ExchangeIndex index: exchanges index (required if screen has exchanges).
+        :return pd.DataFrame: matching rows.
+        """
+        key = (id(data), len(data), id(index))
+        if self._last[0] == key:
+            self.reused += 1
+            return self._last[1]
+
+        result = data[self.mask(data, index)]
+        if self.limit is not None:
+            if self.by is None or self.by == RANK:
+                # rows are already rank sorted, so largest ranks are last ones
+                result = result.tail(self.limit) if self.by and not self.ascending else result.head(self.limit)
+            elif self.ascending:
+                result = result.nsmallest(self.limit, self.by)
+            else:
+                result = result.nlargest(self.limit, self.by)
+        elif self.by == RANK and not self.ascending:
+            result = result.iloc[::-1]
+        elif self.by:
+            result = result.sort_values(self.by, ascending=self.ascending, kind='stable', na_position='last')
+
+        self.evaluations += 1
+        # data is kept referenced along with result, so its id can not be reused by another table meanwhile
+        self._last = (key, result, data)
+        return result
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""Local HTTP query API module.
+
+A single process keeps gainers / losers and "all currencies" pages refreshed on a fixed rate scheduler and serves
+them (plus exchanges and currencies lookups) as JSON or Arrow IPC to any amount of local clients, filtered server side.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import email.utils
+import hashlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:
+    pa = ipc = None
+
+import pcmc.static as st
+from pcmc import metrics
+from pcmc.daemon import Scheduler
+from pcmc.index import ExchangeIndex
+from pcmc.snapshot import content_digest
+
+JSON_TYPE = 'application/json'
+ARROW_TYPE = 'application/vnd.apache.arrow.stream'
+
+
+class ApiError(Exception):
+    """Query error carrying the HTTP status code to be returned."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Api:
+    """Query API over CoinMarketCap data, independent of HTTP transport.
+
+    Hot pages (gainers / losers and "all currencies") are refreshed by a scheduler and requests are always served from
+    their latest parsed version, so clients never trigger upstream requests for them. Encoded responses are cached per
+    source version and query, so repeated queries are served without filtering nor serializing again.
+
+    Routes:
+     - /gainers[/<timeframe>], /losers[/<timeframe>] and /all: filterable tables.
+     - /prices: quote currencies USD rates.
+     - /exchanges: listed exchanges.
+     - /exchanges/<exchange>/symbols: exchange pairs ("quote" query param filters them by quote currency).
+     - /currencies/<symbol>/exchanges: exchanges supporting currency.
+     - /health and /metrics: refresh status and Prometheus metrics.
+
+    Tables filters (query params): "minvol" (min 24h volume in USD), "exchanges" (comma separated names, rows whose
+    symbol is supported by at least one of them), "top" (first N rows after filtering) and "fields" (comma separated
+    columns subset). Setting "format=arrow" (or an Arrow "Accept" header) returns an Arrow IPC stream instead of JSON.
+    """
+
+    def __init__(self, periods=None, quotes=None, max_bodies=st.SERVE_MAX_BODIES):
+        """Api constructor.
+
+        :param dict periods: page type ("gainers_losers" or "all") to refresh period in secs dict (default:
+                             static.DAEMON_PERIODS).
+        :param tp.Iterable[str] quotes: quote currencies whose converted columns are served.
+        :param int max_bodies: max amount of encoded responses cached.
+        """
+        from pcmc.core import CoinMarketCap
+
+        self.cmc = CoinMarketCap
+        self.cmc.set_quotes(quotes)
+        self.periods = dict(st.DAEMON_PERIODS, **(periods or {}))
+        self.scheduler = Scheduler()
+        self.max_bodies = max_bodies
+        self.hits = 0
+        self.misses = 0
+        self._latest = dict()
+        self._indexes = dict()
+        self._bodies = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _fetched(self, url):
+        entry = self.cmc._cache.get(url)
+        return entry['updated'] if entry else time.time()
+
+    def refresh_gainers_losers(self):
+        """Fetch and parse gainers and losers page making it the served version."""
+        snapshot = self.cmc.get_gainers_losers_snapshot()
+        self._latest['gainers_losers'] = (snapshot, snapshot.digest, self._fetched(st.URL_GAINERS_LOSERS))
+
+    def refresh_all(self):
+        """Fetch and parse "all currencies" page making it the served version."""
+        raw = self.cmc._fetch_url(st.URL_ALL) or str()
+        rates = self.cmc.get_prices(self.cmc._quotes)
+        data = self.cmc._parse_all_page(raw, rates)
+        version = content_digest(self.cmc._cache.fingerprint(st.URL_ALL, raw) + repr(sorted(rates.items())))
+        self._latest['all'] = (data, version, self._fetched(st.URL_ALL))
+
+    def start(self):
+        """Start refreshing hot pages on a background thread."""
+        jobs = {'gainers_losers': self.refresh_gainers_losers, 'all': self.refresh_all}
+        for name, period in self.periods.items():
+            if name in jobs and period and period > 0:
+                self.scheduler.add(name, period, jobs[name])
+        threading.Thread(target=self.scheduler.run, name='pcmc-serve-scheduler', daemon=True).start()
+
+    def stop(self):
+        """Stop refreshing hot pages."""
+        self.scheduler.stop()
+
+    def _latest_of(self, name):
+        """Return (data, digest, fetched) latest version of "name" page (refreshed right away if never refreshed)."""
+        if name not in self._latest:
+            getattr(self, f'refresh_{name}')()
+        return self._latest[name]
+
+    def _index(self, exchanges):
+        """Return "exchanges" symbol index (rebuilt only when any exchange page content changes)."""
+        markets, fingerprints, failures = dict(), dict(), dict()
+        for exchange in exchanges:
+            url = st.URL_EXCHANGES.format(str(exchange).lower())
+            try:
+                raw = self.cmc._fetch_url(url)
+                if not raw:
+                    raise IOError(f'{url} could not be fetched')
+                markets[exchange] = self.cmc._parse_exchange_markets(raw, url)
+                fingerprints[exchange] = self.cmc._cache.fingerprint(url, raw)
+            except Exception as err:
+                failures[exchange] = err
+        if not markets:
+            raise ApiError(502, f'Exchanges could not be retrieved: {", ".join(failures)}')
+
+        # exchange pages fingerprints identify indexed content (failed exchanges are part of the index too)
+        key = tuple(fingerprints.items()) + tuple(sorted(failures))
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is None:
+            index = ExchangeIndex({ex: m.currencies for ex, m in markets.items()}, failures)
+            with self._lock:
+                if len(self._indexes) >= 64:
+                    self._indexes.clear()
+                self._indexes[key] = index
+        return index, key
+
+    @staticmethod
+    def _params(query):
+        return {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+
+    @staticmethod
+    def _names(value):
+        return [v.strip() for v in str(value or '').split(',') if v.strip()]
+
+    def _filter(self, data, params):
+        """Return "data" (symbol indexed) rows and columns matching "params" filters.
+
+        :param pd.DataFrame data: table data.
+        :param dict params: query params.
+        :return pd.DataFrame: filtered data (symbol as first column).
+        """
+        try:
+            minvol = float(params.get('minvol') or 0.0)
+            top = int(params['top']) if params.get('top') else None
+        except ValueError as err:
+            raise ApiError(400, f'Invalid filter value: {str(err)}')
+
+        mask = (data['volume24h'] >= minvol).to_numpy(dtype=bool, na_value=False) if minvol else None
+        exchanges = [ex.lower() for ex in self._names(params.get('exchanges'))]
+        if exchanges:
+            index = self._index(exchanges)[0]
+            isin = index.isin(data.index)
+            mask = isin if mask is None else mask & isin
+        data = data if mask is None else data[mask]
+        if exchanges:
+            data = data.assign(exchanges=index.labels(data.index).to_numpy())
+
+        fields = self._names(params.get('fields'))
+        if fields:
+            unknown = [f for f in fields if f not in data.columns]
+            if unknown:
+                raise ApiError(400, f'Unknown fields: {", ".join(unknown)}')
+            data = data[fields]
+        data = data.head(top) if top is not None else data
+        return data.rename_axis('symbol').reset_index()
+
+    def _encode(self, data, fmt):
+        """Encode "data" as "fmt" ("json" or "arrow") returning (content type, body bytes)."""
+        with metrics.span('encode'):
+            if fmt == 'arrow':
+                if pa is None:
+                    raise ApiError(406, 'Arrow format requires pyarrow package (pip install pyarrow)')
+                table = pa.Table.from_pandas(data, preserve_index=False)
+                sink = pa.BufferOutputStream()
+                with ipc.new_stream(sink, table.schema) as writer:
+                    writer.write_table(table)
+                return ARROW_TYPE, sink.getvalue().to_pybytes()
+            if isinstance(data, pd.DataFrame):
+                # float32 columns are widened through their shortest repr (24.23 instead of 24.2299995422)
+                data = data.assign(**{c: data[c].astype(str).astype('float64')
+                                      for c, t in data.dtypes.items() if t == 'float32'})
+                return JSON_TYPE, data.to_json(orient='records', double_precision=10).encode('utf-8')
+            return JSON_TYPE, json.dumps(data).encode('utf-8')
+
+    def _table(self, route):
+        """Return (data, version, fetched) of "route" table."""
+        kind = route[0]
+        if kind == 'all':
+            if len(route) > 1:
+                raise ApiError(404, f'Not found: /{"/".join(route)}')
+            data, digest, fetched = self._latest_of('all')
+            return data, digest, fetched
+
+        timeframe = route[1] if len(route) > 1 else '1h'
+        if timeframe not in st.TIMEFRAMES or len(route) > 2:
+            raise ApiError(404, f'Not found: /{"/".join(route)} (valid timeframes: {", ".join(st.TIMEFRAMES)})')
+        snapshot, digest, fetched = self._latest_of('gainers_losers')
+        data = snapshot.get(kind, timeframe)
+        data = pd.DataFrame(columns=st.GAINERS_LOSERS_FIELDS) if data is None else data
+        return data.set_index('symbol'), digest, fetched
+
+    def query(self, path, query='', accept=None):
+        """Run "path" query returning response status, headers and body.
+
+        :param str path: URL path (e.g. "/gainers/24h").
+        :param str query: URL query string (e.g. "minvol=100000&top=10").
+        :param str accept: request "Accept" header value.
+        :return tp.Tuple[int, dict, bytes]: HTTP status, headers dict (including "Content-Type") and body.
+        """
+        route = [p for p in path.split('/') if p]
+        params = self._params(query)
+        fmt = params.pop('format', 'arrow' if ARROW_TYPE in str(accept or '') else 'json')
+        headers = {'Content-Type': JSON_TYPE}
+        try:
+            if fmt not in ['json', 'arrow']:
+                raise ApiError(400, f'Invalid format: {fmt}')
+            if not route:
+                raise ApiError(404, 'Not found: /')
+
+            if route[0] in ['gainers', 'losers', 'all']:
+                data, version, fetched = self._table(route)
+                headers['Last-Modified'] = email.utils.formatdate(fetched, usegmt=True)
+                headers['X-Pcmc-Age'] = f'{max(0.0, time.time() - fetched):.0f}'
+                if params.get('exchanges'):
+                    # exchange pages content is part of response version when filtering by exchanges
+                    version = (version, self._index(self._names(params['exchanges'].lower()))[1])
+                key = (tuple(route), version, tuple(sorted(params.items())), fmt)
+                content_type, body, headers['ETag'] = self._cached(key, lambda: self._filter(data, params), fmt)
+                return 200, dict(headers, **{'Content-Type': content_type}), body
+            elif route == ['prices']:
+                currencies = [c.upper() for c in self._names(params.get('currencies'))] or None
+                result = self.cmc.get_prices(currencies)
+            elif route == ['exchanges']:
+                result = self.cmc.get_exchanges(True)
+            elif len(route) == 3 and route[0] == 'exchanges' and route[2] == 'symbols':
+                result = self.cmc.get_exchange_symbols(route[1], params.get('quote'))
+            elif len(route) == 3 and route[0] == 'currencies' and route[2] == 'exchanges':
+                try:
+                    result = self.cmc.get_currency_exchanges(route[1])
+                except KeyError:
+                    raise ApiError(404, f'Currency not found: {route[1]}')
+            elif route == ['health']:
+                result = self.health()
+            elif route == ['metrics']:
+                headers['Content-Type'] = 'text/plain; version=0.0.4'
+                return 200, headers, metrics.REGISTRY.to_prometheus().encode('utf-8')
+            else:
+                raise ApiError(404, f'Not found: /{"/".join(route)}')
+            return 200, headers, self._encode(result, 'json')[1]
+        except ApiError as err:
+            return err.status, {'Content-Type': JSON_TYPE}, json.dumps({'error': str(err)}).encode('utf-8')
+        except Exception as err:
+            body = json.dumps({'error': f'Upstream error: {str(err)}'}).encode('utf-8')
+            return 502, {'Content-Type': JSON_TYPE}, body
+
+    def _cached(self, key, select, fmt):
+        """Return (content type, body, ETag) for "key", only calling "select" and encoding on cache misses."""
+        with self._lock:
+            item = self._bodies.get(key)
+            if item is not None:
+                self._bodies.move_to_end(key)
+                self.hits += 1
+                return item
+        content_type, body = self._encode(select(), fmt)
+        item = (content_type, body, f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"')
+        with self._lock:
+            self.misses += 1
+            self._bodies[key] = item
+            while len(self._bodies) > self.max_bodies:
+                self._bodies.popitem(last=False)
+        return item
+
+    def health(self):
+        """Return per hot page refresh status (age in secs, stale flag and last refresh error).
+
+        :return dict: page type to status dict.
+        """
+        status = dict()
+        for name, period in self.periods.items():
+            latest = self._latest.get(name)
+            age = time.time() - latest[2] if latest else None
+            error = self.scheduler.errors.get(name)
+            status[name] = dict(age=age, stale=age is None or age > 2 * period, runs=self.scheduler.runs.get(name, 0),
+                                error=str(error) if error else None)
+        return status
+
+    def stats(self):
+        """Encoded responses cache stats dict (see metrics.Registry.collect)."""
+        return dict(hits=self.hits, misses=self.misses, size=len(self._bodies))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    api = None  # type: Api
+    server_version = 'pcmc'
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        with metrics.span('serve'):
+            status, headers, body = self.api.query(url.path, url.query, self.headers.get('Accept'))
+        metrics.incr('api_requests')
+
+        etag = headers.get('ETag')
+        if etag is not None and etag in self.headers.get('If-None-Match', ''):
+            # client already holds this response version
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+
+def serve(host=st.SERVE_HOST, port=st.SERVE_PORT, api=None, verbose=False):
+    """Serve query API on "host":"port" until interrupted (Ctrl-C).
+
+    :param str host: listening address.
+    :param int port: listening port.
+    :param Api api: query API instance (default: a new Api instance).
+    :param bool verbose: log every request to stderr.
+    """
+    api = api or Api()
+    handler = type('Handler', (_Handler,), {'api': api})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    metrics.REGISTRY.collect('api_bodies', api.stats)
+    api.start()
+    print(f' - Serving on http://{host}:{server.server_address[1]} (Ctrl-C to exit)', file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        api.stop()
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Parsed snapshots module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import hashlib
+import threading
+import time
+
+import pandas as pd
+
+import pcmc.static as st
+
+
+def content_digest(raw):
+    """Return a hex digest identifying "raw" content.
+
+    >>> content_digest('abc') == content_digest(b'abc')
+    True
+
+    :param raw: page content (str or bytes).
+    :return str: "raw" content blake2b hex digest.
+    """
+    raw = raw.encode('utf-8') if isinstance(raw, str) else bytes(raw)
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class ParsedCache:
+    """Thread safe cache of parsed results keyed by raw content digest (so one raw page version means one parse)."""
+
+    def __init__(self, maxsize=4):
+        """ParsedCache constructor.
+
+        :param int maxsize: max amount of parsed page versions kept.
+        """
+        self.maxsize = maxsize
+        self.parses = 0
+        self.hits = 0
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, raw, parser, *args, digest=None):
+        """Return "parser(raw, digest, *args)" result, only calling "parser" the first time "raw" content is seen.
+
+        :param raw: page content.
+        :param tp.Callable parser: callable used to parse "raw" content.
+        :param str digest: "raw" content version identifier (e.g. a page fingerprint, whole "raw" digest if None).
+        :return: "parser" returned value for "raw" content.
+        """
+        key = (digest or content_digest(raw),) + args
+
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        result = parser(raw, key[0], *args)
+
+        with self._lock:
+            self.parses += 1
+            self._items[key] = result
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+        return result
+
+    def clear(self):
+        """Remove every cached parsed result."""
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def stats(self):
+        """Counters as dict (parses done and parsed results reused)."""
+        return {'parses': self.parses, 'hits': self.hits}
+
+
+class GainersLosersSnapshot:
+    """Immutable gainers and losers page parsed snapshot (one DataFrame per kind and timeframe)."""
+
+    __slots__ = ('_digest', '_created', '_frames')
+
+    def __init__(self, digest, tables):
+        """GainersLosersSnapshot constructor.
+
+        :param str digest: raw page content digest.
+        :param tp.List[pd.DataFrame] tables: gainers 1h, 24h, 7d followed by losers 1h, 24h, 7d DataFrames.
+        """
+        frames = dict()
+        for num, kind in enumerate(['gainers', 'losers']):
+            for idx, timeframe in enumerate(st.TIMEFRAMES):
+                pos = num * len(st.TIMEFRAMES) + idx
+                frames[kind, timeframe] = tables[pos] if pos < len(tables) else None
+        object.__setattr__(self, '_digest', digest)
+        object.__setattr__(self, '_created', time.time())
+        object.__setattr__(self, '_frames', frames)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{type(self).__name__} instances are immutable')
+
+    @property
+    def digest(self):
+        """Raw page content digest this snapshot was parsed from."""
+        return self._digest
+
+    @property
+    def created(self):
+        """Snapshot creation time (unix epoch)."""
+        return self._created
+
+    def get(self, kind, timeframe):
+        """Return a copy of "kind" ("gainers" or "losers") data for "timeframe" (1h, 24h or 7d).
+
+        :param str kind: "gainers" or "losers".
+        :param str timeframe: 1h, 24h or 7d.
+        :return pd.DataFrame: requested data (None if page lacks it).
+        """
+        data = self._frames.get((kind, timeframe))
+        return None if data is None else data.copy()
+
+    @property
+    def gainers(self):
+        """Gainers data as dict with 1h, 24h and 7d keys."""
+        return {tf: self.get('gainers', tf) for tf in st.TIMEFRAMES}
+
+    @property
+    def losers(self):
+        """Losers data as dict with 1h, 24h and 7d keys."""
+        return {tf: self.get('losers', tf) for tf in st.TIMEFRAMES}
+
+
+class SnapshotRing:
+    """Bounded ring of compact columnar snapshots able to compute per symbol deltas between consecutive ones.
+
+    Only numeric "columns" values are kept (as numpy arrays, one per column) alongside the symbols index so each
+    snapshot costs a few arrays instead of a full DataFrame copy.
+    """
+
+    def __init__(self, maxlen=st.SNAPSHOTS_MAXLEN, columns=None):
+        """SnapshotRing constructor.
+
+        :param int maxlen: max amount of snapshots kept (oldest ones are discarded first).
+        :param tp.List[str] columns: numeric columns tracked (default: static.DIFF_FIELDS plus any timeframe column).
+        """
+        self.columns = columns
+        self._ring = collections.deque(maxlen=maxlen)
+        self._last_delta = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ring)
+
+    def _compact(self, data, key):
+        columns = self.columns or [c for c in st.DIFF_FIELDS + st.TIMEFRAMES if c in data.columns]
+        return {'key': key,
+                'timestamp': time.time(),
+                'index': data.index.to_numpy(dtype=object),
+                'values': {c: data[c].to_numpy(dtype='float64', na_value=float('nan')) for c in columns}}
+
+    @staticmethod
+    def _delta(previous, current):
+        # first snapshot is compared against itself (zero deltas)
+        previous = previous or current
+        new = pd.DataFrame(current['values'], index=current['index'])
+        old = pd.DataFrame(previous['values'], index=previous['index'])
+
+        new = new[~new.index.duplicated()]
+        old = old[~old.index.duplicated()]
+        index = new.index.union(old.index, sort=False)
+        columns = [c for c in new.columns if c in old.columns]
+        delta = new.reindex(index)[columns] - old.reindex(index)[columns]
+        delta.columns = [f'{c}_diff' for c in columns]
+
+        delta['status'] = ''
+        delta.loc[~index.isin(old.index), 'status'] = 'entered'
+        delta.loc[~index.isin(new.index), 'status'] = 'left'
+        return delta
+
+    def push(self, data, key=None):
+        """Add "data" snapshot to ring and return its deltas against previous one.
+
+        Calling again with an already pushed "key" (e.g. same page digest) returns last computed deltas.
+
+        :param pd.DataFrame data: symbol indexed data.
+        :param key: snapshot identifier (a new snapshot is always pushed if None).
+        :return pd.DataFrame: symbol indexed "<column>_diff" deltas plus "status" column ("entered", "left" or "").
+        """
+        with self._lock:
+            if key is not None and self._ring and self._ring[-1]['key'] == key and self._last_delta is not None:
+                return self._last_delta.copy()
+            current = self._compact(data, key)
+            previous = self._ring[-1] if self._ring else None
+            self._ring.append(current)
+            self._last_delta = self._delta(previous, current)
+            return self._last_delta.copy()
+
+    def diff(self, older=-2, newer=-1):
+        """Return deltas between any two kept snapshots (by ring position).
+
+        :param int older: older snapshot position.
+        :param int newer: newer snapshot position.
+        :return pd.DataFrame: symbol indexed "<column>_diff" deltas plus "status" column.
+        """
+        with self._lock:
+            return self._delta(self._ring[older], self._ring[newer])
@@ -20,6 +20,45 @@ HEADERS = {'Referer': URL_GAINERS_LOSERS,
            'Pragma': 'no-cache',
            'User-Agent': USER_AGENT}
 
+CACHE_ENV = 'PCMC_CACHE'
+CACHE_DEFAULT_TTL = 3.0
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# URL glob pattern to TTL in secs (first matching pattern wins)
+CACHE_TTL = {URL_GAINERS_LOSERS: 3.0,
+             URL_ALL: 60.0,
+             URL_EXCHANGES.format(''): 6 * 3600.0,
+             URL_EXCHANGES.format('*'): 3600.0,
+             URL_CURRENCIES.format('*'): 3600.0}
+
+# page regions parsed data is extracted from (tables and numeric "data-*" attributes such as quote rates), so page
+# versions only differing on any other markup (ads, nonces, ...) share fingerprint and are not parsed again
+FINGERPRINT_REGIONS = r'<table\b.*?</table>|\sdata-[a-z]+="[-+.0-9eE]+"'
+
+# client side rate limiting: requests per second and burst per host (overridable per host on RATE_LIMITS)
+RATE_LIMIT = 2.0
+RATE_BURST = 10
+RATE_LIMITS = dict()
+# requests priorities (lower values are served first)
+PRIORITY_HOT = 0
+PRIORITY_BULK = 10
+PRIORITIES = {URL_GAINERS_LOSERS: PRIORITY_HOT,
+              URL_ALL: PRIORITY_HOT + 1}
+
+STORE_ENV = 'PCMC_STORE'
+STORE_FLUSH_ROWS = 10000
+STORE_FANOUT = 8
+
+DAEMON_ENV = 'PCMC_DAEMON'
+# daemon mode refresh period in secs per page type
+DAEMON_PERIODS = {'gainers_losers': 30.0, 'all': 300.0}
+# daemon mode exchanges list and exchange pages refresh period in secs
+DAEMON_EXCHANGES_PERIOD = 3600.0
+
+# "pcmc serve" query API defaults (hot pages are refreshed on DAEMON_PERIODS too)
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8765
+SERVE_MAX_BODIES = 256
+
 ALL_FIELDS = ['name', 'symbol', 'market_cap', 'usd', 'circulating', 'volume24h', '1h', '24h', '7d']
 NEW_NAMES = {'Volume (24h)': 'volume24h',
              'Name': 'name',
@@ -31,4 +70,29 @@ NEW_NAMES = {'Volume (24h)': 'volume24h',
              'Market Cap': 'market_cap',
              'Circulating Supply': 'circulating'}
 
+TEXT_FIELDS = ['name', 'symbol']
+INT_FIELDS = ['market_cap', 'volume24h']
+# numeric columns target dtypes (any NEW_NAMES renamed column not listed in TEXT_FIELDS)
+FIELD_DTYPES = {f: 'int64' if f in INT_FIELDS else 'float64' for f in ALL_FIELDS if f not in TEXT_FIELDS}
+
+# compact typed schema (column order is the one used on returned DataFrames)
+SCHEMA = {'symbol': 'text',
+          'name': 'text',
+          'rank': 'int32',
+          'usd': 'float64',
+          'btc': 'float64',
+          'market_cap': 'Int64',
+          'volume24h': 'Int64',
+          'circulating': 'float64',
+          '1h': 'float32',
+          '24h': 'float32',
+          '7d': 'float32'}
+
 GAINERS_LOSERS_FIELDS = ['symbol', 'name', 'usd', 'btc', 'volume24h']
+# quote currencies whose converted columns are added to scraped data (BTC is always included)
+QUOTES = ['BTC']
+# USD denominated fields converted to every quote currency (see utils.convert_quotes)
+QUOTE_FIELDS = ['usd', 'volume24h']
+# numeric fields tracked between loop mode refreshes (timeframes fields are tracked too when present)
+DIFF_FIELDS = ['usd', 'btc', 'volume24h']
+SNAPSHOTS_MAXLEN = 16
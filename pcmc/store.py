@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Time series store module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import pathlib
+import threading
+import uuid
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = feather = None
+
+import pcmc.static as st
+
+
+def _utc(value):
+    """Return "value" as UTC pd.Timestamp (naive values are considered UTC ones)."""
+    value = pd.Timestamp(value)
+    return value.tz_localize('UTC') if value.tz is None else value.tz_convert('UTC')
+
+
+class TimeSeriesStore:
+    """Append only local time series store for scraped data.
+
+    Rows are partitioned by dataset and UTC day, each partition being a set of compressed Arrow IPC (feather) files
+    which are read memory mapped. Appended rows are buffered and flushed as new "level 0" part files, and whenever a
+    level accumulates "fanout" parts they are merged into a single part of next level, so every row is rewritten a
+    logarithmic amount of times (bounded write amplification) while partitions never grow into many tiny files.
+
+    Layout: <path>/<dataset>/<YYYY-MM-DD>/L<level>-<uuid>.feather
+    """
+
+    def __init__(self, path, flush_rows=st.STORE_FLUSH_ROWS, fanout=st.STORE_FANOUT, compression='zstd'):
+        """TimeSeriesStore constructor.
+
+        :param str path: store root directory.
+        :param int flush_rows: buffered rows amount (per dataset) triggering a flush to disk.
+        :param int fanout: amount of same level parts triggering a merge into next level.
+        :param str compression: Arrow IPC compression codec ("zstd", "lz4" or "uncompressed").
+        """
+        if pa is None:
+            raise ImportError('pyarrow package is required by TimeSeriesStore (pip install pyarrow)')
+        self.path = pathlib.Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self.fanout = max(2, fanout)
+        self.compression = compression
+        self._buffers = collections.defaultdict(list)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _frame(data, timestamp=None):
+        """Return "data" as a flat DataFrame with "symbol" and UTC "timestamp" columns."""
+        data = data.reset_index() if data.index.name == 'symbol' else data.copy()
+        if 'timestamp' not in data.columns:
+            data.insert(0, 'timestamp', _utc(timestamp) if timestamp is not None else pd.Timestamp.now(tz='UTC'))
+        data['timestamp'] = pd.to_datetime(data['timestamp'], utc=True)
+        for col in data.columns:
+            if data[col].dtype.name == 'category':
+                data[col] = data[col].astype(object)
+        return data
+
+    def append(self, dataset, data, timestamp=None):
+        """Append "data" rows to "dataset" (rows are buffered and flushed every "flush_rows" rows).
+
+        :param str dataset: dataset name (e.g. "all", "gainers_1h", "rates").
+        :param pd.DataFrame data: rows to append (a "timestamp" column is added if missing).
+        :param timestamp: rows timestamp (default: current time).
+        """
+        data = self._frame(data, timestamp)
+        with self._lock:
+            self._buffers[dataset].append(data)
+            if sum(len(b) for b in self._buffers[dataset]) >= self.flush_rows:
+                self._flush(dataset)
+
+    def flush(self, dataset=None):
+        """Write buffered rows to disk (for every dataset if "dataset" is None).
+
+        :param str dataset: dataset name.
+        """
+        with self._lock:
+            for name in [dataset] if dataset else list(self._buffers):
+                self._flush(name)
+
+    def _flush(self, dataset):
+        buffered = self._buffers.pop(dataset, None)
+        if not buffered:
+            return
+        data = pd.concat(buffered, ignore_index=True)
+        for day, rows in data.groupby(data['timestamp'].dt.floor('D'), sort=False):
+            partition = self.path.joinpath(dataset, f'{day:%Y-%m-%d}')
+            partition.mkdir(parents=True, exist_ok=True)
+            self._write(partition, 0, rows)
+            self._compact(partition)
+
+    def _write(self, partition, level, data):
+        table = pa.Table.from_pandas(data.sort_values('timestamp', kind='stable'), preserve_index=False)
+        target = partition.joinpath(f'L{level}-{uuid.uuid4().hex}.feather')
+        tmp = target.with_suffix('.tmp')
+        feather.write_feather(table, str(tmp), compression=self.compression)
+        tmp.replace(target)
+
+    def _compact(self, partition):
+        level = 0
+        while True:
+            parts = sorted(partition.glob(f'L{level}-*.feather'))
+            if len(parts) < self.fanout:
+                break
+            merged = [feather.read_table(str(p), memory_map=True).to_pandas() for p in parts]
+            self._write(partition, level + 1, pd.concat(merged, ignore_index=True))
+            for p in parts:
+                p.unlink()
+            level += 1
+
+    def datasets(self):
+        """Return every stored dataset name.
+
+        :return list: dataset names as list.
+        """
+        with self._lock:
+            names = {p.name for p in self.path.iterdir() if p.is_dir()} | set(self._buffers)
+        return sorted(names)
+
+    def query(self, dataset, symbols=None, start=None, end=None, columns=None):
+        """Return "dataset" rows matching "symbols" inside [start, end] time window sorted by timestamp.
+
+        :param str dataset: dataset name.
+        :param tp.Iterable[str] symbols: symbols to return (all if None).
+        :param start: time window start (datetime like, unbounded if None).
+        :param end: time window end (datetime like, unbounded if None).
+        :param tp.List[str] columns: columns to return ("timestamp" and "symbol" are always included).
+        :return pd.DataFrame: matching rows.
+        """
+        start = None if start is None else _utc(start)
+        end = None if end is None else _utc(end)
+        wanted = None if columns is None else list(dict.fromkeys(['timestamp', 'symbol'] + list(columns)))
+        frames = list()
+
+        root = self.path.joinpath(dataset)
+        days = sorted(p for p in root.iterdir() if p.is_dir()) if root.is_dir() else list()
+        for partition in days:
+            if start is not None and partition.name < f'{start:%Y-%m-%d}':
+                continue
+            if end is not None and partition.name > f'{end:%Y-%m-%d}':
+                continue
+            for part in partition.glob('L*.feather'):
+                table = feather.read_table(str(part), columns=wanted, memory_map=True)
+                frames.append(table.to_pandas())
+
+        with self._lock:
+            frames.extend(b if wanted is None else b[[c for c in wanted if c in b.columns]]
+                          for b in self._buffers.get(dataset, []))
+
+        if not frames:
+            return pd.DataFrame(columns=wanted or ['timestamp', 'symbol'])
+
+        data = pd.concat(frames, ignore_index=True)
+        mask = pd.Series(True, index=data.index)
+        if symbols is not None and 'symbol' in data.columns:
+            mask &= data['symbol'].isin(list(symbols))
+        if start is not None:
+            mask &= data['timestamp'] >= start
+        if end is not None:
+            mask &= data['timestamp'] <= end
+        return data[mask].sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+    def close(self):
+        """Flush every buffered row to disk."""
+        self.flush()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""HTTP transport module.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import collections
+import gzip
+import threading
+import zlib
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+import pcmc.static as st
+from pcmc import metrics
+
+_REDIRECTS = (301, 302, 303, 307, 308)
+
+
+class Transport:
+    """Reusable HTTP transport with keep-alive connections, compression and conditional requests.
+
+    Idle connections are kept on a per host pool so consecutive fetches against the same site skip TCP/TLS setup.
+    Every 200 response ETag / Last-Modified headers are remembered so next requests for the same URL are sent as
+    conditional ones and a "304 Not Modified" answer is resolved with the previously downloaded body.
+    """
+
+    def __init__(self, headers=None, timeout=30, pool_size=4, max_validators=128, max_redirects=5):
+        """Transport constructor.
+
+        :param dict headers: default headers sent on every request (default: static.HEADERS).
+        :param float timeout: socket timeout in secs.
+        :param int pool_size: max idle connections kept per host.
+        :param int max_validators: max amount of URLs whose ETag / Last-Modified (and body) are remembered.
+        :param int max_redirects: max redirects followed per request.
+        """
+        self.headers = dict(headers or st.HEADERS)
+        self.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_validators = max_validators
+        self.max_redirects = max_redirects
+        self._pool = collections.defaultdict(list)
+        self._validators = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _acquire(self, scheme, netloc, timeout):
+        """Return an idle pooled connection for "scheme://netloc" (set to "timeout") or a new one if there is none."""
+        with self._lock:
+            idle = self._pool[(scheme, netloc)]
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            # pooled connections keep the timeout of the request that opened them
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn
+        conn_class = HTTPSConnection if scheme == 'https' else HTTPConnection
+        return conn_class(netloc, timeout=timeout)
+
+    def _release(self, scheme, netloc, conn):
+        """Give back "conn" to its host pool (closing it when pool is already full)."""
+        with self._lock:
+            idle = self._pool[(scheme, netloc)]
+            if len(idle) < self.pool_size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _remember(self, url, response, body):
+        """Save response validators (and its body) for further conditional requests."""
+        etag, modified = response.getheader('ETag'), response.getheader('Last-Modified')
+        with self._lock:
+            if etag or modified:
+                self._validators[url] = (etag, modified, body)
+                self._validators.move_to_end(url)
+                while len(self._validators) > self.max_validators:
+                    self._validators.popitem(last=False)
+            else:
+                self._validators.pop(url, None)
+
+    @staticmethod
+    def _decode(response, body):
+        """Decompress "body" according to response "Content-Encoding" header."""
+        encoding = str(response.getheader('Content-Encoding') or '').lower()
+        if encoding == 'gzip':
+            return gzip.decompress(body)
+        elif encoding == 'deflate':
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # some servers send raw deflate streams (no zlib header)
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        return body
+
+    def _request(self, url, headers, timeout):
+        """Send a single GET request (one retry on a stale keep-alive connection) and return (response, body)."""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        path = f'{path}?{parts.query}' if parts.query else path
+
+        for attempt in range(2):
+            conn = self._acquire(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                metrics.incr('http_requests')
+                metrics.incr('http_bytes', len(body))
+            except (HTTPException, OSError) as err:
+                # a failed connection is never given back to the pool
+                conn.close()
+                # pooled connection may have been closed by server, so retry once with a fresh one (not on timeouts)
+                if attempt or isinstance(err, TimeoutError):
+                    raise
+                continue
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(parts.scheme, parts.netloc, conn)
+            return response, body
+
+    def get(self, url, timeout=None):
+        """Fetch "url" and return its content as bytes.
+
+        :param str url: URL to fetch.
+        :param float timeout: socket timeout in secs (default: transport one).
+        :return bytes: raw (decompressed) URL content.
+        """
+        timeout = timeout or self.timeout
+
+        for _ in range(self.max_redirects + 1):
+            headers = dict(self.headers)
+            with self._lock:
+                etag, modified, cached = self._validators.get(url, (None, None, None))
+            if etag:
+                headers['If-None-Match'] = etag
+            if modified:
+                headers['If-Modified-Since'] = modified
+
+            response, body = self._request(url, headers, timeout)
+
+            if response.status == 304 and cached is not None:
+                metrics.incr('http_not_modified')
+                return cached
+            elif response.status in _REDIRECTS and response.getheader('Location'):
+                url = urljoin(url, response.getheader('Location'))
+            elif response.status >= 400:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            else:
+                body = self._decode(response, body)
+                self._remember(url, response, body)
+                return body
+
+        raise HTTPError(url, 310, 'Too many redirects', None, None)
+
+    def close(self):
+        """Close every pooled connection."""
+        with self._lock:
+            for idle in self._pool.values():
+                for conn in idle:
+                    conn.close()
+            self._pool.clear()
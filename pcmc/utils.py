@@ -6,6 +6,7 @@
  - License:     UNLICENSE
 """
 import numbers as nums
+import re
 import sys
 import time
 import typing as tp
@@ -13,11 +14,23 @@ import warnings
 from http.client import HTTPException, InvalidURL
 from urllib.request import Request, build_opener, HTTPError
 
+import numpy as np
 import pandas as pd
 import term
 
 import pcmc.static as st
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# chars removed from numeric text cells before conversion (currency and percent signs, thousands separators, ...)
+_NOISE_RE = re.compile(r'[\s$%*,]+')
+# what is left of a parseable number once noise chars are removed
+_NUMBER_RE = r'^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$'
+
 
 def pandas_settings(precision=8, max_width=120, max_rows=25):
     """Pandas settings handler.
@@ -96,6 +109,104 @@ def data2num(s):
         return s
 
 
+def _text2num(values):
+    """Vectorized "data2num" conversion of a text (object) column to a float64 array ("?" values become 0).
+
+    Cleaning runs on Arrow compute kernels (edge noise trimming and thousands separators removal) when pyarrow is
+    installed, otherwise (or for mixed str / number columns) by a single pandas regex replace.
+
+    :param pd.Series values: text column.
+    :return np.ndarray: float64 array (NaN for not parseable values).
+    """
+    if pc is not None:
+        try:
+            text = pa.array(values.to_numpy(), type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            text = pc.replace_substring(pc.ascii_trim(text, ' \t\r\n$%*'), ',', '')
+            numbers = pc.cast(pc.if_else(pc.match_substring_regex(text, _NUMBER_RE), text, None), pa.float64())
+            return pc.if_else(pc.equal(text, '?'), 0.0, numbers).to_numpy(zero_copy_only=False)
+
+    cleaned = values.str.replace(_NOISE_RE, '', regex=True)
+    numbers = pd.to_numeric(cleaned, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    numbers[(cleaned == '?').to_numpy(dtype=bool, na_value=False)] = 0.0
+    # str methods skip non str items (e.g. numbers on mixed columns)
+    mixed = (cleaned.isna() & values.notna()).to_numpy()
+    if mixed.any():
+        numbers[mixed] = pd.to_numeric(values[mixed], errors='coerce')
+    return numbers
+
+
+def clean_numeric(data, dtypes=None):
+    """Column wise (vectorized) "data2num" counterpart.
+
+    Every "dtypes" text column found in "data" is stripped from "$", "%", "*", "," and blank chars and then converted
+    to its numeric dtype ("?" values become 0 and not parseable ones NaN, or 0 for integer dtypes). Already numeric
+    columns are just cast.
+
+    >>> df = clean_numeric(pd.DataFrame({'usd': [' $1,234.5 ', '?', 'n/a'], '1h': [1, 2, 3]}), {'usd': 'float64'})
+    >>> df['usd'].tolist()[:2], df['usd'].isna().tolist()
+    ([1234.5, 0.0], [False, False, True])
+
+    :param pd.DataFrame data: DataFrame to be cleaned.
+    :param dict dtypes: column name to numeric dtype dict (default: static.FIELD_DTYPES).
+    :return pd.DataFrame: a new DataFrame with "dtypes" columns converted.
+    """
+    dtypes = st.FIELD_DTYPES if dtypes is None else dtypes
+    # converted columns are replaced (never modified in place) so a shallow copy is enough
+    data = data.copy(deep=False)
+
+    for col, dtype in dtypes.items():
+        if col not in data.columns:
+            continue
+        values = data[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            values = pd.Series(_text2num(values), index=values.index)
+        if pd.api.types.is_integer_dtype(dtype):
+            values = values.fillna(0).round()
+        data[col] = values.astype(dtype)
+
+    return data
+
+
+def quote_column(field, quote):
+    """Return "field" converted to "quote" currency column name ("usd" field columns are just named after quote).
+
+    >>> quote_column('usd', 'EUR'), quote_column('volume24h', 'BTC')
+    ('eur', 'volume24h_btc')
+
+    :param str field: USD denominated field name.
+    :param str quote: quote currency name.
+    :return str: converted column name.
+    """
+    return str(quote).lower() if field == 'usd' else f'{field}_{str(quote).lower()}'
+
+
+def convert_quotes(data, rates, fields=None):
+    """Add every USD "fields" column converted to every "rates" quote currency using a single broadcast division.
+
+    >>> convert_quotes(pd.DataFrame({'usd': [10.0], 'volume24h': [100]}), {'BTC': 5.0, 'EUR': 0.5}).iloc[0].tolist()
+    [10.0, 100.0, 2.0, 20.0, 20.0, 200.0]
+
+    :param pd.DataFrame data: USD denominated data.
+    :param dict rates: quote currency name to USD rate (quote price in USD) dict.
+    :param tp.List[str] fields: USD denominated fields to convert (default: static.QUOTE_FIELDS).
+    :return pd.DataFrame: "data" copy with added "quote_column(field, quote)" columns.
+    """
+    fields = [f for f in (st.QUOTE_FIELDS if fields is None else fields) if f in data.columns]
+    quotes = list(rates)
+    if not fields or not quotes:
+        return data.copy()
+
+    # (rows x fields x 1) / (1 x 1 x quotes) -> rows x fields x quotes
+    values = data[fields].to_numpy(dtype='float64', na_value=np.nan)[:, :, None]
+    converted = values / np.array([rates[q] for q in quotes], dtype='float64')[None, None, :]
+    names = [quote_column(f, q) for f in fields for q in quotes]
+    converted = pd.DataFrame(converted.reshape(len(data), -1), index=data.index, columns=names)
+    return pd.concat([data.drop(columns=names, errors='ignore'), converted], axis=1)
+
+
 # noinspection PySameParameterValue
 def epoch(to_str=False):
     """Return local datetime (unix epoch).
@@ -107,33 +218,74 @@ def epoch(to_str=False):
     return str(timestamp) if to_str else timestamp
 
 
-def get_url(url, retries=-1, wait_secs=15, verbose=True):
+def is_retryable(err):
+    """Return True if a request failed with "err" HTTP error may succeed on retry.
+
+    Client errors (but "too many requests" one) will not be fixed by retrying.
+
+    >>> is_retryable(HTTPError('http://x', 404, 'Not Found', None, None))
+    False
+    >>> is_retryable(HTTPError('http://x', 429, 'Too Many Requests', None, None))
+    True
+
+    :param Exception err: raised HTTP error.
+    :return bool: True if request should be retried.
+    """
+    return not (isinstance(err, HTTPError) and 400 <= err.code < 500 and err.code != 429)
+
+
+def get_url(url, retries=-1, wait_secs=15, verbose=True, transport=None, timeout=None, limiter=None):
     """Read URL content and return it as str type.
 
     :param str url: URL to retrieve as str.
     :param int retries: max retries, if retries value is negative there is no attempts limit (default -1)
-    :param int wait_secs: sleep time in secs between retries.
+    :param int wait_secs: sleep time in secs between retries (ignored when a "limiter" is supplied).
     :param bool verbose: if True all catches errors will be reported to stderr.
+    :param pcmc.transport.Transport transport: pooled transport used to fetch "url" (a new opener is used if None)
+    :param float timeout: socket timeout in secs (default: transport or opener one).
+    :param pcmc.ratelimit.RateLimiter limiter: rate limiter every attempt must be granted by (retries are delayed by
+                                               its exponential backoff honouring "Retry-After" headers).
     :return str: raw url content as str type. In case of error, an empty string will be returned.
     """
+    attempt = 0
 
     while retries > 0:
         try:
-            handler = build_opener()
-            request = Request(url, headers=st.HEADERS)
-            response = handler.open(request)
-            response = response.read()
+            if limiter is not None:
+                limiter.acquire(url)
+            if transport is not None:
+                response = transport.get(url, timeout=timeout)
+            else:
+                handler = build_opener()
+                request = Request(url, headers=st.HEADERS)
+                response = handler.open(request, timeout=timeout) if timeout else handler.open(request)
+                response = response.read()
             return response.decode('utf-8')
         except InvalidURL:
             print(f'{str(url)} is not a valid URL')
             return str()
         except (HTTPException, HTTPError) as err:
+            if not is_retryable(err):
+                if verbose:
+                    print(str(err), file=sys.stderr)
+                return str()
             if verbose:
                 print(str(err), file=sys.stderr)
                 print(' - Retrying', file=sys.stderr)
             retries -= 1
-            time.sleep(wait_secs)
+            if limiter is not None:
+                # next "acquire" call will wait for backoff delay
+                limiter.failed(url, attempt, err)
+            else:
+                time.sleep(wait_secs)
+            attempt += 1
         except KeyboardInterrupt:
             return str()
         except IOError as err:
-            return str(err)
+            # socket errors (refused connections, timeouts, ...) must never be mistaken for URL content
+            if verbose:
+                print(f'{str(url)}: {str(err)}', file=sys.stderr)
+            return str()
+
+    # retries exhausted
+    return str()
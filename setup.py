@@ -6,8 +6,6 @@ import pcmc
 classifiers = [
     'Development Status :: 5 - Production',
     'License :: OSI Approved :: MIT License',
-    'Programming Language :: Python :: 3.5',
-    'Programming Language :: Python :: 3.6',
     'Programming Language :: Python :: 3.7',
 ]
 
@@ -30,5 +28,7 @@ setup(
     author_email=pcmc.__email__,
     description=pcmc.__description__,
     keywords=pcmc.__keywords__,
-    install_requires=['tabulate', 'pandas', 'bs4', 'py-term', 'lxml'],
+    install_requires=['tabulate', 'pandas', 'py-term', 'lxml'],
+    extras_require={'store': ['pyarrow']},
+    python_requires='>=3.7',
     classifiers=classifiers)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Shared tests fixtures.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pytest
+
+from pcmc.bench import synthetic_pages
+from pcmc.core import CoinMarketCap
+
+
+@pytest.fixture
+def replayed(monkeypatch):
+    """Return a CoinMarketCap replaying synthetic pages (configured cache, transport and limiter are restored)."""
+    for attr in ['_cache', '_transport', '_limiter', '_quotes', '_all_currencies']:
+        monkeypatch.setattr(CoinMarketCap, attr, getattr(CoinMarketCap, attr))
+    monkeypatch.setattr(CoinMarketCap, '_history', dict())
+    CoinMarketCap.replay(synthetic_pages())
+    yield CoinMarketCap
+    CoinMarketCap.reset()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Asyncio client tests (replayed pages, no network).
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import asyncio
+import time
+
+import pandas as pd
+
+import pcmc.static as st
+from pcmc.aio import AsyncCoinMarketCap
+from pcmc.bench import synthetic_pages
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 30))
+
+
+def test_async_client_matches_blocking_one(replayed):
+    async def main():
+        async with AsyncCoinMarketCap(verbose=False) as cmc:
+            return await asyncio.gather(cmc.get_exchanges(True), cmc.get_exchange_currencies('binance'),
+                                        cmc.gainers('1h'))
+
+    exchanges, currencies, gainers = run(main())
+    assert exchanges == replayed.get_exchanges(True) == ['binance', 'kraken', 'hitbtc']
+    assert currencies == replayed.get_exchange_currencies('binance')
+    assert gainers.equals(replayed.get_gainers_losers_snapshot().get('gainers', '1h'))
+
+
+def test_async_downloads_are_coalesced(replayed, monkeypatch):
+    transport = replayed._transport
+    calls = list()
+
+    def get(url, timeout=None):
+        calls.append(url)
+        time.sleep(0.05)
+        return type(transport).get(transport, url, timeout=timeout)
+
+    monkeypatch.setattr(transport, 'get', get)
+
+    async def main():
+        async with AsyncCoinMarketCap(verbose=False) as cmc:
+            return await asyncio.gather(*[cmc.get_exchange_symbols('kraken') for _ in range(5)])
+
+    results = run(main())
+    assert all(r == results[0] for r in results) and results[0]
+    assert calls == [st.URL_EXCHANGES.format('kraken')]
+
+
+def test_async_currency_exchanges_with_duplicated_symbol(replayed):
+    page = ('<table><thead><tr><th>#</th><th>Source</th><th>Pair</th></tr></thead><tbody>'
+            '<tr><td>1</td><td>Kraken</td><td>DUP/BTC</td></tr><tr><td>2</td><td>Binance</td><td>DUP/BTC</td></tr>'
+            '</tbody></table>')
+    replayed.replay(dict(synthetic_pages(), **{st.URL_CURRENCIES.format('coin-0'): [page]}))
+    # symbols are not unique on "all currencies" page, first listed currency wins (as on blocking client)
+    symbols = pd.Index(['DUP', 'DUP'], name='symbol')
+    replayed._all_currencies = pd.DataFrame({'name': ['COIN-0', 'COIN-X']}, index=symbols)
+
+    async def main():
+        async with AsyncCoinMarketCap(verbose=False) as cmc:
+            return await cmc.get_currency_exchanges('dup')
+
+    assert run(main()) == ['Binance', 'Kraken'] == replayed.get_currency_exchanges('DUP')
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""Offline benchmarks tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+from pcmc import bench
+
+
+def test_benchmarks_parse_pages_on_every_run(replayed):
+    report = bench.run(repeat=2, only=['get_exchange_symbols', '_scrapper (unchanged)'])
+
+    # one exchange page parse per synthetic exchange, not a cached result lookup
+    assert report.loc['get_exchange_symbols', 'parses'] == 3
+    assert report.loc['get_exchange_symbols', 'secs'] > 0
+    assert report.loc['_scrapper (unchanged)', 'parses'] == 0
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""Cache, calls coalescing and parsed results cache tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pcmc.static as st
+from pcmc.bench import synthetic_pages
+from pcmc.cache import SingleFlight, fingerprint
+from pcmc.snapshot import ParsedCache
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+    calls = list()
+
+    def download(url):
+        calls.append(url)
+        started.set()
+        release.wait(5)
+        return f'<{url}>'
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flight.do, 'a', download, 'a')
+        started.wait(5)
+        waiters = [pool.submit(flight.do, 'a', download, 'a') for _ in range(3)]
+        # waiters are coalesced (counted) before leader call finishes
+        deadline = time.monotonic() + 5
+        while flight.coalesced < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        results = [f.result(5) for f in [leader] + waiters]
+
+    assert results == ['<a>'] * 4 and calls == ['a']
+    assert flight.stats == {'calls': 1, 'coalesced': 3, 'stale': 0}
+    # finished calls are forgotten, so next one runs again
+    assert flight.do('a', download, 'a') == '<a>' and flight.stats['calls'] == 2
+
+
+def test_single_flight_serves_stale_and_shares_errors():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise IOError('unreachable')
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, 'a', failing)
+        started.wait(5)
+        # a caller holding a stale copy does not wait for in flight call
+        assert flight.do('a', failing, stale='old') == 'old'
+        waiter = pool.submit(flight.do, 'a', failing)
+        deadline = time.monotonic() + 5
+        while flight.coalesced < 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for future in [leader, waiter]:
+            with pytest.raises(IOError):
+                future.result(5)
+
+    assert flight.stats == {'calls': 1, 'coalesced': 1, 'stale': 1}
+
+
+def test_concurrent_fetches_share_a_download(replayed, monkeypatch):
+    transport = replayed._transport
+    calls = list()
+
+    def get(url, timeout=None):
+        calls.append(url)
+        time.sleep(0.05)
+        return type(transport).get(transport, url, timeout=timeout)
+
+    monkeypatch.setattr(transport, 'get', get)
+    monkeypatch.setattr(replayed, '_flight', SingleFlight())
+    url = st.URL_EXCHANGES.format('binance')
+
+    with ThreadPoolExecutor(8) as pool:
+        pages = list(pool.map(lambda _: replayed._fetch_url(url), range(8)))
+
+    assert calls == [url]
+    assert all(p is pages[0] for p in pages) and pages[0]
+    assert replayed._flight.stats['calls'] == 1
+
+
+def test_parsed_cache_skips_same_fingerprint():
+    cache, parsed = ParsedCache(), list()
+
+    def parser(raw, digest):
+        parsed.append(raw)
+        return len(parsed)
+
+    table = '<table><tr><td>1</td></tr></table>'
+    first = cache.get(f'<p>ad 1</p>{table}', parser, digest=fingerprint(f'<p>ad 1</p>{table}'))
+    again = cache.get(f'<p>ad 2</p>{table}', parser, digest=fingerprint(f'<p>ad 2</p>{table}'))
+    changed = cache.get('<table><tr><td>2</td></tr></table>', parser,
+                        digest=fingerprint('<table><tr><td>2</td></tr></table>'))
+
+    assert first == again == 1 and changed == 2
+    assert cache.stats == {'parses': 2, 'hits': 1}
+
+
+def test_unchanged_refetched_page_is_not_parsed_again(replayed, monkeypatch):
+    url = st.URL_EXCHANGES.format('binance')
+    page, other = synthetic_pages()[url][0], synthetic_pages(seed=1)[url][0]
+    pages = dict(synthetic_pages(), **{url: [page, page.replace('<body>', '<body><p>ad 2</p>'), other]})
+    replayed.replay(pages)
+    # every call refetches the page
+    monkeypatch.setattr(replayed._cache, 'ttl_for', lambda url: -1.0)
+    parses, unchanged = replayed._markets.parses, replayed._cache.unchanged
+
+    first = replayed.get_exchange_markets('binance')
+    again = replayed.get_exchange_markets('binance')
+    assert again is first
+    assert replayed._markets.parses == parses + 1 and replayed._cache.unchanged == unchanged + 1
+
+    assert replayed.get_exchange_markets('binance') is not first
+    assert replayed._markets.parses == parses + 2 and replayed._transport.requests == 3
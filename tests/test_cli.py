@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Command line interface tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import contextlib
+import io
+from argparse import Namespace
+
+import pytest
+
+import pcmc.static as st
+from pcmc import cli
+from pcmc.bench import synthetic_pages
+from pcmc.core import CoinMarketCap
+
+
+@pytest.fixture
+def cmc(monkeypatch):
+    for attr in ['_cache', '_transport', '_limiter', '_store']:
+        monkeypatch.setattr(CoinMarketCap, attr, getattr(CoinMarketCap, attr))
+    CoinMarketCap._snapshots.clear()
+    return CoinMarketCap
+
+
+def _args(**kwargs):
+    params = dict(timeframe='1h', filter_by=True, exchanges=['binance'], loop=0, minvol=0.0, diff=False, store=None,
+                  record=None, replay=synthetic_pages(), profile=False, metrics=None, metrics_format='json',
+                  quotes=[], attach=None, screen=None)
+    return Namespace(**dict(params, **kwargs))
+
+
+def test_loop_interrupted_while_sleeping_flushes_store(cmc, monkeypatch, tmp_path):
+    def interrupt(secs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(cli.time, 'sleep', interrupt)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli.main(_args(loop=60, store=str(tmp_path)))
+
+    assert cmc._store is None
+    assert list(tmp_path.glob('*/*/L0-*.feather'))
+
+
+def test_diff_uses_rendered_frame(cmc, monkeypatch):
+    def get_diff(*args, **kwargs):
+        raise AssertionError('a second snapshot must not be fetched to diff rendered data')
+
+    monkeypatch.setattr(CoinMarketCap, 'get_diff', get_diff)
+    fetch, fetched = CoinMarketCap._fetch_url, list()
+    monkeypatch.setattr(CoinMarketCap, '_fetch_url', classmethod(lambda cls, url, *a, **kw: fetched.append(url) or
+                                                                 fetch(url, *a, **kw)))
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        cli.main(_args(diff=True))
+
+    assert 'Status' in out.getvalue() and 'Δ Usd' in out.getvalue()
+    assert fetched.count(st.URL_GAINERS_LOSERS) == 1
+
+
+def test_unavailable_exchanges_list_skips_validation(cmc):
+    pages = synthetic_pages()
+    del pages[st.URL_EXCHANGES.format('')]
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        cli.main(_args(replay=pages, exchanges=['binance']))
+
+    assert '=' * 38 in out.getvalue()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Daemon mode (snapshots board) tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import contextlib
+import io
+import json
+from argparse import Namespace
+
+import pytest
+
+import pcmc.static as st
+from pcmc import cli
+from pcmc.bench import synthetic_pages
+from pcmc.core import CoinMarketCap
+from pcmc.daemon import Daemon, SnapshotBoard, read_exchange_currencies, read_exchanges
+
+
+@pytest.fixture
+def published(replayed, monkeypatch, tmp_path):
+    """Return a board where a daemon published every snapshot from replayed pages."""
+    monkeypatch.setattr(CoinMarketCap, '_store', None)
+    daemon = Daemon(tmp_path, quotes=['EUR'], exchanges=['binance', 'unknown'])
+    daemon.refresh_gainers_losers()
+    daemon.refresh_all()
+    daemon.refresh_exchanges()
+    return daemon.board
+
+
+def test_daemon_publishes_snapshots(published, replayed):
+    board = SnapshotBoard(published.path)
+    assert board.names() == sorted(['all', 'exchanges', 'markets', 'rates'] +
+                                   [f'{k}_{tf}' for k in ['gainers', 'losers'] for tf in st.TIMEFRAMES])
+
+    shared = board.read('gainers_1h')
+    assert shared.frame().index.name == 'symbol' and 'eur' in shared.frame().columns
+    assert shared.digest == replayed.get_gainers_losers_snapshot().digest
+    assert shared.meta['period'] == st.DAEMON_PERIODS['gainers_losers'] and not shared.stale
+
+    assert read_exchanges(board) == ['binance', 'kraken', 'hitbtc']
+    results, failures = read_exchange_currencies(board, ['binance', 'kraken', 'unknown'])
+    # "kraken" is not tracked by daemon so it is neither a result nor a failure
+    assert list(results) == ['binance'] and results['binance'] == replayed.get_exchange_currencies('binance')
+    assert list(failures) == ['unknown'] and isinstance(failures['unknown'], IOError)
+
+
+def test_attach_mode_reads_board_only(published, monkeypatch, tmp_path):
+    fetch, fetched = CoinMarketCap._fetch_url, list()
+    monkeypatch.setattr(CoinMarketCap, '_fetch_url', classmethod(lambda cls, url, *a, **kw: fetched.append(url) or
+                                                                 fetch(url, *a, **kw)))
+    metrics = tmp_path.joinpath('metrics.jsonl')
+    # viewer replays no gainers nor exchange pages, everything must come from board
+    args = Namespace(timeframe='1h', filter_by=True, exchanges=['binance'], loop=0, minvol=0.0, diff=False,
+                     store=None, record=None, replay={st.URL_ALL: synthetic_pages()[st.URL_ALL]}, profile=False,
+                     metrics=str(metrics), metrics_format='json', quotes=[], attach=str(published.path), screen=None)
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        cli.main(args)
+
+    assert fetched == []
+    assert 'Snapshot age' in out.getvalue() and 'CG' in out.getvalue()
+    snapshot = json.loads(metrics.read_text().splitlines()[-1])
+    assert 'render' in snapshot['spans']
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Exchanges currencies tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pytest
+
+import pcmc.static as st
+from pcmc.bench import synthetic_pages
+
+
+def test_unreachable_exchange_is_a_failure(replayed):
+    with pytest.raises(IOError):
+        replayed.get_exchange_markets('unknown')
+
+    results, failures = replayed.get_exchange_currencies_many(['binance', 'unknown'])
+    assert list(results) == ['binance'] and results['binance']
+    assert list(failures) == ['unknown']
+
+    index = replayed.get_exchange_index(['binance', 'unknown'])
+    assert index.exchanges == ['binance'] and list(index.failures) == ['unknown']
+
+
+def test_exchange_pages_are_fetched_once_with_timeout(replayed, monkeypatch):
+    fetch, calls = replayed._fetch_url, list()
+    monkeypatch.setattr(replayed, '_fetch_url', classmethod(lambda cls, url, *args, **kwargs: calls.append(
+        (url, kwargs.get('timeout'))) or fetch(url, *args, **kwargs)))
+
+    results, failures = replayed.get_exchange_currencies_many(['binance', 'kraken'], timeout=3)
+
+    assert sorted(results) == ['binance', 'kraken'] and not failures
+    assert sorted(calls) == [(st.URL_EXCHANGES.format(ex), 3) for ex in ['binance', 'kraken']]
+
+
+def test_exchanges_list_is_empty_when_offline(replayed, monkeypatch):
+    replayed.replay({})
+
+    assert replayed.get_exchanges(True) == []
+
+
+def currency_page(*sources):
+    rows = ''.join(f'<tr><td>{n}</td><td>{ex}</td><td>{pair}</td></tr>' for n, (ex, pair) in enumerate(sources))
+    return f'<table><thead><tr><th>#</th><th>Source</th><th>Pair</th></tr></thead><tbody>{rows}</tbody></table>'
+
+
+def test_currencies_exchanges_resume_and_failures(replayed, monkeypatch):
+    pages = synthetic_pages()
+    pages[st.URL_CURRENCIES.format('coin-0')] = [currency_page(('Binance', 'CL0/BTC'), ('Kraken', 'CL0/USD'))]
+    pages[st.URL_CURRENCIES.format('coin-1')] = [currency_page(('Kraken', 'CG0/ETH'))]
+    replayed.replay(pages)
+    transport = replayed._transport
+    calls, progress = list(), list()
+
+    def get(url, timeout=None):
+        calls.append(url)
+        return type(transport).get(transport, url, timeout=timeout)
+
+    monkeypatch.setattr(transport, 'get', get)
+    done, failures = replayed.get_currencies_exchanges(['cl0'], processes=0)
+    assert done.values.tolist() == [['CL0', 'Binance', 'CL0/BTC'], ['CL0', 'Kraken', 'CL0/USD']] and not failures
+
+    calls.clear()
+    replayed._cache.clear()
+    data, failures = replayed.get_currencies_exchanges(['CL0', 'CG0', 'CL1', 'NOPE'], processes=0, done=done,
+                                                      progress=lambda *args: progress.append(args))
+
+    # already retrieved currencies are not requested again
+    assert st.URL_CURRENCIES.format('coin-0') not in calls
+    assert sorted(map(tuple, data.values.tolist())) == [('CG0', 'Kraken', 'CG0/ETH'), ('CL0', 'Binance', 'CL0/BTC'),
+                                                         ('CL0', 'Kraken', 'CL0/USD')]
+    # unknown symbols and unavailable pages are reported instead of raised
+    assert sorted(failures) == ['CL1', 'NOPE'] and isinstance(failures['NOPE'], KeyError)
+    assert sorted(p[2] for p in progress) == ['CG0', 'CL1', 'NOPE']
+    assert [p[:2] for p in progress] == [(1, 3), (2, 3), (3, 3)]
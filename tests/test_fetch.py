@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Page fetching tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pytest
+
+import pcmc.static as st
+from pcmc.cache import Cache
+from pcmc.core import CoinMarketCap
+
+
+class FailingTransport:
+    """Transport whose every request fails with "error"."""
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        raise self.error
+
+
+@pytest.fixture
+def cmc(monkeypatch, tmp_path):
+    monkeypatch.setattr(CoinMarketCap, '_cache', Cache(path=tmp_path))
+    monkeypatch.setattr(CoinMarketCap, '_limiter', None)
+    return CoinMarketCap
+
+
+@pytest.mark.parametrize('error', [ConnectionRefusedError(111, 'Connection refused'), TimeoutError('timed out')])
+def test_failed_fetch_is_not_cached(cmc, monkeypatch, error):
+    transport = FailingTransport(error)
+    monkeypatch.setattr(cmc, '_transport', transport)
+    url = st.URL_EXCHANGES.format('binance')
+
+    assert cmc._fetch_url(url, retries=1) == ''
+    assert cmc._cache.get(url) is None
+    assert cmc._cache.disk.get(url) is None
+
+    # next call tries again instead of serving a cached error
+    cmc._fetch_url(url, retries=1)
+    assert transport.calls == 2
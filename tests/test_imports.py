@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Import time regression tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pytest
+
+import pcmc
+from pcmc.bench import import_time
+
+HEAVY = ['pandas', 'numpy', 'lxml', 'term', 'pyarrow']
+
+
+@pytest.mark.parametrize('statement', ['import pcmc', 'import pcmc.cli', 'import pcmc; pcmc.__long_description__'])
+def test_light_imports_skip_heavy_modules(statement):
+    times = import_time(statement)
+
+    assert 'pcmc' in times
+    assert not [m for m in times if m.split('.')[0] in HEAVY]
+    # loading pandas alone takes several hundred ms
+    assert max(t for m, t in times.items() if m.startswith('pcmc')) < 0.2
+
+
+def test_long_description_is_readme():
+    assert pcmc.__long_description__ == pcmc.PATH_ROOT.joinpath('README.md').read_text(encoding='utf-8')
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Numeric cleaning tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import timeit
+
+import pandas as pd
+import pytest
+
+import pcmc.static as st
+import pcmc.utils as utils
+from pcmc.bench import numeric_table
+from pcmc.utils import clean_numeric, data2num
+
+
+def _expected(table):
+    expected = table.apply(lambda col: col.map(data2num))
+    # data2num leaves not parseable values untouched, clean_numeric makes them NaN
+    return expected.apply(lambda col: pd.to_numeric(col, errors='coerce'))
+
+
+@pytest.mark.parametrize('arrow', [True, False], ids=['arrow', 'regex'])
+def test_clean_numeric_matches_data2num(monkeypatch, arrow):
+    if not arrow:
+        monkeypatch.setattr(utils, 'pc', None)
+    table = numeric_table(2000)
+    dtypes = {f: 'float64' for f in st.FIELD_DTYPES}
+
+    result = clean_numeric(table, dtypes)
+
+    pd.testing.assert_frame_equal(result, _expected(table).astype('float64'))
+    assert table.dtypes.eq(object).all()
+
+
+def test_clean_numeric_keeps_numeric_and_mixed_columns():
+    data = pd.DataFrame({'usd': [1.5, 2.5], '1h': ['$3', 4.0]})
+
+    result = clean_numeric(data, {'usd': 'float64', '1h': 'float64'})
+
+    assert result['usd'].tolist() == [1.5, 2.5] and result['1h'].tolist() == [3.0, 4.0]
+    assert data['1h'].tolist() == ['$3', 4.0]
+
+
+def test_clean_numeric_beats_data2num():
+    """10k rows micro-benchmark: column wise cleaning must not be slower than per cell "data2num" mapping."""
+    table = numeric_table()
+    vectorized = min(timeit.repeat(lambda: clean_numeric(table), number=3, repeat=5))
+    per_cell = min(timeit.repeat(lambda: table.apply(lambda col: col.map(data2num)), number=3, repeat=5))
+    assert vectorized < per_cell
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Quote currencies rates tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import math
+
+import pandas as pd
+
+import pcmc.static as st
+from pcmc.core import CoinMarketCap
+from pcmc.utils import convert_quotes
+
+RAW = '<div class="rates" data-usd="1" data-btc="6500.0" data-eur="0.5"></div>'
+
+
+def test_unknown_quote_rates_are_nan():
+    rates = CoinMarketCap._parse_prices(RAW, ['btc', 'XYZ'])
+
+    assert rates['BTC'] == 6500.0
+    assert math.isnan(rates['XYZ'])
+    assert math.isnan(CoinMarketCap._parse_price(RAW, 'XYZ'))
+
+
+def test_unknown_quote_converted_values_are_missing():
+    rates = CoinMarketCap._parse_prices(RAW, ['EUR', 'XYZ'])
+
+    data = convert_quotes(pd.DataFrame({'usd': [10.0], 'volume24h': [100]}), rates)
+
+    assert data.loc[0, 'eur'] == 20.0
+    # USD values must never be shown as if they were quoted in an unknown currency
+    assert data[['xyz', 'volume24h_xyz']].isna().all(axis=None)
+
+
+def test_unknown_quotes_do_not_defeat_parsed_cache(replayed):
+    replayed.set_quotes(['EUR', 'XYZ'])
+    raw = replayed._fetch_url(st.URL_ALL)
+    parses = replayed._all_pages.parses
+
+    first = replayed._parse_all_page(raw, replayed.get_prices(replayed._quotes))
+    again = replayed._parse_all_page(raw, replayed.get_prices(replayed._quotes))
+
+    assert again is first and replayed._all_pages.parses == parses + 1
+    assert first['xyz'].isna().all() and first['eur'].notna().all()
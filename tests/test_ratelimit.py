@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Rate limiter tests (fake clock, no real sleeps).
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import threading
+import time
+from urllib.request import HTTPError
+
+import pytest
+
+from pcmc.ratelimit import RateLimiter, TokenBucket
+from pcmc.utils import get_url
+
+URL = 'https://coinmarketcap.com/exchanges/binance/'
+
+
+class FakeClock:
+    """Monotonic clock only moved forward by "sleep" calls (or by hand)."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+        self.sleeps = list()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, secs):
+        with self._lock:
+            self.sleeps.append(secs)
+            self.now += secs
+
+
+class Stub429:
+    """Transport answering "429 Too Many Requests" (with a "Retry-After" header) before serving "body"."""
+
+    def __init__(self, body, failures=1, retry_after='7'):
+        self.body = body
+        self.failures = failures
+        self.retry_after = retry_after
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            headers = {} if self.retry_after is None else {'Retry-After': self.retry_after}
+            raise HTTPError(url, 429, 'Too Many Requests', headers, None)
+        return self.body
+
+
+def test_token_bucket_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+    bucket.consume()
+    bucket.consume()
+    assert bucket.wait_time() == pytest.approx(0.5)
+
+    clock.now += 0.25
+    assert bucket.wait_time() == pytest.approx(0.25)
+
+    clock.now += 10.0
+    assert bucket.wait_time() == 0
+    assert bucket.tokens == pytest.approx(2.0)
+
+
+def test_burst_then_throttled():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=4, burst=2, hosts={}, clock=clock, sleep=clock.sleep)
+    for _ in range(4):
+        limiter.acquire(URL)
+
+    assert clock.sleeps == [pytest.approx(0.25)] * 2
+    assert limiter.stats == {'granted': 4, 'throttled': 2}
+
+
+def test_priority_ordering():
+    clock = FakeClock()
+    gate = threading.Event()
+
+    def sleep(secs):
+        # every waiter sleeps until all of them are queued
+        gate.wait(5)
+        clock.sleep(secs)
+
+    limiter = RateLimiter(rate=1, burst=1, hosts={}, clock=clock, sleep=sleep)
+    limiter.acquire(URL)
+    order = list()
+
+    def request(name, priority):
+        limiter.acquire(URL, priority=priority)
+        order.append(name)
+
+    threads = list()
+    for name, priority in [('bulk', 9), ('detail', 5), ('hot', 1)]:
+        threads.append(threading.Thread(target=request, args=(name, priority)))
+        threads[-1].start()
+        # queue waiters one by one so arrival order differs from priority order
+        deadline = time.monotonic() + 5
+        while len(limiter._queues['coinmarketcap.com']) < len(threads) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    gate.set()
+    for t in threads:
+        t.join(5)
+
+    assert order == ['hot', 'detail', 'bulk']
+
+
+def test_retry_after_blocks_host():
+    clock = FakeClock()
+    limiter = RateLimiter(hosts={}, clock=clock, sleep=clock.sleep)
+    error = HTTPError(URL, 429, 'Too Many Requests', {'Retry-After': '7'}, None)
+
+    assert limiter.failed(URL, 0, error) == 7.0
+    assert limiter.bucket(URL).blocked_until == clock.now + 7.0
+
+    limiter.acquire(URL)
+    assert sum(clock.sleeps) == pytest.approx(7.0)
+
+
+def test_backoff_without_retry_after():
+    clock = FakeClock()
+    limiter = RateLimiter(hosts={}, backoff_base=1.0, backoff_cap=5.0, clock=clock, sleep=clock.sleep,
+                          rand=lambda: 0.5)
+    error = HTTPError(URL, 429, 'Too Many Requests', {}, None)
+
+    assert limiter.failed(URL, 1, error) == 1.0
+    # capped exponential delay
+    assert limiter.failed(URL, 6, error) == 2.5
+
+
+def test_get_url_waits_for_retry_after():
+    clock = FakeClock()
+    limiter = RateLimiter(hosts={}, clock=clock, sleep=clock.sleep)
+    transport = Stub429(b'<html/>', failures=2)
+
+    assert get_url(URL, retries=3, verbose=False, transport=transport, limiter=limiter) == '<html/>'
+    assert transport.calls == 3
+    assert sum(clock.sleeps) == pytest.approx(14.0)
+
+
+def test_get_url_retries_exhausted():
+    clock = FakeClock()
+    limiter = RateLimiter(hosts={}, clock=clock, sleep=clock.sleep, rand=lambda: 1.0)
+    transport = Stub429(b'<html/>', failures=5, retry_after=None)
+
+    assert get_url(URL, retries=2, verbose=False, transport=transport, limiter=limiter) == ''
+    assert transport.calls == 2
+    # first retry waited the (jitter free) backoff delay
+    assert clock.sleeps == [pytest.approx(1.0)]
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""Terminal rendering tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import io
+import os
+
+import pytest
+
+import pcmc.render as render
+from pcmc.render import Screen
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setattr(render.shutil, 'get_terminal_size', lambda: os.terminal_size((80, 6)))
+    return Screen(io.StringIO(), inplace=True)
+
+
+def test_tall_frames_redraw_only_visible_changed_lines(screen):
+    frame = [f'row {n}' for n in range(20)] + ['footer 1']
+    assert screen.draw(frame) == 5
+
+    # rows out of the visible window (and unchanged visible ones) are not written again
+    frame[10], frame[-1] = 'row 10 changed', 'footer 2'
+    assert screen.draw(frame) == 1
+    frame[1] = 'row 1 changed'
+    assert screen.draw(frame) == 1
+    assert screen._lines == ['row 0', 'row 1 changed', 'row 2', 'row 3', 'footer 2']
+
+
+def test_tall_frames_are_redrawn_in_place(screen):
+    screen.draw([f'row {n}' for n in range(20)])
+    screen.stream.seek(0), screen.stream.truncate()
+
+    screen.draw([f'row {n}' for n in range(20)])
+
+    # cursor moves back to frame first line instead of appending a new frame
+    assert screen.stream.getvalue().startswith('\x1b[5F')
+    assert 'row' not in screen.stream.getvalue()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Record / replay tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import asyncio
+from urllib.error import HTTPError
+
+import pcmc.static as st
+from pcmc.aio import AsyncCoinMarketCap
+from pcmc.cache import Cache
+from pcmc.core import CoinMarketCap
+
+
+def test_replay_leaves_configured_cache_alone(monkeypatch, tmp_path):
+    shared = Cache(path=tmp_path)
+    shared.set(st.URL_ALL, '<table><tr><td>live</td></tr></table>')
+    for attr in ['_cache', '_transport', '_limiter']:
+        monkeypatch.setattr(CoinMarketCap, attr, getattr(CoinMarketCap, attr))
+    monkeypatch.setattr(CoinMarketCap, '_cache', shared)
+
+    CoinMarketCap.replay({st.URL_EXCHANGES.format('binance'): ['<table><tr><td>recorded</td></tr></table>']})
+    assert 'recorded' in CoinMarketCap._fetch_url(st.URL_EXCHANGES.format('binance'))
+
+    assert CoinMarketCap._cache is not shared
+    assert 'live' in shared.disk.get(st.URL_ALL)['data']
+    assert shared.disk.get(st.URL_EXCHANGES.format('binance')) is None
+
+
+def test_async_client_errors_are_not_retried(monkeypatch):
+    class NotFound:
+        calls = 0
+
+        def get(self, url, timeout=None):
+            self.calls += 1
+            raise HTTPError(url, 404, 'Not Found', None, None)
+
+    transport = NotFound()
+    monkeypatch.setattr(CoinMarketCap, '_cache', Cache())
+    monkeypatch.setattr(CoinMarketCap, '_transport', transport)
+    monkeypatch.setattr(CoinMarketCap, '_limiter', None)
+
+    async def fetch():
+        async with AsyncCoinMarketCap(retries=3, wait_secs=60, verbose=False) as cmc:
+            return await cmc._fetch_url(st.URL_EXCHANGES.format('nope'))
+
+    assert asyncio.run(asyncio.wait_for(fetch(), 5)) == ''
+    assert transport.calls == 1
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Compact schema tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pcmc.core as core
+import pcmc.schema as schema
+import pcmc.static as st
+from pcmc.bench import synthetic_pages
+from pcmc.core import CoinMarketCap
+
+PAGES = synthetic_pages()
+RATES = {'BTC': 6500.12}
+
+
+def _assert_same_values(compacted, loose):
+    """Assert compact typed data holds same values as loosely typed one (float32 fields up to their precision)."""
+    assert compacted.index.astype(object).equals(loose.index.astype(object))
+    assert list(compacted.columns) == [c for c in st.SCHEMA if c in loose.columns] + \
+        [c for c in loose.columns if c not in st.SCHEMA]
+    for col in loose.columns:
+        new, old = compacted[col], loose[col]
+        if pd.api.types.is_numeric_dtype(old):
+            rtol = 1e-6 if schema.dtype_for(col) == 'float32' else 0
+            np.testing.assert_allclose(new.to_numpy(dtype='float64', na_value=np.nan),
+                                       old.to_numpy(dtype='float64', na_value=np.nan), rtol=rtol, err_msg=col)
+        else:
+            assert new.astype(object).tolist() == old.astype(object).tolist(), col
+
+
+@pytest.fixture(params=['string[pyarrow]', 'object'], ids=['arrow', 'no-pyarrow'])
+def text_dtype(request, monkeypatch):
+    monkeypatch.setattr(schema, 'TEXT_DTYPE', request.param)
+    return request.param
+
+
+
+
+def test_compact_all_keeps_values(monkeypatch, text_dtype):
+    parse = lambda: CoinMarketCap._parse_all(PAGES[st.URL_ALL][0], RATES)
+    compacted = parse()
+    with monkeypatch.context() as patch:
+        patch.setattr(core, 'compact', lambda data: data)
+        loose = parse()
+
+    _assert_same_values(compacted, loose)
+    assert compacted['name'].dtype == pd.api.types.pandas_dtype(text_dtype)
+    assert compacted.index.dtype == pd.api.types.pandas_dtype(text_dtype)
+
+
+def test_compact_gainers_losers_keeps_values(monkeypatch, text_dtype):
+    tables = pd.read_html(io.StringIO(PAGES[st.URL_GAINERS_LOSERS][0]), match=r'.+')
+    parse = lambda: [CoinMarketCap._data_handler(tbl, RATES) for tbl in tables]
+    compacted = parse()
+    with monkeypatch.context() as patch:
+        patch.setattr(core, 'compact', lambda data: data)
+        loose = parse()
+
+    for new, old in zip(compacted, loose):
+        _assert_same_values(new, old)
+        assert new['symbol'].dtype == pd.api.types.pandas_dtype(text_dtype)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Currencies screening tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import random
+import re
+from argparse import Namespace
+
+import pytest
+
+from pcmc.bench import _all_page
+from pcmc.core import CoinMarketCap
+from pcmc.screen import Screener
+
+
+def _page_lacking_volume(rows, missing):
+    """Return a synthetic "all currencies" page whose "missing" row (0 based) has no 24h volume."""
+    parts = _all_page(rows, random.Random(0)).split('<tr id=')
+    parts[missing + 1] = re.sub(r'<td data-sort="\d+"><a class="volume"[^<]*</a></td>', '<td></td>',
+                                parts[missing + 1])
+    return '<tr id='.join(parts)
+
+
+def test_rank_is_page_position_before_dropping_rows():
+    data = CoinMarketCap._parse_all(_page_lacking_volume(4, 1), {'BTC': 6500.0})
+
+    assert data['rank'].tolist() == [1, 3, 4]
+    assert Screener.parse(['rank>=3']).apply(data)['rank'].tolist() == [3, 4]
+    assert Screener.parse(['rank<=2']).apply(data)['rank'].tolist() == [1]
+
+
+@pytest.mark.parametrize('spec', ['bogus>=1', 'by=-bogus'])
+def test_unknown_fields_are_rejected_when_parsing(spec):
+    with pytest.raises(ValueError, match='unknown screen field'):
+        Screener.parse([spec, 'top=5'], ['volume24h', '24h'])
+    # fields are only checked when known ones are supplied
+    assert Screener.parse([spec]) is not None
+
+
+def test_cli_reports_unknown_screen_fields(monkeypatch):
+    from pcmc import cli
+
+    with pytest.raises(SystemExit, match='unknown screen field: bogus>=1'):
+        cli.main(Namespace(timeframe='1h', filter_by=True, exchanges=['binance'], loop=0, minvol=0.0, diff=False,
+                           store=None, record=None, replay=None, profile=False, metrics=None,
+                           metrics_format='json', quotes=['EUR'], attach=None, screen=['volume24h_eur>=1', 'bogus>=1']))
+
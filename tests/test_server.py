@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Local HTTP API tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import pytest
+
+import pcmc.static as st
+from pcmc.bench import synthetic_pages
+from pcmc.core import CoinMarketCap
+from pcmc.server import Api
+
+PAGES = {url: bodies[0] for url, bodies in synthetic_pages().items()}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    for attr in ['_cache', '_quotes', '_fetch_url']:
+        monkeypatch.setattr(CoinMarketCap, attr, getattr(CoinMarketCap, attr))
+    pages = dict(PAGES)
+    monkeypatch.setattr(CoinMarketCap, '_fetch_url', classmethod(lambda cls, url, *args, **kwargs: pages.get(url, '')))
+    api = Api()
+    api.pages = pages
+    return api
+
+
+def test_exchanges_index_is_keyed_by_pages_content(api):
+    index, key = api._index(['binance', 'kraken'])
+
+    # same content (even as new str objects) reuses index
+    api.pages[st.URL_EXCHANGES.format('kraken')] = ''.join(list(PAGES[st.URL_EXCHANGES.format('kraken')]))
+    assert api._index(['binance', 'kraken']) == (index, key)
+
+    kraken = PAGES[st.URL_EXCHANGES.format('kraken')]
+    api.pages[st.URL_EXCHANGES.format('kraken')] = kraken.replace('</tbody>', '<tr><td>0</td><td>NEWC</td>'
+                                                                             '<td>NEWC/BTC</td></tr></tbody>')
+    changed, changed_key = api._index(['binance', 'kraken'])
+    assert changed is not index and changed_key != key
+    assert changed.isin(['NEWC'], ['kraken']).tolist() == [True]
+
+
+def test_exchanges_index_reports_unavailable_pages(api):
+    index, key = api._index(['binance', 'unknown'])
+
+    assert list(index.failures) == ['unknown']
+    assert key[-1] == 'unknown'
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Time series store tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import os
+import subprocess
+import sys
+
+import pcmc.static as st
+
+WRITE = '''
+import pandas as pd
+from pcmc.core import CoinMarketCap
+
+CoinMarketCap._record('all', pd.DataFrame({'usd': [1.5, 2.5]}, index=pd.Index(['BTC', 'ETH'], name='symbol')))
+'''
+
+READ = '''
+from pcmc.store import TimeSeriesStore
+
+print(','.join(TimeSeriesStore(r'{path}').query('all')['symbol']))
+'''
+
+
+def _python(code, **env):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                          env=dict(os.environ, **env)).stdout.strip()
+
+
+def test_environment_store_buffered_rows_are_flushed_at_exit(tmp_path):
+    # much less rows than "flush_rows", so they are only buffered until interpreter exits
+    _python(WRITE, **{st.STORE_ENV: str(tmp_path)})
+
+    assert list(tmp_path.glob('all/*/L0-*.feather'))
+    assert _python(READ.format(path=tmp_path)) == 'BTC,ETH'
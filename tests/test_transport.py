@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""HTTP transport tests.
+
+ - Author:      Daniel J. Umpierrez
+ - Created:     17-10-2026
+ - GitHub:      https://github.com/havocesp/pcmc
+"""
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import pcmc.transport as transport
+from pcmc.transport import Transport
+
+
+class FakeSocket:
+    def __init__(self):
+        self.timeout = None
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+
+class FakeResponse:
+    status, reason, headers, will_close = 200, 'OK', {}, False
+
+    def read(self):
+        return b'body'
+
+    def getheader(self, name):
+        return None
+
+
+class FakeConnection:
+    errors = list()
+    opened = list()
+
+    def __init__(self, netloc, timeout=None):
+        self.netloc, self.timeout, self.sock, self.closed = netloc, timeout, FakeSocket(), False
+        self.opened.append(self)
+
+    def request(self, method, path, headers=None):
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def getresponse(self):
+        return FakeResponse()
+
+    def close(self):
+        self.closed = True
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Local site stand-in: gzip compressed pages with an ETag honouring "If-None-Match" requests."""
+    protocol_version = 'HTTP/1.1'
+    body = b'<html>' + b'coins ' * 1000 + b'</html>'
+    etag = '"v1"'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address, self.path, dict(self.headers)))
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        data = gzip.compress(self.body)
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    server.requests = list()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def conns(monkeypatch):
+    monkeypatch.setattr(transport, 'HTTPConnection', FakeConnection)
+    FakeConnection.errors, FakeConnection.opened = list(), list()
+    return FakeConnection
+
+
+def test_pooled_connections_get_request_timeout(conns):
+    client = Transport(timeout=30)
+    assert client.get('http://example.com/a') == b'body'
+    assert client.get('http://example.com/b', timeout=2) == b'body'
+
+    conn, = conns.opened
+    assert conn.timeout == 2 and conn.sock.timeout == 2
+
+
+@pytest.mark.parametrize('error', [TimeoutError('timed out'), OSError('network unreachable')])
+def test_failed_connections_are_closed_and_dropped(conns, error):
+    client = Transport()
+    client.get('http://example.com/a')
+    conns.errors.extend([error, error])
+
+    with pytest.raises(OSError):
+        client.get('http://example.com/a')
+
+    assert all(conn.closed for conn in conns.opened)
+    assert not client._pool[('http', 'example.com')]
+    # timeouts are not retried, other errors are retried once on a fresh connection
+    assert len(conns.opened) == (1 if isinstance(error, TimeoutError) else 2)
+
+
+def test_local_site_conditional_gzip_keep_alive(site):
+    client = Transport(timeout=5)
+    url = f'http://127.0.0.1:{site.server_port}/exchanges/'
+    try:
+        assert client.get(url) == SiteHandler.body
+        assert client.get(url) == SiteHandler.body
+        assert client.get(url + '?page=2') == SiteHandler.body
+    finally:
+        client.close()
+
+    (first, _, headers), (second, _, conditional), (third, path, _) = site.requests
+    assert 'gzip' in headers['Accept-Encoding'] and 'If-None-Match' not in headers
+    # second request is answered by a "304 Not Modified" one (body comes from validators cache)
+    assert conditional['If-None-Match'] == SiteHandler.etag
+    # every request was sent over the same keep-alive connection
+    assert first == second == third and path == '/exchanges/?page=2'